@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+#
+# benchmark_toolchain.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+This script measures the performance of parts of the toolchain, mostly by comparing an optimised code path against a reference implementation. The correctness of the optimisations is checked by the tests in the ``tests`` directory; this script only reports timings.
+
+Usage::
+
+    python extras/benchmark_toolchain.py [BENCHMARK ...]
+
+Without arguments, all benchmarks are run.
+"""
+
+import argparse
+import contextlib
+import gc
+import glob
+import os
+import tempfile
+import time
+import tracemalloc
+
+from antlr4 import CommonTokenStream, FileStream
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.transformers.synapse_post_neuron_transformer import SynapsePostNeuronTransformer
+from pynestml.utils.ast_index import ASTIndex
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+MODELS_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+
+
+def min_time(func, before=None, repeat=5):
+    r"""Returns the shortest time taken by ``func()`` over ``repeat`` runs; ``before()`` is called before each run, and is not timed"""
+    timing = float("inf")
+    for _ in range(repeat):
+        if before is not None:
+            before()
+
+        start_time = time.perf_counter()
+        func()
+        timing = min(timing, time.perf_counter() - start_time)
+
+    return timing
+
+
+def parse_models():
+    r"""Returns the ASTs of all models in the ``models`` directory"""
+    fnames = sorted(glob.glob(os.path.join(MODELS_PATH, "**", "*.nestml"), recursive=True))
+    return [ModelParser.parse_file(fname) for fname in fnames]
+
+
+def parse_model_source(model_source):
+    r"""Returns the AST of the first model in ``model_source``"""
+    with tempfile.TemporaryDirectory() as tmp_path:
+        fname = os.path.join(tmp_path, "model.nestml")
+        with open(fname, "w") as f:
+            f.write(model_source)
+
+        return ModelParser.parse_file(fname).get_model_list()[0]
+
+
+def get_nodes(ast):
+    nodes = []
+    ast.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+    return nodes
+
+
+class IsinstanceDispatchVisitor(ASTVisitor):
+    r"""Reference visitor that selects handlers through a chain of ``isinstance()`` checks, one per node class"""
+
+    @classmethod
+    def get_suffix(cls, node):
+        for ast_class, suffix in ASTVisitor._dispatch_order:
+            if isinstance(node, ast_class):
+                return suffix
+
+        return None
+
+    def visit(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "visit_" + suffix)(node)
+
+    def traverse(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "traverse_" + suffix)(node)
+
+    def endvisit(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "endvisit_" + suffix)(node)
+
+
+class VariableNameCollector(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.names = []
+
+    def visit_variable(self, node):
+        self.names.append(node.get_name())
+
+
+def benchmark_visitor_dispatch():
+    r"""Compare full-model traversals with table-driven dispatch against the same traversals with a chain of ``isinstance()`` checks"""
+    model = ModelParser.parse_file(os.path.join(MODELS_PATH, "neurons", "aeif_cond_exp_neuron.nestml"))
+    visitors = {"table": VariableNameCollector(), "isinstance": type("IsinstanceVariableNameCollector", (IsinstanceDispatchVisitor, VariableNameCollector), {})()}
+    timings = {name: min_time(lambda: model.accept(visitor)) for name, visitor in visitors.items()}
+
+    print("Full-model traversal: table-driven dispatch " + str(timings["table"]) + " s, isinstance() dispatch " + str(timings["isinstance"]) + " s, speedup " + str(timings["isinstance"] / timings["table"]) + "x")
+
+
+def benchmark_logger_has_errors():
+    r"""Compare checking for errors through the indexes of the log with scanning the whole log, for a log with many messages"""
+    source_position = ASTSourceLocation.get_predefined_source_position()
+    model = ASTNodeFactory.create_ast_model("model", ASTNodeFactory.create_ast_model_body([], source_position), source_position, "model.nestml")
+
+    def scan_has_errors():
+        return any(log_level == LoggingLevel.ERROR and artifact_name == model.get_name() for (artifact_name, _, log_level, _, _, _) in Logger.get_log().values())
+
+    Logger.init_logger(LoggingLevel.NO)
+    Logger.set_current_node(model)
+    for i in range(20000):
+        Logger.log_message(None, None, "message " + str(i), None, LoggingLevel.INFO)
+
+    timings = {name: min_time(has_errors) for name, has_errors in {"indexed": lambda: Logger.has_errors(model.get_name()), "scan": scan_has_errors}.items()}
+    Logger.set_current_node(None)
+    Logger.init_logger(LoggingLevel.ERROR)
+
+    print("has_errors() on a log of 20000 messages: indexed " + str(timings["indexed"]) + " s, scan " + str(timings["scan"]) + " s")
+
+
+def benchmark_unit_arithmetic():
+    r"""Compare evaluating unit expressions, such as those occurring in the ODEs of a conductance-based neuron, with memoised results against computing each result with astropy"""
+    mV = PredefinedTypes.get_type("mV")
+    ms = PredefinedTypes.get_type("ms")
+    nS = PredefinedTypes.get_type("nS")
+    pA = PredefinedTypes.get_type("pA")
+    pF = PredefinedTypes.get_type("pF")
+
+    def evaluate_unit_expressions():
+        return [mV / ms,
+                nS * mV / pF,
+                pA / nS,
+                pA / pF * ms,
+                mV ** 2 / ms,
+                ms ** -1,
+                (mV / ms) / (mV / ms),
+                UnitTypeSymbol.get_conversion_factor(mV.astropy_unit, PredefinedTypes.get_type("V").astropy_unit),
+                UnitTypeSymbol.get_conversion_factor((nS * mV).astropy_unit, pA.astropy_unit),
+                UnitTypeSymbol.get_conversion_factor(ms.astropy_unit, PredefinedTypes.get_type("s").astropy_unit)]
+
+    def clear_memo():
+        UnitTypeSymbol._operation_results.clear()
+        UnitTypeSymbol._conversion_factors.clear()
+
+    timings = {name: min_time(evaluate_unit_expressions, before=before) for name, before in {"astropy": clear_memo, "memoised": None}.items()}
+
+    print("Unit expressions: astropy " + str(timings["astropy"]) + " s, memoised " + str(timings["memoised"]) + " s, speedup " + str(timings["astropy"] / timings["memoised"]) + "x")
+
+
+def benchmark_lexer():
+    r"""Compare lexing a model with the cached DFA start states against the ANTLR runtime"""
+    fname = os.path.join(MODELS_PATH, "neurons", "iaf_psc_exp_neuron.nestml")
+
+    def lex(atn_simulator_class):
+        lexer = PyNestMLLexer(FileStream(fname, encoding="utf-8"))
+        if atn_simulator_class is not None:
+            # bypass the ``_interp`` setter, which replaces a plain ``LexerATNSimulator`` by the caching one
+            lexer._atn_simulator = atn_simulator_class(lexer, lexer.atn, lexer.decisionsToDFA, lexer._interp.sharedContextCache)
+
+        CommonTokenStream(lexer).fill()
+
+    # the lexers share their DFA, which is built during the first runs; taking the shortest time compares the lexers once the DFA has been built
+    timings = {name: min_time(lambda: lex(atn_simulator_class)) for name, atn_simulator_class in {"cached": None, "runtime": LexerATNSimulator}.items()}
+
+    print("Lexing " + fname + ": cached start states " + str(timings["cached"]) + " s, ANTLR runtime " + str(timings["runtime"]) + " s")
+
+
+def benchmark_ast_memory():
+    r"""Measure the memory used by, and the time needed for, cloning all models in the ``models`` directory"""
+    asts = parse_models()
+    n_nodes = sum(len(get_nodes(ast)) for ast in asts)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        clones = [ast.clone() for ast in asts]
+        clone_time = time.perf_counter() - start_time
+        gc.collect()
+        memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    print("Cloning " + str(len(clones)) + " files (" + str(n_nodes) + " nodes): " + str(memory) + " bytes (" + str(memory / n_nodes) + " bytes per node), " + str(clone_time) + " s")
+
+
+def benchmark_get_parent():
+    r"""Measure the time to walk up from every leaf node to the root of its model, with and without checking the parent links"""
+    leaf_nodes = [node for ast in parse_models() for node in get_nodes(ast) if node.get_children() == [] and node.get_parent() is not None]
+
+    def walk_up():
+        for node in leaf_nodes:
+            while node is not None:
+                node = node.get_parent()
+
+    check_parent_links_bak = ASTNode.check_parent_links
+    timings = {}
+    try:
+        for name, check in {"unchecked": False, "checked": True}.items():
+            ASTNode.check_parent_links = check
+            timings[name] = min_time(walk_up)
+    finally:
+        ASTNode.check_parent_links = check_parent_links_bak
+
+    print("Walking up from " + str(len(leaf_nodes)) + " leaf nodes: " + str(timings["unchecked"]) + " s, with checking of the parent links " + str(timings["checked"]) + " s")
+
+
+def benchmark_ast_index():
+    r"""Compare looking up the variables in each block of the largest model by traversing the tree against using the index"""
+    model = max([model for ast in parse_models() for model in ast.get_model_list()], key=lambda model: len(get_nodes(model)))
+    blocks = model.get_body().get_body_elements()
+
+    def look_up_variables(context):
+        with context():
+            for _ in range(10):
+                for block in blocks:
+                    ASTUtils.get_all(block, ASTVariable)
+                    ASTUtils.get_function_calls(block, [PredefinedFunctions.CONVOLVE])
+
+    timings = {name: min_time(lambda: look_up_variables(context)) for name, context in {"traversal": contextlib.nullcontext, "index": ASTIndex.enabled}.items()}
+
+    print("Looking up variables in the blocks of " + model.get_name() + " (" + str(len(get_nodes(model))) + " nodes): traversal " + str(timings["traversal"]) + " s, index " + str(timings["index"]) + " s")
+
+
+def benchmark_variable_lookup():
+    r"""Compare looking up each variable of a model with many variables by name by searching the blocks of the model against using the index"""
+    n_variables = 300
+    model = parse_model_source("model many_variables_neuron:\n"
+                               + "".join("    " + block + ":\n" + "".join("        " + prefix + str(i) + " real = " + str(i) + "\n" for i in range(n_variables))
+                                         for block, prefix in [("state", "x"), ("parameters", "p"), ("internals", "c")]))
+    names = [prefix + str(i) for prefix in ["x", "p", "c"] for i in range(n_variables)]
+
+    def look_up_variables(context):
+        with context():
+            for var_name in names:
+                ASTUtils.get_variable_by_name(model, var_name)
+
+    timings = {name: min_time(lambda: look_up_variables(context)) for name, context in {"search": contextlib.nullcontext, "index": ASTIndex.enabled}.items()}
+
+    print("Looking up " + str(len(names)) + " variables by name: searching the blocks " + str(timings["search"]) + " s, index " + str(timings["index"]) + " s")
+
+
+def benchmark_neuron_synapse_pairs():
+    r"""Measure the time to pair a neuron with each of several synapses"""
+    synapse_names = ["stdp_synapse", "stdp_nn_symm_synapse", "stdp_triplet_synapse"]
+    neuron = ModelParser.parse_file(os.path.join(MODELS_PATH, "neurons", "iaf_psc_exp_neuron.nestml")).get_model_list()[0]
+    synapses = [ModelParser.parse_file(os.path.join(MODELS_PATH, "synapses", synapse_name + ".nestml")).get_model_list()[0] for synapse_name in synapse_names]
+    transformer = SynapsePostNeuronTransformer({"neuron_synapse_pairs": [{"neuron": neuron.get_name(), "synapse": synapse_name, "post_ports": ["post_spikes"]} for synapse_name in synapse_names]})
+
+    def pair():
+        for synapse in synapses:
+            transformer.transform_neuron_synapse_pair_(neuron, synapse)
+
+    print("Pairing " + neuron.get_name() + " with " + str(len(synapses)) + " synapses: " + str(min_time(pair)) + " s")
+
+
+def benchmark_integrate_odes_calls_unique():
+    r"""Compare finding the unique ``integrate_odes()`` calls of a model with many duplicate calls by pairwise comparison against using the structural hashes"""
+    n_variables = 200
+    model = parse_model_source("model many_integrate_odes_calls_neuron:\n"
+                               + "    state:\n" + "".join("        x" + str(i) + " real = 0\n" for i in range(n_variables))
+                               + "    equations:\n" + "".join("        x" + str(i) + "' = -x" + str(i) + " / ms\n" for i in range(n_variables))
+                               + "    update:\n" + "".join("        integrate_odes(x" + str(i) + ", x" + str((i + 1) % n_variables) + ")\n" for i in range(n_variables)) * 2)
+
+    structural_hash = ASTNode.structural_hash
+    timings = {}
+    try:
+        for name in ["equals", "structural hash"]:
+            ASTNode.structural_hash = (lambda self: 0) if name == "equals" else structural_hash
+            timings[name] = min_time(lambda: ASTUtils.get_all_integrate_odes_calls_unique(model), before=ASTNode.tree_modified)
+    finally:
+        ASTNode.structural_hash = structural_hash
+
+    print("Finding the unique integrate_odes() calls among " + str(2 * n_variables) + " calls: pairwise comparison " + str(timings["equals"]) + " s, structural hash " + str(timings["structural hash"]) + " s")
+
+
+BENCHMARKS = {"visitor_dispatch": benchmark_visitor_dispatch,
+              "logger_has_errors": benchmark_logger_has_errors,
+              "unit_arithmetic": benchmark_unit_arithmetic,
+              "lexer": benchmark_lexer,
+              "ast_memory": benchmark_ast_memory,
+              "get_parent": benchmark_get_parent,
+              "ast_index": benchmark_ast_index,
+              "variable_lookup": benchmark_variable_lookup,
+              "neuron_synapse_pairs": benchmark_neuron_synapse_pairs,
+              "integrate_odes_calls_unique": benchmark_integrate_odes_calls_unique}
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description="Measure the performance of parts of the NESTML toolchain")
+    argument_parser.add_argument("benchmarks", metavar="BENCHMARK", nargs="*", help="Benchmarks to run: " + ", ".join(BENCHMARKS.keys()) + " (default: all)")
+    args = argument_parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS.keys():
+            argument_parser.error("unknown benchmark: " + name)
+
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    for name in args.benchmarks or BENCHMARKS.keys():
+        BENCHMARKS[name]()
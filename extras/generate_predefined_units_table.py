@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# generate_predefined_units_table.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+This script generates ``pynestml/symbols/predefined_units_table.py``, the table of astropy units that are registered as predefined units, for the installed astropy version.
+
+It should be run whenever the required astropy version in ``requirements.txt`` is changed. With other astropy versions than the one the table has been generated for, the units are found by searching astropy instead, which increases the startup time of the toolchain.
+"""
+
+import os
+
+import astropy
+from astropy import units as u
+
+from pynestml.symbols.predefined_units import PredefinedUnits
+
+
+def get_registered_units(unit_attributes):
+    name2unit = {}
+    for unit_attribute in unit_attributes:
+        unit = getattr(u, unit_attribute)
+        for unit_name in unit.names:
+            name2unit[str(unit_name)] = unit
+
+    return [(name, id(unit)) for name, unit in name2unit.items()]
+
+
+def get_table_unit_attributes():
+    r"""Each unit only needs to be listed once in the table, provided that this results in the same names being registered, in the same order, for the same units."""
+    unit_attributes = PredefinedUnits.find_astropy_unit_attributes()
+    table_unit_attributes = []
+    unit_ids = set()
+    for unit_attribute in unit_attributes:
+        unit = getattr(u, unit_attribute)
+        if id(unit) not in unit_ids:
+            table_unit_attributes.append(unit_attribute)
+            unit_ids.add(id(unit))
+
+    if get_registered_units(table_unit_attributes) != get_registered_units(unit_attributes):
+        return unit_attributes
+
+    return table_unit_attributes
+
+
+def generate_table(fname):
+    with open(os.path.join(os.path.dirname(__file__), "codeanalysis", "copyright_header_template.py")) as f:
+        header = f.read().replace("{{file_name}}", os.path.basename(fname))
+
+    unit_attributes = get_table_unit_attributes()
+    with open(fname, "w") as f:
+        f.write(header.rstrip() + "\n")
+        f.write("\n# This file has been generated by extras/generate_predefined_units_table.py. Do not edit it manually.\n\n")
+        f.write("ASTROPY_VERSION = \"" + astropy.__version__ + "\"\n\n")
+        f.write("# names of the units in astropy.units that are registered as predefined units\n")
+        f.write("UNIT_ATTRIBUTES = (\n")
+        for i in range(0, len(unit_attributes), 10):
+            f.write("    " + " ".join("\"" + unit_attribute + "\"," for unit_attribute in unit_attributes[i:i + 10]) + "\n")
+
+        f.write(")\n")
+
+
+if __name__ == "__main__":
+    generate_table(os.path.join(os.path.dirname(__file__), os.pardir, "pynestml", "symbols", "predefined_units_table.py"))
@@ -19,9 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List, Optional, Type
+
 from abc import ABCMeta, abstractmethod
 
 from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
 
 
 class CoCo:
@@ -31,9 +34,12 @@ class CoCo:
     Attributes:
         description type(str): This field can be used to give a short description regarding the properties which
                                 are checked by this coco.
+        dependencies type(list(CoCo)): CoCos that have to be checked completely before this CoCo, because checking them
+                                       can modify the AST in a way that this CoCo relies upon.
     """
     __metaclass__ = ABCMeta
     description = None
+    dependencies = []    # type: List[Type[CoCo]]
 
     @abstractmethod
     def check_co_co(self, node: ASTNode) -> bool:
@@ -43,3 +49,14 @@ class CoCo:
         :return: True, if CoCo holds, otherwise False.
         """
         return False
+
+    @classmethod
+    def get_visitor(cls, node: ASTNode) -> Optional[ASTVisitor]:
+        """
+        Returns a visitor that checks this coco in a traversal of the handed over node, or None if the coco is not
+        checked by a traversal. Visitors of several cocos can be run together in a single traversal (see
+        ``CoCosManager.check_co_cos()``).
+        :param node: a single neuron instance on which the coco will be checked.
+        :return: the visitor, or None
+        """
+        return None
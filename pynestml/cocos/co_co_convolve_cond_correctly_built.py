@@ -39,13 +39,22 @@ class CoCoConvolveCondCorrectlyBuilt(CoCo):
         inline I_syn_exc pA = convolve(exc_spikes, g_exc) * ( V_m - E_exc )
     """
 
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: the visitor
+        """
+        return ConvolveCheckerVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(ConvolveCheckerVisitor())
+        node.accept(cls.get_visitor(node))
 
 
 class ConvolveCheckerVisitor(ASTVisitor):
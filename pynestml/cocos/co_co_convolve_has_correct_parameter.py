@@ -40,14 +40,22 @@ class CoCoConvolveHasCorrectParameter(CoCo):
 
     """
 
+    @classmethod
+    def get_visitor(cls, model) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over model.
+        :param model: a single model instance.
+        :return: the visitor
+        """
+        return ConvolveParametersCorrectVisitor()
+
     @classmethod
     def check_co_co(cls, model):
         """
         Ensures the coco for the handed over model.
         :param model: a single model instance.
-=        """
-        visitor = ConvolveParametersCorrectVisitor()
-        model.accept(visitor)
+        """
+        model.accept(cls.get_visitor(model))
 
 
 class ConvolveParametersCorrectVisitor(ASTVisitor):
@@ -36,13 +36,22 @@ class CoCoCorrectNumeratorOfUnit(CoCo):
         V_m 2/mV = ...
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param model: a single neuron instance.
+        :return: the visitor
+        """
+        return NumericNumeratorVisitor()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param model: a single neuron instance.
         """
-        model.accept(NumericNumeratorVisitor())
+        model.accept(cls.get_visitor(model))
 
 
 class NumericNumeratorVisitor(ASTVisitor):
@@ -38,13 +38,22 @@ class CoCoCorrectOrderInEquation(CoCo):
             V_m = ...
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param model: a single neuron instance.
+        :return: the visitor
+        """
+        return OrderOfEquationVisitor()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param model: a single neuron instance.
         """
-        model.accept(OrderOfEquationVisitor())
+        model.accept(cls.get_visitor(model))
 
 
 class OrderOfEquationVisitor(ASTVisitor):
@@ -52,13 +52,22 @@ class CoCoEquationsOnlyForInitValues(CoCo):
 
     """
 
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: the visitor
+        """
+        return EquationsOnlyForInitValues()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(EquationsOnlyForInitValues())
+        node.accept(cls.get_visitor(node))
 
 
 class EquationsOnlyForInitValues(ASTVisitor):
@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
@@ -34,6 +35,18 @@ class CoCoFunctionArgumentTemplateTypesConsistent(CoCo):
     This coco checks that if template types are used for function parameters, the types are mutually consistent.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ASTModel
+        :return: the visitor
+        """
+        return CorrectTemplatedArgumentTypesVisitor()
+
     @classmethod
     def check_co_co(cls, neuron):
         """
@@ -41,7 +54,7 @@ class CoCoFunctionArgumentTemplateTypesConsistent(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ASTModel
         """
-        neuron.accept(CorrectTemplatedArgumentTypesVisitor())
+        neuron.accept(cls.get_visitor(neuron))
 
 
 class CorrectTemplatedArgumentTypesVisitor(ASTVisitor):
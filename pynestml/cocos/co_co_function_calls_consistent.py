@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.symbol import SymbolKind
@@ -37,6 +38,18 @@ class CoCoFunctionCallsConsistent(CoCo):
     This context condition checker ensures that for all function calls in the handed over neuron, if the called function has been declared, whether the number and types of arguments correspond to the declaration, etc.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTModel
+        :return: the visitor
+        """
+        return FunctionCallConsistencyVisitor()
+
     @classmethod
     def check_co_co(cls, node):
         """
@@ -44,7 +57,7 @@ class CoCoFunctionCallsConsistent(CoCo):
         :param node: a single neuron instance.
         :type node: ASTModel
         """
-        node.accept(FunctionCallConsistencyVisitor())
+        node.accept(cls.get_visitor(node))
 
 
 class FunctionCallConsistencyVisitor(ASTVisitor):
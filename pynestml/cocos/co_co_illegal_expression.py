@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -37,6 +38,18 @@ class CoCoIllegalExpression(CoCo):
     This coco checks that all expressions are correctly typed.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ASTModel
+        :return: the visitor
+        """
+        return CorrectExpressionVisitor()
+
     @classmethod
     def check_co_co(cls, neuron):
         """
@@ -44,7 +57,7 @@ class CoCoIllegalExpression(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ASTModel
         """
-        neuron.accept(CorrectExpressionVisitor())
+        neuron.accept(cls.get_visitor(neuron))
 
 
 class CorrectExpressionVisitor(ASTVisitor):
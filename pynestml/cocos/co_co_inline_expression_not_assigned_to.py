@@ -35,14 +35,23 @@ class CoCoInlineExpressionNotAssignedTo(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         """
-        Ensures the coco for the handed over neuron.
+        Returns the visitor that checks the coco for the handed over neuron.
         :param node: a single neuron instance.
+        :return: the visitor
         """
         visitor = NoInlineExpressionAssignedToVisitor()
         visitor.neuron_ = node
-        node.accept(visitor)
+        return visitor
+
+    @classmethod
+    def check_co_co(cls, node: ASTModel):
+        """
+        Ensures the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class NoInlineExpressionAssignedToVisitor(ASTVisitor):
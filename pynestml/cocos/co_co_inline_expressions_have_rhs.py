@@ -32,13 +32,22 @@ class CoCoInlineExpressionsHaveRhs(CoCo):
     This coco ensures that all inline expressions have a rhs.
     """
 
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: the visitor
+        """
+        return InlineRhsVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(InlineRhsVisitor())
+        node.accept(cls.get_visitor(node))
 
 
 class InlineRhsVisitor(ASTVisitor):
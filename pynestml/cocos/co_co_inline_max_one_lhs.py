@@ -36,13 +36,22 @@ class CoCoInlineMaxOneLhs(CoCo):
         inline V_reset, V_rest mV = V_m - 55mV
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param model: a single model instance.
+        :return: the visitor
+        """
+        return InlineMaxOneLhs()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param model: a single model instance.
         """
-        model.accept(InlineMaxOneLhs())
+        model.accept(cls.get_visitor(model))
 
 
 class InlineMaxOneLhs(ASTVisitor):
@@ -53,13 +53,22 @@ class CoCoInputPortNotAssignedTo(CoCo):
 
     """
 
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: the visitor
+        """
+        return NoInputPortAssignedToVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(NoInputPortAssignedToVisitor())
+        node.accept(cls.get_visitor(node))
 
 
 class NoInputPortAssignedToVisitor(ASTVisitor):
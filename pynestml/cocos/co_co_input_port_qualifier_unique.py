@@ -44,14 +44,23 @@ class CoCoInputPortQualifierUnique(CoCo):
 
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over model.
+        :param node: a single model instance.
+        :return: the visitor
+        """
+        cls.neuronName = model.get_name()
+        return InputPortQualifierUniqueVisitor()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over model.
         :param node: a single model instance.
         """
-        cls.neuronName = model.get_name()
-        model.accept(InputPortQualifierUniqueVisitor())
+        model.accept(cls.get_visitor(model))
 
 
 class InputPortQualifierUniqueVisitor(ASTVisitor):
@@ -32,20 +32,22 @@ class CoCoIntegrateOdesCalledIfEquationsDefined(CoCo):
     This coco ensures that integrate_odes() is called if one or more dynamical equations are defined.
     """
 
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single model instance.
+        :return: the visitor
+        """
+        return IntegrateOdesCalledIfEquationsDefinedVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single model instance.
         """
-        equations_defined_visitor = EquationsDefinedVisitor()
-        node.accept(equations_defined_visitor)
-        integrate_odes_called_visitor = IntegrateOdesCalledVisitor()
-        node.accept(integrate_odes_called_visitor)
-        if equations_defined_visitor.equations_defined() and not integrate_odes_called_visitor.integrate_odes_called():
-            code, message = Messages.get_equations_defined_but_integrate_odes_not_called()
-            Logger.log_message(code=code, message=message,
-                               error_position=node.get_source_position(), log_level=LoggingLevel.ERROR)
+        node.accept(cls.get_visitor(node))
 
 
 class EquationsDefinedVisitor(ASTVisitor):
@@ -75,3 +77,15 @@ class IntegrateOdesCalledVisitor(ASTVisitor):
 
     def integrate_odes_called(self) -> bool:
         return self._integrate_odes_called
+
+
+class IntegrateOdesCalledIfEquationsDefinedVisitor(EquationsDefinedVisitor, IntegrateOdesCalledVisitor):
+    """
+    This visitor checks if integrate_odes() is called if equations are defined, once the whole model has been visited.
+    """
+
+    def endvisit_model(self, node: ASTModel):
+        if self.equations_defined() and not self.integrate_odes_called():
+            code, message = Messages.get_equations_defined_but_integrate_odes_not_called()
+            Logger.log_message(code=code, message=message,
+                               error_position=node.get_source_position(), log_level=LoggingLevel.ERROR)
@@ -34,13 +34,22 @@ class CoCoIntegrateODEsParamsCorrect(CoCo):
     This coco ensures that ``integrate_odes()`` contains either no parameters or only state variable names as parameters.
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over model.
+        :param node: a single model instance.
+        :return: the visitor
+        """
+        return IntegrateODEsCheckerVisitor()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over model.
         :param node: a single model instance.
         """
-        model.accept(IntegrateODEsCheckerVisitor())
+        model.accept(cls.get_visitor(model))
 
 
 class IntegrateODEsCheckerVisitor(ASTVisitor):
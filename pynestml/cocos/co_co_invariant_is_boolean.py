@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -36,14 +37,24 @@ class CoCoInvariantIsBoolean(CoCo):
 
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over model.
+        :param model: a single model instance.
+        :return: the visitor
+        """
+        return InvariantTypeVisitor()
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over model.
         :param model: a single model instance.
         """
-        visitor = InvariantTypeVisitor()
-        model.accept(visitor)
+        model.accept(cls.get_visitor(model))
 
 
 class InvariantTypeVisitor(ASTVisitor):
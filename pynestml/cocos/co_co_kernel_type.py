@@ -22,6 +22,7 @@
 from typing import Optional
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.codegeneration.printers.cpp_type_symbol_printer import CppTypeSymbolPrinter
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.integer_type_symbol import IntegerTypeSymbol
@@ -38,15 +39,26 @@ class CoCoKernelType(CoCo):
     Ensures that all defined kernels are untyped (for direct functions of time), or have a type equivalent to 1/s**-order, where order is the differential order of the kernel (e.g. 2 for ``kernel g'' = ...``).
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         """
-        Ensures the coco for the handed over neuron.
+        Returns the visitor that checks the coco for the handed over neuron.
         :param node: a single neuron instance.
+        :return: the visitor
         """
         kernel_type_visitor = KernelTypeVisitor()
         kernel_type_visitor._neuron = node
-        node.accept(kernel_type_visitor)
+        return kernel_type_visitor
+
+    @classmethod
+    def check_co_co(cls, node: ASTModel):
+        """
+        Ensures the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class KernelTypeVisitor(ASTVisitor):
@@ -38,14 +38,23 @@ class CoCoNestRandomFunctionsLegallyUsed(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node: ASTNode):
+    def get_visitor(cls, node: ASTNode) -> ASTVisitor:
         """
-        Checks the coco.
+        Returns the visitor that checks the coco.
         :param node: a single node (typically, a neuron or synapse)
+        :return: the visitor
         """
         visitor = CoCoNestRandomFunctionsLegallyUsedVisitor()
         visitor.neuron = node
-        node.accept(visitor)
+        return visitor
+
+    @classmethod
+    def check_co_co(cls, node: ASTNode):
+        """
+        Checks the coco.
+        :param node: a single node (typically, a neuron or synapse)
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class CoCoNestRandomFunctionsLegallyUsedVisitor(ASTVisitor):
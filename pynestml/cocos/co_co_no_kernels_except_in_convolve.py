@@ -49,16 +49,31 @@ class CoCoNoKernelsExceptInConvolve(CoCo):
 
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over model.
+        :param model: a single model instance.
+        :return: the visitor
+        """
+        # kernels can only be defined in equations blocks, so they are collected without traversing the whole model
+        kernel_names = []
+        for equations_block in model.get_equations_blocks():
+            for kernel in equations_block.get_kernels():
+                kernel_names.extend([var.get_name_of_lhs() for var in kernel.get_variables()])
+
+        kernel_usage_visitor = KernelUsageVisitor(_kernels=kernel_names)
+        kernel_usage_visitor.set_neuron(model)
+
+        return kernel_usage_visitor
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Ensures the coco for the handed over model.
         :param node: a single model instance.
         """
-        kernel_collector_visitor = KernelCollectingVisitor()
-        kernel_names = kernel_collector_visitor.collect_kernels(model)
-        kernel_usage_visitor = KernelUsageVisitor(_kernels=kernel_names)
-        kernel_usage_visitor.work_on(model)
+        model.accept(cls.get_visitor(model))
 
 
 class KernelUsageVisitor(ASTVisitor):
@@ -74,8 +89,11 @@ class KernelUsageVisitor(ASTVisitor):
         self.__neuron_node = None
         return
 
-    def work_on(self, neuron):
+    def set_neuron(self, neuron):
         self.__neuron_node = neuron
+
+    def work_on(self, neuron):
+        self.set_neuron(neuron)
         neuron.accept(self)
         return
 
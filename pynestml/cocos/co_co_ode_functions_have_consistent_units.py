@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
@@ -31,13 +32,24 @@ class CoCoOdeFunctionsHaveConsistentUnits(CoCo):
     This coco ensures that whenever an ODE function is defined, the physical unit of the left-hand side variable matches that of the right-hand side expression.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: the visitor
+        """
+        return OdeFunctionConsistentUnitsVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
         """
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(OdeFunctionConsistentUnitsVisitor())
+        node.accept(cls.get_visitor(node))
 
 
 class OdeFunctionConsistentUnitsVisitor(ASTVisitor):
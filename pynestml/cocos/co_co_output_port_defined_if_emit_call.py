@@ -22,6 +22,7 @@
 from typing import Optional
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.predefined_functions import PredefinedFunctions
@@ -36,15 +37,26 @@ class CoCoOutputPortDefinedIfEmitCall(CoCo):
     This context condition checker ensures that if an event is emitted, a corresponding output port is defined with the appropriate type.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
     @classmethod
-    def check_co_co(cls, neuron: ASTModel):
+    def get_visitor(cls, neuron: ASTModel) -> ASTVisitor:
         """
-        Checks the coco for the handed over neuron.
+        Returns the visitor that checks the coco for the handed over neuron.
         :param neuron: a single neuron instance.
+        :return: the visitor
         """
         visitor = OutputPortDefinedIfEmitCalledVisitor()
         visitor.neuron = neuron
-        neuron.accept(visitor)
+        return visitor
+
+    @classmethod
+    def check_co_co(cls, neuron: ASTModel):
+        """
+        Checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        """
+        neuron.accept(cls.get_visitor(neuron))
 
 
 class OutputPortDefinedIfEmitCalledVisitor(ASTVisitor):
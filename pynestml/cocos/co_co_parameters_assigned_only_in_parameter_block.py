@@ -44,16 +44,25 @@ class CoCoParametersAssignedOnlyInParameterBlock(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
+    def get_visitor(cls, node) -> ASTVisitor:
         """
-        Ensures the coco for the handed over neuron.
+        Returns the visitor that checks the coco for the handed over neuron.
         :param node: a single neuron instance.
         :type node: ASTModel
+        :return: the visitor
         """
         assert (node is not None and (isinstance(node, ASTModel))), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type of neuron provided (%s)!' % type(node)
-        node.accept(ParametersAssignmentVisitor())
-        return
+        return ParametersAssignmentVisitor()
+
+    @classmethod
+    def check_co_co(cls, node):
+        """
+        Ensures the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTModel
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class ParametersAssignmentVisitor(ASTVisitor):
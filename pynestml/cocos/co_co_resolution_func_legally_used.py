@@ -35,14 +35,23 @@ class CoCoResolutionFuncLegallyUsed(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
+    def get_visitor(cls, node) -> ASTVisitor:
         """
-        Checks the coco.
+        Returns the visitor that checks the coco.
         :param node: a single node (typically, a neuron or synapse)
+        :return: the visitor
         """
         visitor = CoCoResolutionFuncLegallyUsedVisitor()
         visitor.neuron = node
-        node.accept(visitor)
+        return visitor
+
+    @classmethod
+    def check_co_co(cls, node):
+        """
+        Checks the coco.
+        :param node: a single node (typically, a neuron or synapse)
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class CoCoResolutionFuncLegallyUsedVisitor(ASTVisitor):
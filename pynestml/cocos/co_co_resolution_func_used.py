@@ -33,22 +33,32 @@ class CoCoResolutionOrStepsFuncUsed(CoCo):
     This Coco emits a warning in case the ``resolution()`` or ``steps()`` predefined function is used.
     """
 
+    @classmethod
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
+        """
+        Returns the visitor that checks the coco.
+        :param model: a single neuron
+        :return: the visitor
+        """
+        visitor = CoCoResolutionOrStepsFuncUsedVisitor()
+        visitor.neuron = model
+        return visitor
+
     @classmethod
     def check_co_co(cls, model: ASTModel):
         """
         Checks the coco.
         :param model: a single neuron
         """
-        class CoCoResolutionOrStepsFuncUsedVisitor(ASTVisitor):
-            def visit_simple_expression(self, node):
-                if node.get_function_call() is None:
-                    return
+        model.accept(cls.get_visitor(model))
 
-                function_name = node.get_function_call().get_name()
-                if function_name in [PredefinedFunctions.TIME_RESOLUTION, PredefinedFunctions.TIME_STEPS]:
-                    code, message = Messages.get_fixed_timestep_func_used()
-                    Logger.log_message(code=code, message=message, error_position=node.get_source_position(), log_level=LoggingLevel.WARNING)
 
-        visitor = CoCoResolutionOrStepsFuncUsedVisitor()
-        visitor.neuron = model
-        model.accept(visitor)
+class CoCoResolutionOrStepsFuncUsedVisitor(ASTVisitor):
+    def visit_simple_expression(self, node):
+        if node.get_function_call() is None:
+            return
+
+        function_name = node.get_function_call().get_name()
+        if function_name in [PredefinedFunctions.TIME_RESOLUTION, PredefinedFunctions.TIME_STEPS]:
+            code, message = Messages.get_fixed_timestep_func_used()
+            Logger.log_message(code=code, message=message, error_position=node.get_source_position(), log_level=LoggingLevel.WARNING)
@@ -24,6 +24,7 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.meta_model.ast_kernel import ASTKernel
 
@@ -34,11 +35,12 @@ class CoCoSimpleDeltaFunction(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, model: ASTModel):
+    def get_visitor(cls, model: ASTModel) -> ASTVisitor:
         """
-        Checks if this coco applies for the handed over neuron.
+        Returns the visitor that checks if this coco applies for the handed over neuron.
 
         :param model: a single model instance.
+        :return: the visitor
         """
 
         def check_simple_delta(_expr=None):
@@ -63,4 +65,13 @@ class CoCoSimpleDeltaFunction(CoCo):
         def func(x):
             return check_simple_delta(x) if isinstance(x, ASTSimpleExpression) else True
 
-        model.accept(ASTHigherOrderVisitor(func))
+        return ASTHigherOrderVisitor(func)
+
+    @classmethod
+    def check_co_co(cls, model: ASTModel):
+        """
+        Checks if this coco applies for the handed over neuron.
+
+        :param model: a single model instance.
+        """
+        model.accept(cls.get_visitor(model))
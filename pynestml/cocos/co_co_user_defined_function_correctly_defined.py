@@ -23,15 +23,17 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.meta_model.ast_small_stmt import ASTSmallStmt
 from pynestml.meta_model.ast_stmt import ASTStmt
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.utils.type_caster import TypeCaster
 
 
-class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
+class CoCoUserDefinedFunctionCorrectlyDefined(CoCo, metaclass=ContextScopedMeta):
     """
     This coco ensures that all user defined functions, which are defined with a type, have a return statement
     and the type of the return statement is consistent with the declaration.
@@ -44,6 +46,12 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
     Attributes:
         __processedFunction (ast_function): A reference to the currently processed function.
     """
+
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    # this attribute is stored in the active compilation context
+    _context_scoped_attributes = ["processed_function"]
+
     processed_function = None
 
     @classmethod
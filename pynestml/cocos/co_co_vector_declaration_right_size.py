@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_model import ASTModel
@@ -35,11 +36,17 @@ class CoCoVectorDeclarationRightSize(CoCo):
     This CoCo checks if the size of the vector during vector declaration is an integer and greater than 0, and that the index into a vector is of type integer and non-negative.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
     @classmethod
-    def check_co_co(cls, node: ASTModel):
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
         visitor = VectorDeclarationVisitor()
         visitor._neuron = node
-        node.accept(visitor)
+        return visitor
+
+    @classmethod
+    def check_co_co(cls, node: ASTModel):
+        node.accept(cls.get_visitor(node))
 
 
 class VectorDeclarationVisitor(ASTVisitor):
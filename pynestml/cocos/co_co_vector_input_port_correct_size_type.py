@@ -34,10 +34,13 @@ class CoCoVectorInputPortsCorrectSizeType(CoCo):
     """
     This CoCo checks if the size of the vector input port is of the type integer and its value is greater than 0.
     """
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return InputPortsVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
-        visitor = InputPortsVisitor()
-        node.accept(visitor)
+        node.accept(cls.get_visitor(node))
 
 
 class InputPortsVisitor(ASTVisitor):
@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_co_correct_numerator_of_unit import CoCoCorrectNumeratorOfUnit
 from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.integer_type_symbol import IntegerTypeSymbol
@@ -35,10 +36,15 @@ class CoCoVectorParameterDeclaredInRightBlock(CoCo):
     This CoCo ensures that the vector parameter is declared in either the parameters or internals block.
     """
 
+    dependencies = [CoCoCorrectNumeratorOfUnit]
+
+    @classmethod
+    def get_visitor(cls, node: ASTModel) -> ASTVisitor:
+        return VectorDeclarationVisitor()
+
     @classmethod
     def check_co_co(cls, node: ASTModel):
-        visitor = VectorDeclarationVisitor()
-        node.accept(visitor)
+        node.accept(cls.get_visitor(node))
 
 
 class VectorDeclarationVisitor(ASTVisitor):
@@ -35,16 +35,25 @@ class CoCoVectorVariableInNonVectorDeclaration(CoCo):
     """
 
     @classmethod
-    def check_co_co(cls, node):
+    def get_visitor(cls, node) -> ASTVisitor:
         """
-        Ensures the coco for the handed over node.
+        Returns the visitor that checks the coco for the handed over node.
         :param node: a single node instance.
         :type node: ASTModel
+        :return: the visitor
         """
         assert node is not None and (isinstance(node, ASTModel)), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type provided (%s): expecting neuron or synapse!' % type(node)
-        node.accept(VectorInDeclarationVisitor())
-        return
+        return VectorInDeclarationVisitor()
+
+    @classmethod
+    def check_co_co(cls, node):
+        """
+        Ensures the coco for the handed over node.
+        :param node: a single node instance.
+        :type node: ASTModel
+        """
+        node.accept(cls.get_visitor(node))
 
 
 class VectorInDeclarationVisitor(ASTVisitor):
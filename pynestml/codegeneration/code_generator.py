@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, List, Optional, Sequence
+from typing import Any, Dict, FrozenSet, Mapping, List, Optional, Sequence
 
 import glob
 import os
@@ -34,6 +34,7 @@ from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_model import ASTModel
+from pynestml.utils.ast_index import ASTIndex
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
@@ -46,6 +47,9 @@ class CodeGenerator(WithOptions):
 
     _default_options: Mapping[str, Any] = {}
 
+    # template environments are shared between code generator instances, so that each template is only compiled once per process
+    _template_envs: Dict[FrozenSet[str], Environment] = {}
+
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
         super(CodeGenerator, self).__init__(options)
 
@@ -111,7 +115,10 @@ class CodeGenerator(WithOptions):
         _template_dirs = set([os.path.dirname(_file) for _file in _template_files])
 
         # Environment for neuron templates
-        env = Environment(loader=FileSystemLoader(_template_dirs))
+        if not frozenset(_template_dirs) in CodeGenerator._template_envs.keys():
+            CodeGenerator._template_envs[frozenset(_template_dirs)] = Environment(loader=FileSystemLoader(_template_dirs))
+
+        env = CodeGenerator._template_envs[frozenset(_template_dirs)]
         env.globals["raise"] = self.raise_helper
         env.globals["is_delta_kernel"] = ASTUtils.is_delta_kernel
 
@@ -207,7 +214,10 @@ class CodeGenerator(WithOptions):
                 templ_file_base_name = templ_file_base_name + "." + file_extension
             rendered_templ_file_name = os.path.join(FrontendConfiguration.get_target_path(),
                                                     templ_file_base_name)
-            _file = _model_templ.render(template_namespace)
+            # the templates do not modify the models, so the ``ASTUtils`` helpers can answer queries from an index of each model
+            with ASTIndex.enabled():
+                _file = _model_templ.render(template_namespace)
+
             Logger.log_message(message="Rendering template " + rendered_templ_file_name,
                                log_level=LoggingLevel.INFO)
             with open(rendered_templ_file_name, "w+") as f:
@@ -21,7 +21,10 @@
 
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+import contextlib
 import datetime
+import multiprocessing
+import os
 import re
 
 import odetoolbox
@@ -34,6 +37,7 @@ from pynestml.codegeneration.code_generator_utils import CodeGeneratorUtils
 from pynestml.codegeneration.nest_assignments_helper import NestAssignmentsHelper
 from pynestml.codegeneration.nest_code_generator_utils import NESTCodeGeneratorUtils
 from pynestml.codegeneration.nest_declarations_helper import NestDeclarationsHelper
+from pynestml.codegeneration.parallel_code_generation import ParallelCodeGeneration
 from pynestml.codegeneration.printers.cpp_simple_expression_printer import CppSimpleExpressionPrinter
 from pynestml.codegeneration.printers.nest_cpp_type_symbol_printer import NESTCppTypeSymbolPrinter
 from pynestml.codegeneration.printers.constant_printer import ConstantPrinter
@@ -70,6 +74,7 @@ from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
 from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
 from pynestml.utils.string_utils import removesuffix
 from pynestml.visitors.ast_equations_with_delay_vars_visitor import ASTEquationsWithDelayVarsVisitor
@@ -120,6 +125,10 @@ class NESTCodeGenerator(CodeGenerator):
     - **weight_variable**: Like ``delay_variable``, but for synaptic weight.
     - **redirect_build_output**: An optional boolean key for redirecting the build output. Setting the key to ``True``, two files will be created for redirecting the ``stdout`` and the ``stderr`. The ``target_path`` will be used as the default location for creating the two files.
     - **build_output_dir**: An optional string key representing the new path where the files corresponding to the output of the build phase will be created. This key requires that the ``redirect_build_output`` is set to ``True``.
+    - **parallel_jobs**: Number of worker processes used to analyse models and generate their code in parallel. Neurons and synapses that are co-generated as a neuron-synapse pair are always processed by the same worker. Requires the ``fork`` process start method (not available on Windows). Default: 1 (no parallelism).
+    - **ode_toolbox_single_pass**: When a model requires both an analytic and a numeric solver, ODE-toolbox is invoked a second time to obtain a numeric solver for all state variables. If this option is True (default), the symbolic preprocessing of the equations is performed only once and shared between both invocations. The generated code is identical either way.
+    - **ode_toolbox_cache_path**: Path to a directory in which ODE-toolbox analysis results are cached across runs. Models whose equations, solver options and ODE-toolbox/sympy versions are unchanged skip the symbolic analysis entirely. The default is ``None``, which disables the cache.
+    - **ode_toolbox_cache_max_size**: Maximum total size (in bytes) of the ODE-toolbox cache directory. When exceeded, least recently used entries are evicted. Default: 256 MiB.
 
     """
 
@@ -150,7 +159,11 @@ class NESTCodeGenerator(CodeGenerator):
         "numeric_solver": "rk45",
         "continuous_state_buffering_method": "continuous_time_buffer",
         "delay_variable": {},
-        "weight_variable": {}
+        "weight_variable": {},
+        "parallel_jobs": 1,
+        "ode_toolbox_single_pass": True,
+        "ode_toolbox_cache_path": None,
+        "ode_toolbox_cache_max_size": 256 * 1024 * 1024
     }
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
@@ -170,6 +183,7 @@ class NESTCodeGenerator(CodeGenerator):
         self.analytic_solver = {}
         self.numeric_solver = {}
         self.non_equations_state_variables = {}  # those state variables not defined as an ODE in the equations block
+        self._ode_toolbox_cache = None
 
         self.setup_template_env()
         self.setup_printers()
@@ -274,6 +288,24 @@ class NESTCodeGenerator(CodeGenerator):
         neurons, synapses = CodeGeneratorUtils.get_model_types_from_names(models, neuron_models=self.get_option("neuron_models"), synapse_models=self.get_option("synapse_models"))
 
         self.run_nest_target_specific_cocos(neurons, synapses)
+
+        if self.get_option("parallel_jobs") > 1 and len(neurons) + len(synapses) > 1 and "fork" in multiprocessing.get_all_start_methods():
+            self.analyse_and_generate_models_parallel(neurons, synapses)
+        else:
+            self.analyse_and_generate_models(neurons, synapses)
+
+        self.generate_module_code(neurons, synapses)
+
+        for astnode in neurons + synapses:
+            if Logger.has_errors(astnode):
+                raise Exception("Error(s) occurred during code generation")
+
+    def analyse_and_generate_models(self, neurons: List[ASTModel], synapses: List[ASTModel]) -> None:
+        """
+        Analyse and transform the given neurons and synapses, and generate the code for each of them.
+        :param neurons: a list of neurons.
+        :param synapses: a list of synapses.
+        """
         self.analyse_transform_neurons(neurons)
         self.analyse_transform_synapses(synapses)
 
@@ -286,11 +318,17 @@ class NESTCodeGenerator(CodeGenerator):
 
         self.generate_neurons(neurons)
         self.generate_synapses(synapses)
-        self.generate_module_code(neurons, synapses)
 
-        for astnode in neurons + synapses:
-            if Logger.has_errors(astnode):
-                raise Exception("Error(s) occurred during code generation")
+    def analyse_and_generate_models_parallel(self, neurons: List[ASTModel], synapses: List[ASTModel]) -> None:
+        """
+        Like ``analyse_and_generate_models()``, but distributes the models over a pool of ``parallel_jobs`` worker processes.
+
+        Models that are co-generated (a neuron and synapse in a neuron-synapse pair) are always processed together in the same worker. The worker processes are forked from the current process, so that they inherit the parsed models, symbol tables and configuration. Log messages produced in the workers are merged back into the log of this process in a deterministic order (the order of the models), independent of the order in which the workers finish.
+        :param neurons: a list of neurons.
+        :param synapses: a list of synapses.
+        """
+        groups = ParallelCodeGeneration.get_co_generated_model_groups(neurons, synapses)
+        ParallelCodeGeneration.run(self, groups, n_jobs=self.get_option("parallel_jobs"))
 
     def _get_module_namespace(self, neurons: List[ASTModel], synapses: List[ASTModel]) -> Dict:
         """
@@ -892,44 +930,78 @@ class NESTCodeGenerator(CodeGenerator):
         odetoolbox_indict["options"] = {}
         odetoolbox_indict["options"]["output_timestep_symbol"] = "__h"
         disable_analytic_solver = self.get_option("solver") != "analytic"
-        solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                            disable_stiffness_check=True,
-                                            disable_analytic_solver=disable_analytic_solver,
-                                            preserve_expressions=self.get_option("preserve_expressions"),
-                                            simplify_expression=self.get_option("simplify_expression"),
-                                            log_level=FrontendConfiguration.logging_level)
-        analytic_solver = None
-        analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
-        assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
-        if len(analytic_solvers) > 0:
-            analytic_solver = analytic_solvers[0]
-
-        # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
-        numeric_solver = None
-        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-        if numeric_solvers:
-            if analytic_solver:
-                # previous solver_result contains both analytic and numeric solver; re-run ODE-toolbox generating only numeric solver
-                solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                                    disable_stiffness_check=True,
-                                                    disable_analytic_solver=True,
-                                                    preserve_expressions=self.get_option("preserve_expressions"),
-                                                    simplify_expression=self.get_option("simplify_expression"),
-                                                    log_level=FrontendConfiguration.logging_level)
+
+        if self.get_option("ode_toolbox_single_pass"):
+            shared_shapes_context = ODEToolboxUtils.shared_shapes()
+        else:
+            shared_shapes_context = contextlib.nullcontext()
+
+        with shared_shapes_context:
+            solver_result = self._run_ode_toolbox_analysis(odetoolbox_indict, disable_analytic_solver=disable_analytic_solver)
+            analytic_solver = None
+            analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
+            assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
+            if len(analytic_solvers) > 0:
+                analytic_solver = analytic_solvers[0]
+
+            # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
+            numeric_solver = None
             numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-            assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
-            if len(numeric_solvers) > 0:
-                numeric_solver = numeric_solvers[0]
+            if numeric_solvers:
+                if analytic_solver:
+                    # previous solver_result contains both analytic and numeric solver; re-run ODE-toolbox generating only numeric solver (the symbolic preprocessing is shared with the first run if ``ode_toolbox_single_pass`` is enabled)
+                    solver_result = self._run_ode_toolbox_analysis(odetoolbox_indict, disable_analytic_solver=True)
+                numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
+                assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
+                if len(numeric_solvers) > 0:
+                    numeric_solver = numeric_solvers[0]
 
         return analytic_solver, numeric_solver
 
+    def get_ode_toolbox_cache(self) -> Optional[ODEToolboxCache]:
+        r"""
+        Returns the persistent ODE-toolbox results cache, or None if caching is disabled (the ``ode_toolbox_cache_path`` option is not set).
+        """
+        cache_path = self.get_option("ode_toolbox_cache_path")
+        if not cache_path:
+            return None
+
+        if self._ode_toolbox_cache is None or self._ode_toolbox_cache.path != os.path.abspath(cache_path):
+            self._ode_toolbox_cache = ODEToolboxCache(cache_path, max_size=self.get_option("ode_toolbox_cache_max_size"))
+
+        self._ode_toolbox_cache.max_size = self.get_option("ode_toolbox_cache_max_size")
+
+        return self._ode_toolbox_cache
+
+    def _run_ode_toolbox_analysis(self, odetoolbox_indict: Dict[str, Any], disable_analytic_solver: bool) -> List[Dict[str, Any]]:
+        r"""
+        Invoke ``odetoolbox.analysis()``, consulting the persistent results cache first if it is enabled.
+        """
+        analysis_options = {"disable_stiffness_check": True,
+                            "disable_analytic_solver": disable_analytic_solver,
+                            "preserve_expressions": self.get_option("preserve_expressions"),
+                            "simplify_expression": self.get_option("simplify_expression")}
+
+        cache = self.get_ode_toolbox_cache()
+        if cache is not None:
+            key = cache.get_key(odetoolbox_indict, analysis_options)
+            solver_result = cache.get(key)
+            if solver_result is not None:
+                return solver_result
+
+        solver_result = odetoolbox.analysis(odetoolbox_indict,
+                                            log_level=FrontendConfiguration.logging_level,
+                                            **analysis_options)
+
+        if cache is not None:
+            cache.put(key, solver_result)
+
+        return solver_result
+
     def update_symbol_table(self, neuron) -> None:
         """
-        Update symbol table and scope.
+        Check the model after the AST has been rewritten. The symbol table is updated in-place by the AST transformations themselves, so that it does not have to be rebuilt.
         """
-        SymbolTable.delete_model_scope(neuron.get_name())
-        symbol_table_visitor = ASTSymbolTableVisitor()
-        neuron.accept(symbol_table_visitor)
         CoCosManager.check_cocos(neuron, after_ast_rewrite=True)
         SymbolTable.add_model_scope(neuron.get_name(), neuron.get_scope())
 
@@ -92,6 +92,7 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         - **model_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to the neuron model(s).
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the NEST module.
     - **nest_version**: A string identifying the version of NEST Simulator to generate code for. The string corresponds to the NEST Simulator git repository tag or git branch name, for instance, ``"v2.20.2"`` or ``"master"``. The default is the empty string, which causes the NEST version to be automatically identified from the ``nest`` Python module.
+    - **parallel_jobs**: Number of worker processes used to run ODE-toolbox on the equations of the channel, concentration, receptor and continuous input mechanisms. ODE-toolbox results are memoised during each call of ``generate_code()``, so that mechanisms with identical definitions are only analysed once, also across neurons. Default: 1 (no parallelism).
     """
 
     _default_options = {
@@ -111,7 +112,8 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
                     "cm_tree_@NEURON_NAME@.h.jinja2"]},
             "module_templates": ["setup"]},
         "nest_version": "",
-        "compartmental_variable_name": "v_comp"}
+        "compartmental_variable_name": "v_comp",
+        "parallel_jobs": 1}
 
     _variable_matching_template = r"(\b)({})(\b)"
     _model_templates = dict()
@@ -198,9 +200,10 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
         return ret
 
     def generate_code(self, models: List[ASTModel]) -> None:
-        self.analyse_transform_neurons(models)
-        self.generate_neurons(models)
-        self.generate_module_code(models)
+        with MechanismProcessing.code_generator_run(self.get_option("parallel_jobs")):
+            self.analyse_transform_neurons(models)
+            self.generate_neurons(models)
+            self.generate_module_code(models)
 
     def generate_module_code(self, neurons: List[ASTModel]) -> None:
         """t
@@ -739,11 +742,8 @@ class NESTCompartmentalCodeGenerator(CodeGenerator):
 
     def update_symbol_table(self, neuron, kernel_buffers):
         """
-        Update symbol table and scope.
+        Check the model after the AST has been rewritten. The symbol table is updated in-place by the AST transformations themselves, so that it does not have to be rebuilt.
         """
-        SymbolTable.delete_model_scope(neuron.get_name())
-        symbol_table_visitor = ASTSymbolTableVisitor()
-        neuron.accept(symbol_table_visitor)
         CoCosManager.check_cocos(neuron, after_ast_rewrite=True)
         SymbolTable.add_model_scope(neuron.get_name(), neuron.get_scope())
 
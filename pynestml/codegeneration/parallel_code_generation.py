@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# parallel_code_generation.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import concurrent.futures
+import contextlib
+import io
+import multiprocessing
+import sys
+
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.utils.logger import Logger
+
+
+class ParallelCodeGeneration:
+    r"""
+    Analyse models and generate their code in a pool of worker processes.
+
+    Workers are forked from the calling process, so that they inherit the parsed models, symbol tables, predefined types and frontend configuration without having to serialise them. Each worker processes one group of models, which consists of models that need to be co-processed (for instance, a neuron and synapse in a neuron-synapse pair). Only log messages and console output are transferred back to the calling process.
+    """
+
+    # state shared with the worker processes by forking
+    _code_generator = None
+    _groups: Optional[List[Tuple[List[ASTModel], List[ASTModel]]]] = None
+
+    @classmethod
+    def get_co_generated_model_groups(cls, neurons: Sequence[ASTModel], synapses: Sequence[ASTModel]) -> List[Tuple[List[ASTModel], List[ASTModel]]]:
+        r"""
+        Partition the models into groups that have to be processed together, by following the links between co-generated neurons and synapses.
+        :param neurons: a list of neurons
+        :param synapses: a list of synapses
+        :return: a list of (neurons, synapses) tuples, in the order in which the models first appear in the input
+        """
+        models = list(neurons) + list(synapses)
+
+        # links are followed in both directions
+        linked_models = {id(model): [] for model in models}
+        for model in models:
+            for attr in ["paired_neuron", "paired_synapse"]:
+                if attr in dir(model) and id(getattr(model, attr)) in linked_models:
+                    linked_models[id(model)].append(getattr(model, attr))
+                    linked_models[id(getattr(model, attr))].append(model)
+
+        visited = set()
+        groups = []
+        for model in models:
+            if id(model) in visited:
+                continue
+
+            component = set()
+            stack = [model]
+            while stack:
+                _model = stack.pop()
+                if id(_model) in component:
+                    continue
+
+                component.add(id(_model))
+                stack.extend(linked_models[id(_model)])
+
+            visited |= component
+            groups.append(([neuron for neuron in neurons if id(neuron) in component],
+                           [synapse for synapse in synapses if id(synapse) in component]))
+
+        return groups
+
+    @classmethod
+    def run(cls, code_generator, groups: List[Tuple[List[ASTModel], List[ASTModel]]], n_jobs: int) -> None:
+        r"""
+        Call ``code_generator.analyse_and_generate_models()`` for each group of models in a pool of worker processes, then merge the log messages and console output of each worker into the calling process, in the order of the groups.
+        :param code_generator: the code generator instance
+        :param groups: groups of models, as returned by ``get_co_generated_model_groups()``
+        :param n_jobs: maximum number of worker processes
+        """
+        cls._code_generator = code_generator
+        cls._groups = groups
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(n_jobs, len(groups)),
+                                                        mp_context=multiprocessing.get_context("fork")) as executor:
+                results = list(executor.map(cls._process_group, range(len(groups))))
+        finally:
+            cls._code_generator = None
+            cls._groups = None
+
+        exceptions = []
+        for (neurons, synapses), (stdout, log_entries, exception) in zip(groups, results):
+            sys.stdout.write(stdout)
+            models_by_name = {model.get_name(): model for model in neurons + synapses}
+            for node_name, code, message, error_position, log_level in log_entries:
+                Logger.log_message(models_by_name.get(node_name), code, message, error_position, log_level)
+
+            if exception is not None:
+                exceptions.append(exception)
+
+        if exceptions:
+            raise exceptions[0]
+
+    @classmethod
+    def _process_group(cls, group_idx: int) -> Tuple[str, List[Tuple[Optional[str], Any, str, Any, Any]], Optional[Exception]]:
+        r"""
+        Entry point for the worker processes. Returns the captured console output, the log messages that were produced while processing the group, and the exception that was raised, if any.
+        """
+        neurons, synapses = cls._groups[group_idx]
+
+        first_message = Logger.curr_message if Logger.curr_message is not None else 0
+        no_print = Logger.no_print
+        sinks = Logger.sinks
+        Logger.no_print = True    # messages are printed by the calling process when merging
+        Logger.sinks = []    # likewise, messages are only streamed to the sinks by the calling process, rather than also by the worker through the inherited sinks
+
+        stdout = io.StringIO()
+        exception = None
+        with contextlib.redirect_stdout(stdout):
+            try:
+                cls._code_generator.analyse_and_generate_models(neurons, synapses)
+            except Exception as e:
+                exception = e
+
+        Logger.no_print = no_print
+        Logger.sinks = sinks
+
+        log_entries = []
+        for message_idx in range(first_message, Logger.curr_message):
+            if not message_idx in Logger.log.keys():
+                continue
+
+            _, node, log_level, code, error_position, message = Logger.log[message_idx]
+            log_entries.append((node.get_name() if node is not None else None, code, str(message), error_position, log_level))
+
+        return stdout.getvalue(), log_entries, exception
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter
+from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter, print_deep_expressions_bottom_up
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
 from pynestml.meta_model.ast_expression import ASTExpression
@@ -37,6 +37,7 @@ class CppExpressionPrinter(ExpressionPrinter):
     Printer for ``ASTExpression`` nodes in C++ syntax.
     """
 
+    @print_deep_expressions_bottom_up
     def print(self, node: ASTNode) -> str:
         if isinstance(node, ASTExpression):
             if node.get_implicit_conversion_factor() and not node.get_implicit_conversion_factor() == 1:
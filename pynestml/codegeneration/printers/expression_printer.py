@@ -19,11 +19,74 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Tuple
+
 from abc import ABCMeta, abstractmethod
+import functools
 
 from pynestml.codegeneration.printers.ast_printer import ASTPrinter
 from pynestml.codegeneration.printers.simple_expression_printer import SimpleExpressionPrinter
+from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_expression_node import ASTExpressionNode
+from pynestml.meta_model.ast_node import ASTNode
+
+
+def print_deep_expressions_bottom_up(print_method: Callable[[ExpressionPrinter, ASTNode], str]) -> Callable[[ExpressionPrinter, ASTNode], str]:
+    r"""
+    Decorator for the methods of an expression printer that print an expression by calling themselves (indirectly) on its sub-expressions, such as ``print()`` and ``print_expression()``.
+
+    Printing an expression recursively in this way would exceed the maximum recursion depth of Python for very deep expressions, such as long automatically generated sums. Therefore, once the nesting depth of these calls exceeds ``ExpressionPrinter.max_recursion_depth``, all sub-expressions of the expression that is to be printed are printed first, from the bottom up, and stored, so that printing each of them, and finally the expression itself, does not recurse any further.
+    """
+    @functools.wraps(print_method)
+    def wrapper(self: ExpressionPrinter, node: ASTNode) -> str:
+        if self._printed_expressions is None and self._recursion_depth < self.max_recursion_depth or not isinstance(node, ASTExpression):
+            self._recursion_depth += 1
+            try:
+                return print_method(self, node)
+            finally:
+                self._recursion_depth -= 1
+
+        printed_expressions = self._printed_expressions
+        if printed_expressions is not None:
+            printed = printed_expressions.get((wrapper, id(node)))
+            if printed is not None:
+                return printed[1]
+
+        self._recursion_depth += 1
+        is_outermost_bottom_up = False
+        try:
+            if self._recursion_depth > self.max_recursion_depth:
+                if printed_expressions is None:
+                    printed_expressions = self._printed_expressions = {}
+                    is_outermost_bottom_up = True
+
+                # collect the sub-expressions that have not been printed yet; each of them is collected after its parent
+                sub_expressions = []
+                stack = [node]
+                while stack:
+                    expr = stack.pop()
+                    for sub_expression in (expr.expression, expr.lhs, expr.rhs, expr.condition, expr.if_true, expr.if_not):
+                        if isinstance(sub_expression, ASTExpression) and not (wrapper, id(sub_expression)) in printed_expressions.keys():
+                            sub_expressions.append(sub_expression)
+                            stack.append(sub_expression)
+
+                for sub_expression in reversed(sub_expressions):
+                    wrapper(self, sub_expression)
+
+            printed = print_method(self, node)
+            if printed_expressions is not None:
+                # the node is stored as well, so that its ``id()`` cannot be reused by another node while the printed expressions are in use
+                printed_expressions[(wrapper, id(node))] = (node, printed)
+
+            return printed
+        finally:
+            self._recursion_depth -= 1
+            if is_outermost_bottom_up:
+                self._printed_expressions = None
+
+    return wrapper
 
 
 class ExpressionPrinter(ASTPrinter, metaclass=ABCMeta):
@@ -31,8 +94,16 @@ class ExpressionPrinter(ASTPrinter, metaclass=ABCMeta):
     Converts expressions to the executable platform dependent code.
 
     This class is used to transform only parts of the grammar and not NESTML as a whole.
+
+    Methods that print expressions recursively should be decorated with :py:func:`print_deep_expressions_bottom_up`, so that expressions of any depth can be printed.
     """
 
+    # the nesting depth of recursive calls to print an expression, beyond which sub-expressions are printed from the bottom up
+    max_recursion_depth: int = 50
+
+    _recursion_depth: int = 0
+    _printed_expressions: Optional[Dict[Tuple[Callable, int], Tuple[ASTNode, str]]] = None
+
     def __init__(self,
                  simple_expression_printer: SimpleExpressionPrinter):
         self._simple_expression_printer = simple_expression_printer
@@ -21,7 +21,7 @@
 
 import re
 
-from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter
+from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter, print_deep_expressions_bottom_up
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_expression_node import ASTExpressionNode
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
@@ -41,6 +41,7 @@ class LatexExpressionPrinter(ExpressionPrinter):
 
         return self.print_expression(node)
 
+    @print_deep_expressions_bottom_up
     def print_expression(self, node: ASTExpressionNode) -> str:
         if isinstance(node, ASTVariable):
             return self._simple_expression_printer._variable_printer.print_variable(node)
@@ -288,25 +288,36 @@ class NESTMLPrinter(ModelPrinter):
         return ret
 
     def print_expression(self, node: ASTExpression) -> str:
-        ret = ""
-        if node.is_expression():
-            if node.is_encapsulated:
-                ret += "("
-            if node.is_logical_not:
-                ret += "not "
-            if node.is_unary_operator():
-                ret += self.print(node.get_unary_operator())
-            ret += self.print(node.get_expression())
-            if node.is_encapsulated:
-                ret += ")"
-        elif node.is_compound_expression():
-            ret += self.print(node.get_lhs())
-            ret += self.print(node.get_binary_operator())
-            ret += self.print(node.get_rhs())
-        elif node.is_ternary_operator():
-            ret += self.print(node.get_condition()) + "?" + self.print(
-                node.get_if_true()) + ":" + self.print(node.get_if_not())
-        return ret
+        # sub-expressions are expanded in place, with an explicit stack rather than recursively, so that expressions of any depth can be printed
+        ret = []
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                ret.append(item)
+                continue
+
+            if not isinstance(item, ASTExpression):
+                ret.append(self.print(item))
+                continue
+
+            parts = []
+            if item.is_expression():
+                if item.is_encapsulated:
+                    parts.append("(")
+                if item.is_logical_not:
+                    parts.append("not ")
+                if item.is_unary_operator():
+                    parts.append(item.get_unary_operator())
+                parts.append(item.get_expression())
+                if item.is_encapsulated:
+                    parts.append(")")
+            elif item.is_compound_expression():
+                parts.extend([item.get_lhs(), item.get_binary_operator(), item.get_rhs()])
+            elif item.is_ternary_operator():
+                parts.extend([item.get_condition(), "?", item.get_if_true(), ":", item.get_if_not()])
+            stack.extend(reversed(parts))
+        return "".join(ret)
 
     def print_for_stmt(self, node: ASTForStmt) -> str:
         ret = print_ml_comments(node.pre_comments, self.indent, False)
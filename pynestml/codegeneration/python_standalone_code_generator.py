@@ -51,6 +51,10 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
             - **neuron**: A list of neuron model jinja templates.
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the module/package.
     - **solver**: A string identifying the preferred ODE solver. ``"analytic"`` for propagator solver preferred; fallback to numeric solver in case ODEs are not analytically solvable. Use ``"numeric"`` to disable analytic solver.
+    - **parallel_jobs**: Number of worker processes used to analyse models and generate their code in parallel. Default: 1 (no parallelism).
+    - **ode_toolbox_single_pass**: Share the symbolic preprocessing of the equations between the analytic and numeric ODE-toolbox invocations for models that require both solvers. Default: True.
+    - **ode_toolbox_cache_path**: Path to a directory in which ODE-toolbox analysis results are cached across runs. The default is ``None``, which disables the cache.
+    - **ode_toolbox_cache_max_size**: Maximum total size (in bytes) of the ODE-toolbox cache directory. Default: 256 MiB.
     """
 
     _default_options = {
@@ -68,7 +72,11 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
         "numeric_solver": "rk45",
         "neuron_synapse_pairs": [],
         "delay_variable": {},
-        "weight_variable": {}
+        "weight_variable": {},
+        "parallel_jobs": 1,
+        "ode_toolbox_single_pass": True,
+        "ode_toolbox_cache_path": None,
+        "ode_toolbox_cache_max_size": 256 * 1024 * 1024
     }
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
@@ -82,6 +90,7 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
         self.analytic_solver = {}
         self.numeric_solver = {}
         self.non_equations_state_variables = {}  # those state variables not defined as an ODE in the equations block
+        self._ode_toolbox_cache = None
 
         self.setup_template_env()
         self.setup_printers()
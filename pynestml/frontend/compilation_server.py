@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# compilation_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import socket
+import traceback
+
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class CompilationServer:
+    r"""
+    Long-running compilation server, which accepts requests to generate code for, or validate, NESTML models over a local (Unix domain) socket.
+
+    Starting the toolchain is dominated by importing its dependencies (sympy, ODE-toolbox, astropy, Jinja2), building the predefined unit, type, function and variable tables, and compiling the code generation templates. The server does this once upon startup. Each request is then processed in a process that is forked from the server, so that it starts with all of this already in place, while any state that it modifies (the ``Logger``, the ``FrontendConfiguration``, the symbol tables, etc.) is discarded when the request is finished and cannot leak into subsequent requests.
+
+    Requests and responses are JSON objects, each on a single line. A connection can be used for multiple requests, which are processed in order. Supported requests are:
+
+    - ``{"command": "generate", ...}``: generate code. The remaining keys are passed as keyword arguments to ``generate_target()``, for instance ``"input_path"``, ``"target_platform"``, ``"target_path"`` and ``"codegen_opts"``. Relative paths are interpreted relative to ``"cwd"``, if given, and to the working directory of the server otherwise.
+    - ``{"command": "validate", ...}``: parse and check the models, without generating any code. Takes the same keys as ``"generate"``, except ``"target_platform"``.
+    - ``{"command": "ping"}``: check that the server is running.
+    - ``{"command": "shutdown"}``: stop the server.
+
+    The response to ``"generate"`` and ``"validate"`` contains the keys ``"status"`` (``"ok"``, or ``"error"`` if an exception occurred, in which case ``"message"`` contains the traceback), ``"errors_occurred"`` (the return value of ``generate_target()``), ``"log"`` (a list of all log messages) and ``"stdout"`` (the console output).
+    """
+
+    # targets whose code generator supports caching ODE-toolbox results
+    _ode_toolbox_cache_targets = ["NEST", "PYTHON_STANDALONE"]
+
+    # code generators that are instantiated upon startup, so that their templates are compiled once
+    _warm_up_targets = ["NEST", "PYTHON_STANDALONE"]
+
+    def __init__(self, socket_path: str, parse_cache_path: Optional[str] = None, ode_toolbox_cache_path: Optional[str] = None):
+        r"""
+        :param socket_path: path of the Unix domain socket to listen on
+        :param parse_cache_path: default ``parse_cache_path`` for requests that do not specify one
+        :param ode_toolbox_cache_path: default value of the ``ode_toolbox_cache_path`` code generator option for requests that do not specify one
+        """
+        self.socket_path = os.path.abspath(socket_path)
+        self.parse_cache_path = parse_cache_path
+        self.ode_toolbox_cache_path = ode_toolbox_cache_path
+        self._socket = None
+        self._running = False
+
+    def warm_up(self) -> None:
+        r"""
+        Import the toolchain, build the predefined symbol tables and compile the code generation templates.
+        """
+        from pynestml.frontend.pynestml_frontend import code_generator_from_target_name, init_predefined
+
+        Logger.init_logger(LoggingLevel.NO)
+        init_predefined()
+        for target_platform in self._warm_up_targets:
+            # the NEST version only determines how the templates are rendered, not which templates are loaded; passing it avoids auto-detection
+            code_generator_from_target_name(target_platform, {"nest_version": "master"} if target_platform == "NEST" else None)
+
+        Logger.init_logger(LoggingLevel.NO)
+
+    def serve_forever(self) -> None:
+        r"""
+        Listen on the socket and process requests until a ``"shutdown"`` request is received.
+        """
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(self.socket_path)
+        self._socket.listen()
+        self._running = True
+        try:
+            while self._running:
+                conn, _ = self._socket.accept()
+                with conn, conn.makefile("rwb") as f:
+                    self._handle_connection(f)
+        finally:
+            self._socket.close()
+            self._socket = None
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def _handle_connection(self, f) -> None:
+        for line in f:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request should be a JSON object")
+            except ValueError as e:
+                response = {"status": "error", "message": "Invalid request: " + str(e)}
+            else:
+                response = self.handle_request(request)
+
+            f.write((json.dumps(response) + "\n").encode("utf-8"))
+            f.flush()
+
+            if not self._running:
+                break
+
+    def handle_request(self, request: Mapping[str, Any]) -> Dict[str, Any]:
+        r"""
+        Process a single request.
+        :param request: the request
+        :return: the response
+        """
+        command = request.get("command")
+
+        if command == "ping":
+            return {"status": "ok"}
+
+        if command == "shutdown":
+            self._running = False
+            return {"status": "ok"}
+
+        if command in ["generate", "validate"]:
+            kwargs = {key: value for key, value in request.items() if key not in ["command", "cwd"]}
+            if command == "validate":
+                kwargs["target_platform"] = "NONE"
+
+            if not "parse_cache_path" in kwargs.keys() and self.parse_cache_path:
+                kwargs["parse_cache_path"] = self.parse_cache_path
+
+            if self.ode_toolbox_cache_path and str(kwargs.get("target_platform", "")).upper() in self._ode_toolbox_cache_targets:
+                codegen_opts = dict(kwargs.get("codegen_opts") or {})
+                if not "ode_toolbox_cache_path" in codegen_opts.keys():
+                    codegen_opts["ode_toolbox_cache_path"] = self.ode_toolbox_cache_path
+
+                kwargs["codegen_opts"] = codegen_opts
+
+            return self._run_in_child_process(kwargs, request.get("cwd"))
+
+        return {"status": "error", "message": "Unknown command: " + str(command)}
+
+    def _run_in_child_process(self, kwargs: Mapping[str, Any], cwd: Optional[str]) -> Dict[str, Any]:
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.get_context("fork").Process(target=self._process_request, args=(kwargs, cwd, child_conn))
+        process.start()
+        child_conn.close()
+        try:
+            response = parent_conn.recv()
+        except EOFError:
+            response = {"status": "error", "message": "Request process terminated unexpectedly", "errors_occurred": True}
+        finally:
+            parent_conn.close()
+            process.join()
+
+        return response
+
+    @classmethod
+    def _process_request(cls, kwargs: Mapping[str, Any], cwd: Optional[str], conn) -> None:
+        r"""
+        Entry point for the request processes.
+        """
+        from pynestml.frontend.pynestml_frontend import generate_target
+
+        stdout = io.StringIO()
+        response = {"status": "ok"}
+        try:
+            with contextlib.redirect_stdout(stdout):
+                if cwd is not None:
+                    os.chdir(cwd)
+
+                response["errors_occurred"] = generate_target(**kwargs)
+        except BaseException:    # includes ``SystemExit``, which is raised by parts of the toolchain on fatal errors
+            response = {"status": "error", "message": traceback.format_exc(), "errors_occurred": True}
+
+        response["log"] = cls.get_log_entries()
+        response["stdout"] = stdout.getvalue()
+        conn.send(response)
+        conn.close()
+
+    @classmethod
+    def get_log_entries(cls) -> List[Dict[str, str]]:
+        r"""
+        Return the messages that are currently in the log, as records in the same format as those that are written to the log file with the ``--store_log`` option.
+        """
+        return [Logger.get_log_record(log_entry) for log_entry in Logger.get_log().values()]
+
+    @classmethod
+    def send_request(cls, socket_path: str, request: Mapping[str, Any]) -> Dict[str, Any]:
+        r"""
+        Send a request to a running server and wait for the response.
+        :param socket_path: path of the socket that the server listens on
+        :param request: the request
+        :return: the response
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            with sock.makefile("rwb") as f:
+                f.write((json.dumps(request) + "\n").encode("utf-8"))
+                f.flush()
+                return json.loads(f.readline())
@@ -29,6 +29,7 @@ import re
 import pynestml
 from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.exceptions.invalid_target_exception import InvalidTargetException
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages, MessageCode
@@ -39,10 +40,13 @@ help_install_path = 'Path to the directory where the generated code will be inst
 help_target_platform = 'Name of the target platform to build code for. The available targets are NEST and NEST_DESKTOP. Default is NEST.'
 help_logging = 'Indicates which messages shall be logged and printed to the screen. Standard is ERROR.'
 help_module = 'Indicates the name of the module. Optional. If not indicated, the name of the directory containing the models is used'
-help_log = 'Indicates whether a log file containing all messages shall be stored. Standard is NO.'
+help_log = 'Indicates whether a log file containing all messages shall be stored; the messages are written to report/log.jsonl as they are logged. Standard is NO.'
 help_suffix = 'A suffix string that will be appended to the name of all generated models.'
 help_dev = 'Enable development mode: extra information is rendered in the generated code, like the name of the template that generates the code.'
 help_codegen_opts = 'Path to a JSON file containing additional options for the target platform code generator.'
+help_parse_cache_path = 'Path to a directory in which parsed models are cached across runs. Unchanged NESTML files are then loaded from the cache instead of being parsed again. Optional.'
+help_serve = 'Run as a compilation server that listens on the Unix domain socket at the given path, instead of processing models directly. All other arguments except --parse_cache_path and --ode_toolbox_cache_path are then ignored.'
+help_ode_toolbox_cache_path = 'Only used together with --serve: default value of the ode_toolbox_cache_path code generator option for requests that do not specify one.'
 
 qualifier_input_path_arg = '--input_path'
 qualifier_target_path_arg = '--target_path'
@@ -54,9 +58,12 @@ qualifier_store_log_arg = '--store_log'
 qualifier_suffix_arg = '--suffix'
 qualifier_dev_arg = '--dev'
 qualifier_codegen_opts_arg = '--codegen_opts'
+qualifier_parse_cache_path_arg = '--parse_cache_path'
+qualifier_serve_arg = '--serve'
+qualifier_ode_toolbox_cache_path_arg = '--ode_toolbox_cache_path'
 
 
-class FrontendConfiguration:
+class FrontendConfiguration(metaclass=ContextScopedMeta):
     """
     This class encapsulates all settings as handed over to the frontend at start of the toolchain.
     """
@@ -64,6 +71,9 @@ class FrontendConfiguration:
     # static properties
     DEFAULT_TARGET_PATH_: str = "target"
 
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["argument_parser", "paths_to_compilation_units", "provided_input_path", "logging_level", "target", "install_path", "target_path", "target_platform", "module_name", "store_log", "suffix", "is_dev", "codegen_opts", "codegen_opts_fn", "parse_cache_path"]
+
     # member variables
     argument_parser = None
     paths_to_compilation_units = None
@@ -79,6 +89,7 @@ class FrontendConfiguration:
     is_dev = False
     codegen_opts = {}  # type: Mapping[str, Any]
     codegen_opts_fn = ""
+    parse_cache_path = None
 
     @classmethod
     def parse_config(cls, args):
@@ -111,6 +122,9 @@ appropriate numeric solver otherwise.
         cls.argument_parser.add_argument(qualifier_suffix_arg, metavar='SUFFIX', type=str, help=help_suffix, default='')
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true', help=help_dev)
         cls.argument_parser.add_argument(qualifier_codegen_opts_arg, metavar='PATH', type=str, help=help_codegen_opts, default='', dest='codegen_opts_fn')
+        cls.argument_parser.add_argument(qualifier_parse_cache_path_arg, metavar='PATH', type=str, help=help_parse_cache_path)
+        cls.argument_parser.add_argument(qualifier_serve_arg, metavar='PATH', type=str, help=help_serve)
+        cls.argument_parser.add_argument(qualifier_ode_toolbox_cache_path_arg, metavar='PATH', type=str, help=help_ode_toolbox_cache_path)
         parsed_args = cls.argument_parser.parse_args(args)
 
         # initialize the logger
@@ -127,6 +141,7 @@ appropriate numeric solver otherwise.
         cls.store_log = parsed_args.store_log
         cls.suffix = parsed_args.suffix
         cls.is_dev = parsed_args.dev
+        cls.parse_cache_path = parsed_args.parse_cache_path
 
     @classmethod
     def get_provided_input_path(cls) -> Sequence[str]:
@@ -197,6 +212,14 @@ appropriate numeric solver otherwise.
         """
         return cls.is_dev
 
+    @classmethod
+    def get_parse_cache_path(cls) -> Optional[str]:
+        """
+        Returns the path to the directory in which parsed models are cached.
+        :return: the parse cache path, or None if the cache is disabled.
+        """
+        return cls.parse_cache_path
+
     @classmethod
     def get_codegen_opts(cls):
         """Get a copy of the code generator options dictionary"""
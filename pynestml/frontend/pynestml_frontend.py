@@ -21,6 +21,7 @@
 
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import argparse
 import os
 import sys
 
@@ -31,13 +32,17 @@ from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOp
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, \
     qualifier_target_platform_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, \
-    qualifier_dev_arg, qualifier_install_path_arg
+    qualifier_dev_arg, qualifier_install_path_arg, qualifier_parse_cache_path_arg, qualifier_serve_arg, \
+    qualifier_ode_toolbox_cache_path_arg, help_serve, help_parse_cache_path, help_ode_toolbox_cache_path
+from pynestml.frontend.compilation_server import CompilationServer
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.transformers.transformer import Transformer
+from pynestml.utils.compilation_context import CompilationContext
+from pynestml.utils.log_sink import JSONLinesLogSink
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
@@ -177,7 +182,8 @@ def builder_from_target_name(target_name: str, options: Optional[Mapping[str, An
 
 def generate_target(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                     install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, parse_cache_path: Optional[str] = None,
+                    context: Optional[CompilationContext] = None):
     r"""Generate and build code for the given target platform.
 
     Parameters
@@ -193,7 +199,7 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
     module_name : str, optional (default: "nestmlmodule")
         Sets the name of the module which shall be generated. Default is the name of the directory containing the models. The name has to end in ``module``. Default is ``nestmlmodule``.
     store_log : bool, optional (default: False)
-        Stores a log.txt containing all messages in JSON notation. Default is OFF.
+        Stores a log.jsonl containing all messages in JSON Lines notation, one message per line, written while processing. Default is OFF.
     suffix : str, optional (default: "")
         A suffix string that will be appended to the name of all generated models.
     install_path
@@ -202,22 +208,29 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    parse_cache_path : Optional[str]
+        Path to a directory in which parsed models are cached across runs. Unchanged NESTML files are then loaded from the cache instead of being parsed again. Default is ``None``, which disables the cache.
+    context : Optional[CompilationContext]
+        The context that holds the configuration, log, symbol tables and predefined registries of this run. Passing a separate context allows several runs to proceed concurrently in different threads. Default is ``None``, which uses the currently active context.
 
     Return
     ------
     errors_occurred
         Flag indicating whether errors occurred during processing. False if processing was successful; True if errors occurred in any of the models.
     """
+    if context is None:
+        context = CompilationContext.get_current()
 
-    configure_front_end(input_path, target_platform, target_path, install_path, logging_level,
-                        module_name, store_log, suffix, dev, codegen_opts)
+    with context.activate():
+        configure_front_end(input_path, target_platform, target_path, install_path, logging_level,
+                            module_name, store_log, suffix, dev, codegen_opts, parse_cache_path)
 
-    return process()
+        return process()
 
 
 def configure_front_end(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                         install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                        dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                        dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, parse_cache_path: Optional[str] = None):
 
     args = list()
     args.append(qualifier_input_path_arg)
@@ -255,6 +268,10 @@ def configure_front_end(input_path: Union[str, Sequence[str]], target_platform:
     if dev:
         args.append(qualifier_dev_arg)
 
+    if parse_cache_path is not None:
+        args.append(qualifier_parse_cache_path_arg)
+        args.append(str(parse_cache_path))
+
     FrontendConfiguration.parse_config(args)
 
     if codegen_opts:
@@ -395,6 +412,12 @@ def main() -> int:
     exit_code
         The process exit code: 0 for success, > 0 for failure
     """
+    # detect ``--serve`` in the same way as the argument parser of the frontend configuration would, i.e. also as ``--serve=PATH``
+    serve_argument_parser = argparse.ArgumentParser(add_help=False)
+    serve_argument_parser.add_argument(qualifier_serve_arg, metavar="PATH", type=str)
+    if serve_argument_parser.parse_known_args(sys.argv[1:])[0].serve is not None:
+        return serve(sys.argv[1:])
+
     try:
         FrontendConfiguration.parse_config(sys.argv[1:])
     except InvalidPathException as e:
@@ -402,13 +425,48 @@ def main() -> int:
 
         return 1
 
-    # the default Python recursion limit is 1000, which might not be enough in practice when running an AST visitor on a deep tree, e.g. containing an automatically generated expression
+    # the default Python recursion limit is 1000, which is not enough for the symbolic processing of large ODE systems in ODE-toolbox and sympy (the AST visitors, clone() and printers of PyNESTML do not depend on it)
     sys.setrecursionlimit(10000)
 
     # after all argument have been collected, start the actual processing
     return int(process())
 
 
+def serve(args: Sequence[str]) -> int:
+    r"""
+    Run the compilation server (see :py:class:`CompilationServer`) until it is shut down.
+
+    Parameters
+    ----------
+    args
+        The command-line arguments
+
+    Returns
+    -------
+    exit_code
+        The process exit code: 0 for success, > 0 for failure
+    """
+    argument_parser = argparse.ArgumentParser(description="NESTML compilation server")
+    argument_parser.add_argument(qualifier_serve_arg, metavar="PATH", type=str, help=help_serve, required=True)
+    argument_parser.add_argument(qualifier_parse_cache_path_arg, metavar="PATH", type=str, help=help_parse_cache_path)
+    argument_parser.add_argument(qualifier_ode_toolbox_cache_path_arg, metavar="PATH", type=str, help=help_ode_toolbox_cache_path)
+    parsed_args, _ = argument_parser.parse_known_args(args)
+
+    # see main()
+    sys.setrecursionlimit(10000)
+
+    server = CompilationServer(parsed_args.serve, parse_cache_path=parsed_args.parse_cache_path,
+                               ode_toolbox_cache_path=parsed_args.ode_toolbox_cache_path)
+    server.warm_up()
+    print("NESTML compilation server listening on " + server.socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
 def get_parsed_models() -> List[ASTModel]:
     r"""
    Handle the parsing and validation of the NESTML files
@@ -459,16 +517,39 @@ def generate_code(code_generators, models):
     code_generators.generate_code(models)
 
 
-def process() -> bool:
+def process(context: Optional[CompilationContext] = None) -> bool:
     r"""
     The main toolchain workflow entry point. For all models: parse, validate, transform, generate code and build.
 
+    Parameters
+    ----------
+    context
+        The context in which to run; its configuration should have been set using ``configure_front_end()``. Default is ``None``, which uses the currently active context.
+
     Return
     ------
     errors_occurred
         Flag indicating whether errors occurred during processing. False if processing was successful; True if errors occurred in any of the models.
     """
+    if context is not None:
+        with context.activate():
+            return process()
+
+    if not FrontendConfiguration.store_log:
+        return _process()
 
+    # stream the messages to the log file as they are logged, including those that were logged during configuration
+    create_report_dir()
+    log_sink = JSONLinesLogSink(get_log_file_path())
+    Logger.add_sink(log_sink, replay_log=True)
+    try:
+        return _process()
+    finally:
+        Logger.remove_sink(log_sink)
+        log_sink.close()
+
+
+def _process() -> bool:
     # initialise model transformers
     transformers, unused_opts_transformer = transformers_from_target_name(FrontendConfiguration.get_target_platform(),
                                                                           options=FrontendConfiguration.get_codegen_opts())
@@ -517,9 +598,6 @@ def process() -> bool:
     if _builder is not None:
         _builder.build()
 
-    if FrontendConfiguration.store_log:
-        store_log_to_file()
-
     # return a boolean indicating whether errors occurred
     return len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)) > 0
 
@@ -537,7 +615,5 @@ def create_report_dir():
         os.makedirs(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report"))
 
 
-def store_log_to_file():
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report",
-                               "log")) + ".txt", "w+") as f:
-        f.write(str(Logger.get_json_format()))
+def get_log_file_path() -> str:
+    return os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report", "log.jsonl")
@@ -30,6 +30,28 @@ from antlr4.Token import CommonToken
 from pynestml.generated.PyNestMLParser import PyNestMLParser
 
 
+class PyNestMLLexerATNSimulator(LexerATNSimulator):
+    r"""
+    Lexer ATN simulator that caches the DFA start state of each mode for both values of the ``atStartOfInput()`` predicate.
+
+    The NEWLINE rule starts with the semantic predicate ``atStartOfInput()``. Because of this, the ANTLR runtime does not cache the DFA start state, and recomputes the closure over all lexer rules for every token, which is where most of the time of parsing a model is spent. As this is the only predicate in the lexer, the start state only depends on its value, and can be cached for each value instead.
+    """
+
+    # map from (DFA, value of ``atStartOfInput()``) to the DFA start state
+    _start_states = {}
+
+    def matchATN(self, input: InputStream):
+        key = (self.decisionToDFA[self.mode], self.recog.atStartOfInput())
+        start_state = PyNestMLLexerATNSimulator._start_states.get(key)
+        if start_state is None:
+            s0_closure = self.computeStartState(input, self.atn.modeToStartState[self.mode])
+            s0_closure.hasSemanticContext = False
+            start_state = self.addDFAState(s0_closure)
+            PyNestMLLexerATNSimulator._start_states[key] = start_state
+
+        return self.execATN(input, start_state)
+
+
 class PyNestMLLexerBase(Lexer):
     def __init__(self, input: InputStream, output: TextIO = sys.stdout):
         super().__init__(input, output)
@@ -38,6 +60,18 @@ class PyNestMLLexerBase(Lexer):
         self._indents = []
         self._tokens = []
 
+    @property
+    def _interp(self):
+        return self._atn_simulator
+
+    @_interp.setter
+    def _interp(self, interp):
+        # the generated lexer creates a plain ``LexerATNSimulator`` in its constructor
+        if type(interp) is LexerATNSimulator:
+            interp = PyNestMLLexerATNSimulator(self, interp.atn, interp.decisionToDFA, interp.sharedContextCache)
+
+        self._atn_simulator = interp
+
     @property
     def tokens(self):
         return self._tokens
@@ -38,6 +38,8 @@ class ASTArithmeticOperator(ASTNode):
         is_pow_op = False  # type:bool
     """
 
+    __slots__ = ("is_times_op", "is_div_op", "is_modulo_op", "is_plus_op", "is_minus_op", "is_pow_op")
+
     def __init__(self, is_times_op: bool, is_div_op: bool, is_modulo_op: bool, is_plus_op: bool, is_minus_op: bool, is_pow_op: bool, *args, **kwargs):
         super(ASTArithmeticOperator, self).__init__(*args, **kwargs)
         assert ((is_times_op + is_div_op + is_modulo_op + is_plus_op + is_minus_op + is_pow_op) == 1), \
@@ -79,6 +81,12 @@ class ASTArithmeticOperator(ASTNode):
         """
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.is_times_op, self.is_div_op, self.is_modulo_op, self.is_plus_op, self.is_minus_op, self.is_pow_op
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -37,6 +37,8 @@ class ASTBitOperator(ASTNode):
         is_bit_shift_right = False
     """
 
+    __slots__ = ("is_bit_shift_right", "is_bit_shift_left", "is_bit_or", "is_bit_xor", "is_bit_and")
+
     def __init__(self, is_bit_and=False, is_bit_xor=False, is_bit_or=False, is_bit_shift_left=False,
                  is_bit_shift_right=False, *args, **kwargs):
         """
@@ -91,6 +93,12 @@ class ASTBitOperator(ASTNode):
         """
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.is_bit_and, self.is_bit_or, self.is_bit_xor, self.is_bit_shift_left, self.is_bit_shift_right
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -47,6 +47,8 @@ class ASTBlockWithVariables(ASTNode):
         declarations = None
     """
 
+    __slots__ = ("declarations", "is_internals", "is_parameters", "is_state")
+
     def __init__(self, is_state=False, is_parameters=False, is_internals=False,
                  declarations=None, *args, **kwargs):
         """
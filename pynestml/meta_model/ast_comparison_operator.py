@@ -39,6 +39,8 @@ class ASTComparisonOperator(ASTNode):
         is_gt = False
     """
 
+    __slots__ = ("is_gt", "is_ge", "is_ne2", "is_ne", "is_eq", "is_le", "is_lt")
+
     def __init__(self, is_lt=False, is_le=False, is_eq=False, is_ne=False, is_ne2=False, is_ge=False,
                  is_gt=False, *args, **kwargs):
         """
@@ -103,6 +105,12 @@ class ASTComparisonOperator(ASTNode):
         """
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.is_lt, self.is_le, self.is_eq, self.is_ne, self.is_ne2, self.is_ge, self.is_gt
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -40,6 +40,8 @@ class ASTCompoundStmt(ASTNode):
         for_stmt = None
     """
 
+    __slots__ = ("if_stmt", "while_stmt", "for_stmt")
+
     def __init__(self, if_stmt=None, while_stmt=None, for_stmt=None, *args, **kwargs):
         """
         Standard constructor.
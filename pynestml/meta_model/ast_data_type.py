@@ -48,6 +48,8 @@ class ASTDataType(ASTNode):
         type_symbol = None  # the corresponding type symbol
     """
 
+    __slots__ = ("is_integer", "is_real", "is_string", "is_boolean", "is_void", "unit_type", "type_symbol")
+
     def __init__(self, is_integer=False, is_real=False, is_string=False, is_boolean=False, is_void=False,
                  unit_type: Optional[ASTUnitType] = None, type_symbol=None, *args, **kwargs):
         """
@@ -151,6 +153,13 @@ class ASTDataType(ASTNode):
 
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return (self.is_integer, self.is_real, self.is_string, self.is_boolean, self.is_void,
+                self.get_unit_type().structural_hash() if self.is_unit_type() else None)
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
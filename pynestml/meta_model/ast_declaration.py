@@ -59,6 +59,8 @@ class ASTDeclaration(ASTNode):
         invariant = None
     """
 
+    __slots__ = ("is_recordable", "is_inline_expression", "variables", "data_type", "size_parameter", "expression", "invariant", "decorators")
+
     def __init__(self, is_recordable: bool = False, is_inline_expression: bool = False, _variables: Optional[List[ASTVariable]] = None, data_type: Optional[ASTDataType] = None, size_parameter: Optional[Union[ASTSimpleExpression, ASTExpression]] = None,
                  expression: Optional[ASTExpression] = None, invariant: Optional[ASTExpression] = None, decorators=None, *args, **kwargs):
         """
@@ -169,6 +171,7 @@ class ASTDeclaration(ASTNode):
         :param _parameter: the size parameter
         """
         self.size_parameter = _parameter
+        self.adopt(_parameter)
 
     def has_expression(self) -> bool:
         """
@@ -188,6 +191,7 @@ class ASTDeclaration(ASTNode):
     def set_expression(self, expr):
         # type: (ASTExpression) -> None
         self.expression = expr
+        self.adopt(expr)
 
     def has_invariant(self):
         """
@@ -226,6 +230,16 @@ class ASTDeclaration(ASTNode):
 
         return children
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        # the size parameters are not included, as ``equals()`` compares them by identity
+        return (self.is_inline_expression, self.is_recordable, tuple(var.structural_hash() for var in self.get_variables()),
+                self.get_invariant().structural_hash() if self.has_invariant() else None,
+                self.get_data_type().structural_hash(),
+                self.get_expression().structural_hash() if self.get_expression() is not None else None)
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -233,6 +247,9 @@ class ASTDeclaration(ASTNode):
         if not isinstance(other, ASTDeclaration):
             return False
 
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         if not (self.is_inline_expression == other.is_inline_expression and self.is_recordable == other.is_recordable):
             return False
 
@@ -30,6 +30,8 @@ class ASTElseClause(ASTNode):
     This class is used to store a single else-clause.
     """
 
+    __slots__ = ("stmts_body",)
+
     def __init__(self, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
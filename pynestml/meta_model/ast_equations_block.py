@@ -32,6 +32,8 @@ class ASTEquationsBlock(ASTNode):
     This class is used to store an equations block.
     """
 
+    __slots__ = ("declarations",)
+
     def __init__(self, declarations, *args, **kwargs):
         """
         Standard constructor.
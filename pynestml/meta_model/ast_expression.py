@@ -67,6 +67,8 @@ class ASTExpression(ASTExpressionNode):
         simple_expression = None
     """
 
+    __slots__ = ("is_encapsulated", "is_logical_not", "unary_operator", "expression", "lhs", "binary_operator", "rhs", "condition", "if_true", "if_not", "has_delay")
+
     def __init__(self, is_encapsulated: bool = False, unary_operator: Optional[ASTUnaryOperator] = None,
                  is_logical_not: bool = False, expression: Optional[ASTExpression] = None, lhs: Optional[ASTExpression] = None,
                  binary_operator: Optional[Union[ASTLogicalOperator, ASTComparisonOperator, ASTBitOperator, ASTArithmeticOperator]] = None,
@@ -109,33 +111,52 @@ class ASTExpression(ASTExpressionNode):
         """
         Return a clone ("deep copy") of this node.
 
+        Sub-expressions are cloned bottom-up, with an explicit stack rather than recursively, so that expressions of any depth can be cloned.
+
         :return: new AST node instance
         :rtype: ASTExpression
         """
-        expression_dup = None
-        if self.expression:
-            expression_dup = self.expression.clone()
+        # collect this expression and all its sub-expressions in pre-order
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            for sub_expression in (node.if_not, node.if_true, node.condition, node.rhs, node.lhs, node.expression):
+                if isinstance(sub_expression, ASTExpression):
+                    stack.append(sub_expression)
+
+        # clone them in reverse order, so that the clones of the sub-expressions of a node are available on the stack when the node is cloned
+        for node in reversed(nodes):
+            stack.append(node._clone_with_sub_expressions(stack))
+
+        return stack.pop()
+
+    def _clone_with_sub_expressions(self, cloned_sub_expressions: List[ASTExpression]) -> ASTExpression:
+        r"""
+        Clone this node. Sub-expressions that are instances of ``ASTExpression`` are not cloned; their clones are taken from the top of the given stack, in the order ``expression``, ``lhs``, ``rhs``, ``condition``, ``if_true``, ``if_not``.
+        """
+        def clone_sub_expression(sub_expression):
+            if sub_expression is None:
+                return None
+
+            if isinstance(sub_expression, ASTExpression):
+                return cloned_sub_expressions.pop()
+
+            return sub_expression.clone()
+
+        expression_dup = clone_sub_expression(self.expression)
         unary_operator_dup = None
         if self.unary_operator:
             unary_operator_dup = self.unary_operator.clone()
-        lhs_dup = None
-        if self.lhs:
-            lhs_dup = self.lhs.clone()
+        lhs_dup = clone_sub_expression(self.lhs)
         binary_operator_dup = None
         if self.binary_operator:
             binary_operator_dup = self.binary_operator.clone()
-        rhs_dup = None
-        if self.rhs:
-            rhs_dup = self.rhs.clone()
-        condition_dup = None
-        if self.condition:
-            condition_dup = self.condition.clone()
-        if_true_dup = None
-        if self.if_true:
-            if_true_dup = self.if_true.clone()
-        if_not_dup = None
-        if self.if_not:
-            if_not_dup = self.if_not.clone()
+        rhs_dup = clone_sub_expression(self.rhs)
+        condition_dup = clone_sub_expression(self.condition)
+        if_true_dup = clone_sub_expression(self.if_true)
+        if_not_dup = clone_sub_expression(self.if_not)
         dup = ASTExpression(is_encapsulated=self.is_encapsulated,
                             unary_operator=unary_operator_dup,
                             is_logical_not=self.is_logical_not,
@@ -258,6 +279,28 @@ class ASTExpression(ASTExpressionNode):
         """
         return self.has_delay
 
+    def get_simple_expression_operands(self) -> List[ASTNode]:
+        """
+        Returns the operands of this rhs and of its sub-expressions that are not themselves composed of sub-expressions, i.e. the simple expressions, from left to right. The sub-expressions are traversed with an explicit stack rather than recursively, so that expressions of any depth can be handled.
+        :return: a list of simple expressions.
+        """
+        ret = list()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, ASTExpression):
+                ret.append(node)
+            elif node.is_expression():
+                stack.append(node.get_expression())
+            elif node.is_compound_expression():
+                stack.append(node.get_rhs())
+                stack.append(node.get_lhs())
+            elif node.is_ternary_operator():
+                stack.append(node.get_if_not())
+                stack.append(node.get_if_true())
+                stack.append(node.get_condition())
+        return ret
+
     def get_variables(self):
         """
         Returns a list of all variables as used in this rhs.
@@ -266,15 +309,8 @@ class ASTExpression(ASTExpressionNode):
         """
         # TODO: extract this to utils
         ret = list()
-        if self.is_expression():
-            ret.extend(self.get_expression().get_variables())
-        elif self.is_compound_expression():
-            ret.extend(self.get_lhs().get_variables())
-            ret.extend(self.get_rhs().get_variables())
-        elif self.is_ternary_operator():
-            ret.extend(self.get_condition().get_variables())
-            ret.extend(self.get_if_true().get_variables())
-            ret.extend(self.get_if_not().get_variables())
+        for operand in self.get_simple_expression_operands():
+            ret.extend(operand.get_variables())
         return ret
 
     def get_units(self):
@@ -285,15 +321,8 @@ class ASTExpression(ASTExpressionNode):
         """
         # TODO: extract this to utils
         ret = list()
-        if self.is_expression():
-            ret.extend(self.get_expression().get_units())
-        elif self.is_compound_expression():
-            ret.extend(self.get_lhs().get_units())
-            ret.extend(self.get_rhs().get_units())
-        elif self.is_ternary_operator():
-            ret.extend(self.get_condition().get_units())
-            ret.extend(self.get_if_true().get_units())
-            ret.extend(self.get_if_not().get_units())
+        for operand in self.get_simple_expression_operands():
+            ret.extend(operand.get_units())
         return ret
 
     def get_function_calls(self):
@@ -304,15 +333,8 @@ class ASTExpression(ASTExpressionNode):
         """
         # TODO: extract this to utils
         ret = list()
-        if self.is_expression():
-            ret.extend(self.get_expression().get_function_calls())
-        elif self.is_compound_expression():
-            ret.extend(self.get_lhs().get_function_calls())
-            ret.extend(self.get_rhs().get_function_calls())
-        elif self.is_ternary_operator():
-            ret.extend(self.get_condition().get_function_calls())
-            ret.extend(self.get_if_true().get_function_calls())
-            ret.extend(self.get_if_not().get_function_calls())
+        for operand in self.get_simple_expression_operands():
+            ret.extend(operand.get_function_calls())
         return ret
 
     def get_children(self) -> List[ASTNode]:
@@ -354,12 +376,28 @@ class ASTExpression(ASTExpressionNode):
 
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        # the operand of a unary operator is not compared by ``equals()``
+        return (self.is_encapsulated, self.is_logical_not,
+                self.get_unary_operator().structural_hash() if self.is_unary_operator() else None,
+                self.get_expression().structural_hash() if self.is_expression() else None,
+                (self.get_lhs().structural_hash(), self.get_rhs().structural_hash(), self.get_binary_operator().structural_hash()) if self.is_compound_expression() else None,
+                (self.get_condition().structural_hash(), self.get_if_true().structural_hash(), self.get_if_not().structural_hash()) if self.is_ternary_operator() else None,
+                self.get_has_delay())
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
         """
         if not isinstance(other, ASTExpression):
             return False
+
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         # we have to ensure that both either are encapsulated or not
         if self.is_encapsulated + other.is_encapsulated == 1:
             return False
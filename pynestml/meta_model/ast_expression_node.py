@@ -33,11 +33,12 @@ class ASTExpressionNode(ASTNode):
 
     This class is abstract, thus no instances can be created.
     """
-    __type = None
+    __slots__ = ("__type",)
     __metaclass__ = ABCMeta
 
     def __init__(self, *args, **kwargs):
         super(ASTExpressionNode, self).__init__(*args, **kwargs)
+        self.__type = None
 
     @property
     def type(self):
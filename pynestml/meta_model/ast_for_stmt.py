@@ -30,6 +30,8 @@ class ASTForStmt(ASTNode):
     This class is used to store a "for" statement.
     """
 
+    __slots__ = ("variable", "start_from", "end_at", "step", "stmts_body")
+
     def __init__(self, variable, start_from, end_at, step, stmts_body: ASTStmtsBody, *args, **kwargs):
         """
         Standard constructor.
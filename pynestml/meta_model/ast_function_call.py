@@ -38,6 +38,8 @@ class ASTFunctionCall(ASTNode):
         args = None
     """
 
+    __slots__ = ("callee_name", "args")
+
     def __init__(self, callee_name, function_call_args, *args, **kwargs):
         """
         Standard constructor.
@@ -109,12 +111,22 @@ class ASTFunctionCall(ASTNode):
         """
         return self.get_args()
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.get_name(), tuple(arg.structural_hash() for arg in self.get_args())
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
         """
         if not isinstance(other, ASTFunctionCall):
             return False
+
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         if self.get_name() != other.get_name():
             return False
         if len(self.get_args()) != len(other.get_args()):
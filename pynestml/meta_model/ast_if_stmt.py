@@ -38,6 +38,8 @@ class ASTIfStmt(ASTNode):
         else_clause = None
     """
 
+    __slots__ = ("else_clause", "if_clause", "elif_clauses")
+
     def __init__(self, if_clause, elif_clauses=None, else_clause=None, *args, **kwargs):
         """
         Standard constructor.
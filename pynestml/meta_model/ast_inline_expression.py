@@ -38,6 +38,8 @@ class ASTInlineExpression(ASTNode):
         expression = None
     """
 
+    __slots__ = ("is_recordable", "variable_name", "data_type", "expression", "decorators")
+
     def __init__(self, is_recordable=False, variable_name=None, data_type=None, expression=None, decorators=None, *args, **kwargs):
         """
         Standard constructor.
@@ -113,6 +115,7 @@ class ASTInlineExpression(ASTNode):
         :param variable_name: the name of the variable.
         """
         self.variable_name = variable_name
+        self.tree_modified()
 
     def get_data_type(self):
         """
@@ -144,12 +147,23 @@ class ASTInlineExpression(ASTNode):
 
         return children
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return (self.is_recordable, self.get_variable_name(), self.get_data_type().structural_hash(),
+                self.get_expression().structural_hash())
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
         """
         if not isinstance(other, ASTInlineExpression):
             return False
+
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         if self.is_recordable != other.is_recordable:
             return False
         if self.get_variable_name() != other.get_variable_name():
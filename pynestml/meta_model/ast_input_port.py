@@ -57,6 +57,8 @@ class ASTInputPort(ASTNode):
 
     """
 
+    __slots__ = ("name", "signal_type", "size_parameter", "data_type", "input_qualifiers")
+
     def __init__(self,
                  name: str,
                  signal_type: PortSignalType,
@@ -39,6 +39,8 @@ class ASTInputQualifier(ASTNode):
         is_excitatory = False
     """
 
+    __slots__ = ("is_excitatory", "is_inhibitory")
+
     def __init__(self, is_inhibitory=False, is_excitatory=False, *args, **kwargs):
         """
         Standard constructor.
@@ -31,6 +31,8 @@ class ASTKernel(ASTNode):
         kernel : KERNEL_KEYWORD variable EQUALS expression (COMMA variable EQUALS expression)* (SEMICOLON)?;
     """
 
+    __slots__ = ("variables", "expressions")
+
     def __init__(self, variables, expressions, *args, **kwargs):
         """
         Standard constructor.
@@ -105,6 +107,14 @@ class ASTKernel(ASTNode):
         children.extend(self.get_expressions())
         return children
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        # ``equals()`` does not take the order of the variables and expressions into account
+        return (frozenset(var.structural_hash() for var in self.get_variables()),
+                frozenset(expr.structural_hash() for expr in self.get_expressions()))
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -112,6 +122,9 @@ class ASTKernel(ASTNode):
         if not isinstance(other, ASTKernel):
             return False
 
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         for var in self.get_variables():
             if not var in other.get_variables():
                 return False
@@ -34,6 +34,8 @@ class ASTLogicalOperator(ASTNode):
         is_logical_or = False
     """
 
+    __slots__ = ("is_logical_and", "is_logical_or")
+
     def __init__(self, is_logical_and=False, is_logical_or=False, *args, **kwargs):
         """
         Standard constructor.
@@ -77,6 +79,12 @@ class ASTLogicalOperator(ASTNode):
         """
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.is_logical_and, self.is_logical_or
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -46,6 +46,9 @@ class ASTModel(ASTNode):
     This class is used to stuff common to neurons and synapses
     """
 
+    # models keep a ``__dict__``, as transformers and code generators attach further information to them, e.g. ``paired_neuron``
+    __slots__ = ("name", "body", "artifact_name", "_default_delay_variable", "_default_delay_expression", "_default_delay_dtype", "file_path", "__dict__")
+
     def __init__(self, name: str, body: ASTModelBody, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -171,6 +174,7 @@ class ASTModel(ASTNode):
         for elem in self.get_body().get_body_elements():
             if isinstance(elem, ASTEquationsBlock):
                 self.get_body().get_body_elements().remove(elem)
+                self.tree_modified()
 
     def get_state_declarations(self):
         """
@@ -453,6 +457,7 @@ class ASTModel(ASTNode):
         block = ASTNodeFactory.create_ast_stmts_body([], ASTSourceLocation.get_predefined_source_position())
         update_block = ASTNodeFactory.create_ast_update_block(block, ASTSourceLocation.get_predefined_source_position())
         self.get_body().get_body_elements().append(update_block)
+        self.get_body().adopt(update_block)
 
     def add_to_internals_block(self, declaration: ASTDeclaration, index: int = -1) -> None:
         """
@@ -460,8 +465,6 @@ class ASTModel(ASTNode):
         :param declaration: a single declaration
         """
         from pynestml.utils.ast_utils import ASTUtils
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 
         assert len(self.get_internals_blocks()) <= 1, "Only one internals block supported for now"
 
@@ -474,13 +477,7 @@ class ASTModel(ASTNode):
         else:
             index = 1 + (index % len(self.get_internals_blocks()[0].get_declarations()))
 
-        self.get_internals_blocks()[0].get_declarations().insert(index, declaration)
-        declaration.update_scope(self.get_internals_blocks()[0].get_scope())
-        symtable_vistor = ASTSymbolTableVisitor()
-        symtable_vistor.block_type_stack.push(BlockType.INTERNALS)
-        self.accept(ASTParentVisitor())
-        self.accept(symtable_vistor)
-        symtable_vistor.block_type_stack.pop()
+        self._add_declaration_to_block(self.get_internals_blocks()[0], declaration, index, BlockType.INTERNALS)
 
     def add_to_state_block(self, declaration: ASTDeclaration) -> None:
         """
@@ -489,25 +486,56 @@ class ASTModel(ASTNode):
         """
         from pynestml.symbols.symbol import SymbolKind
         from pynestml.utils.ast_utils import ASTUtils
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 
         assert len(self.get_state_blocks()) <= 1, "Only one internals block supported for now"
 
         if not self.get_state_blocks():
             ASTUtils.create_state_block(self)
 
-        self.get_state_blocks()[0].get_declarations().append(declaration)
-        declaration.update_scope(self.get_state_blocks()[0].get_scope())
-        symtable_vistor = ASTSymbolTableVisitor()
-        symtable_vistor.block_type_stack.push(BlockType.STATE)
-        self.accept(ASTParentVisitor())
-        self.accept(symtable_vistor)
-        symtable_vistor.block_type_stack.pop()
+        self._add_declaration_to_block(self.get_state_blocks()[0], declaration, len(self.get_state_blocks()[0].get_declarations()), BlockType.STATE)
 
         assert declaration.get_variables()[0].get_scope().resolve_to_symbol(declaration.get_variables()[0].get_name(), SymbolKind.VARIABLE) is not None
         assert declaration.get_scope().resolve_to_symbol(declaration.get_variables()[0].get_name(), SymbolKind.VARIABLE) is not None
 
+    def _add_declaration_to_block(self, block: ASTBlockWithVariables, declaration: ASTDeclaration, index: int, block_type: BlockType) -> None:
+        """
+        Inserts the handed over declaration into a block, and adds the declared variables to the symbol table, in the same order as the declarations in the block.
+        :param block: the block to add the declaration to
+        :param declaration: a single declaration
+        :param index: the position of the declaration in the block
+        :param block_type: the type of the block
+        """
+        from pynestml.symbols.symbol import SymbolKind
+        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
+
+        block.get_declarations().insert(index, declaration)
+        block.adopt(declaration)
+        declaration.accept(ASTParentVisitor())
+        declaration.update_scope(block.get_scope())
+        symtable_vistor = ASTSymbolTableVisitor()
+        symtable_vistor.block_type_stack.push(block_type)
+        declaration.accept(symtable_vistor)
+        symtable_vistor.block_type_stack.pop()
+
+        # the new symbols have been added after all others; move them behind the symbols of the previous declaration, or before those of the next one
+        scope = block.get_scope()
+        next_symbol = None
+        if index > 0:
+            previous_declaration = block.get_declarations()[index - 1]
+            previous_symbol = scope.resolve_to_symbol(previous_declaration.get_variables()[-1].get_complete_name(), SymbolKind.VARIABLE)
+            symbols = scope.get_symbols_in_this_scope()
+            if previous_symbol in symbols and symbols.index(previous_symbol) + 1 < len(symbols):
+                next_symbol = symbols[symbols.index(previous_symbol) + 1]
+        elif index + 1 < len(block.get_declarations()):
+            next_declaration = block.get_declarations()[index + 1]
+            next_symbol = scope.resolve_to_symbol(next_declaration.get_variables()[0].get_complete_name(), SymbolKind.VARIABLE)
+
+        new_symbols = [scope.resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE) for var in declaration.get_variables()]
+        if next_symbol is not None and next_symbol not in new_symbols:
+            for symbol in new_symbols:
+                scope.add_symbol(symbol, before=next_symbol)
+
     def print_comment(self, prefix: str = "") -> str:
         """
         Prints the header comment of this neuron.
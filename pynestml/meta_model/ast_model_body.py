@@ -44,6 +44,8 @@ class ASTModelBody(ASTNode):
         body_elements = None
     """
 
+    __slots__ = ("body_elements",)
+
     def __init__(self, body_elements, *args, **kwargs):
         """
         Standard constructor.
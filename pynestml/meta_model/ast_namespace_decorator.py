@@ -29,6 +29,8 @@ class ASTNamespaceDecorator(ASTNode):
     Namespace decorator, for example "@nest::delay".
     """
 
+    __slots__ = ("namespace", "name")
+
     def __init__(self, namespace: str = "", name: str = "", *args, **kwargs):
         super(ASTNamespaceDecorator, self).__init__(*args, **kwargs)
         self.namespace = namespace
@@ -71,7 +73,7 @@ class ASTNamespaceDecorator(ASTNode):
         Returns the children of this node, if any.
         :return: List of children of this node.
         """
-        return [self.get_name(), self.get_namespace()]
+        return []
 
     def equals(self, other: ASTNode) -> bool:
         r"""
@@ -79,5 +81,4 @@ class ASTNamespaceDecorator(ASTNode):
         """
         if not isinstance(other, ASTNamespaceDecorator):
             return False
-        return (self.get_name().equals(other.get_name())
-                and self.get_namespace().equals(other.get_namespace()))
+        return self.get_name() == other.get_name() and self.get_namespace() == other.get_namespace()
@@ -30,6 +30,8 @@ class ASTNestMLCompilationUnit(ASTNode):
     Store a collection of processed ASTModels.
     """
 
+    __slots__ = ("model_list", "artifact_name", "file_path")
+
     def __init__(self, model_list: List[ASTModel] = None, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -109,6 +111,12 @@ class ASTNestMLCompilationUnit(ASTNode):
         """
         return self.get_model_list()
 
+    def adopt_children(self) -> None:
+        r"""
+        Models are the roots of their trees, so they are not linked to the compilation unit.
+        """
+        pass
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
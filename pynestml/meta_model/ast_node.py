@@ -29,7 +29,18 @@ from pynestml.symbol_table.scope import Scope
 from pynestml.utils.ast_source_location import ASTSourceLocation
 
 
-class ASTNode(metaclass=ABCMeta):
+class ASTNodeMeta(ABCMeta):
+    r"""
+    Metaclass of the meta_model classes. When a node has been constructed, the children that were passed to its constructor and that do not have a parent yet (for instance, because they were just created by the AST builder or by ``clone()``) are linked to it.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        node = super().__call__(*args, **kwargs)
+        node.adopt_children()
+        return node
+
+
+class ASTNode(metaclass=ASTNodeMeta):
     """
     This class is not a part of the grammar but is used to store commonalities of all possible meta_model classes,
     e.g., the source position.
@@ -45,8 +56,29 @@ class ASTNode(metaclass=ABCMeta):
         in_comment = None
         #
         implicit_conversion_factor = None
+
+    All meta_model classes declare their attributes in ``__slots__``, so that nodes do not carry a ``__dict__``. As most nodes do not have comments, the comments are only stored if there are any; otherwise, ``pre_comments`` is a shared, empty tuple.
+
+    Each node links to its parent in ``parent_``, which is None for the root of a tree. The links are set when a node is constructed and by the methods that add or replace children. Code that modifies the children of a node in place should update the links, or run the ``ASTParentVisitor`` on the modified subtree.
+
+    The methods that add, remove, replace or rename nodes call ``tree_modified()``, so that data derived from the trees, such as an ``ASTIndex`` or the structural hashes of the nodes, can be invalidated.
+
+    Nodes are hashed and compared by identity. In addition, ``structural_hash()`` returns a hash of the subtree of a node that is consistent with ``equals()``, so that ``equals()`` can return early if the hashes of two nodes differ, and so that equal nodes can be found by looking up their structural hash in a dictionary.
     """
 
+    __slots__ = ("source_position", "scope", "_comments", "implicit_conversion_factor", "parent_", "_structural_hash")
+
+    _no_pre_comments = ()
+
+    # if True, ``get_parent()`` checks that the parent links are consistent with ``get_children()``; for debugging, as the check is expensive
+    check_parent_links = False
+
+    # incremented by ``tree_modified()``
+    modification_count = 0
+
+    # stored with the structural hashes that are cached in the nodes; as the hashes of strings differ between processes, a hash that has been cached by another process, and pickled along with the node, is not valid
+    _structural_hash_marker = object()
+
     def __init__(self, source_position: ASTSourceLocation = None, scope: Scope = None, comment: Optional[str] = None, pre_comments: Optional[List[str]] = None,
                  in_comment: Optional[str] = None, implicit_conversion_factor: Optional[float] = None):
         """
@@ -60,13 +92,44 @@ class ASTNode(metaclass=ABCMeta):
         """
         self.source_position = source_position
         self.scope = scope
-        self.comment = comment
-        if pre_comments is None:
-            pre_comments = []
-        self.pre_comments = pre_comments
-        self.in_comment = in_comment
+        self.parent_ = None
+        self._structural_hash = None
+        self._set_comments(comment, pre_comments, in_comment)
         self.implicit_conversion_factor = implicit_conversion_factor
 
+    @property
+    def comment(self):
+        r"""The comment of this node: all its pre-comments and its in-comment, or None."""
+        return None if self._comments is None else self._comments[0]
+
+    @comment.setter
+    def comment(self, comment):
+        self._set_comments(comment, self.pre_comments, self.in_comment)
+
+    @property
+    def pre_comments(self):
+        r"""The comments on the lines before this node."""
+        return ASTNode._no_pre_comments if self._comments is None else self._comments[1]
+
+    @pre_comments.setter
+    def pre_comments(self, pre_comments):
+        self._set_comments(self.comment, pre_comments, self.in_comment)
+
+    @property
+    def in_comment(self):
+        r"""The comment on the same line as this node, or None."""
+        return None if self._comments is None else self._comments[2]
+
+    @in_comment.setter
+    def in_comment(self, in_comment):
+        self._set_comments(self.comment, self.pre_comments, in_comment)
+
+    def _set_comments(self, comment: Optional[List[str]], pre_comments: Optional[List[str]], in_comment: Optional[str]) -> None:
+        if not comment and not pre_comments and in_comment is None:
+            self._comments = None
+        else:
+            self._comments = (comment, pre_comments if pre_comments else ASTNode._no_pre_comments, in_comment)
+
     @abstractmethod
     def clone(self):
         """
@@ -83,18 +146,73 @@ class ASTNode(metaclass=ABCMeta):
         """
         pass
 
+    def structural_hash(self) -> int:
+        r"""
+        Returns a hash of this node and its subtree, such that nodes that are equal according to ``equals()`` have the same structural hash. The hashes are cached in the nodes of the subtree until any tree is modified (see ``tree_modified()``).
+        :return: the structural hash
+        """
+        cached = self._structural_hash
+        if cached is not None and cached[0] is ASTNode._structural_hash_marker and cached[1] == ASTNode.modification_count:
+            return cached[2]
+
+        # collect the nodes of the subtree that have no valid hash; they are hashed from the bottom up rather than recursively, so that very deep expressions can be hashed as well
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            for child in node.get_children():
+                if child is not None:
+                    cached = child._structural_hash
+                    if cached is None or cached[0] is not ASTNode._structural_hash_marker or cached[1] != ASTNode.modification_count:
+                        stack.append(child)
+
+        for node in reversed(nodes):
+            node._structural_hash = (ASTNode._structural_hash_marker, ASTNode.modification_count, hash((type(node).equals, node._structural_hash_fields())))
+
+        return self._structural_hash[2]
+
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case. By default, nodes are only hashed by the ``equals()`` method of their class.
+        """
+        return ()
+
     def get_parent(self) -> Optional[ASTNode]:
         """
         Get the parent of this node.
-        :return: The parent node
+        :return: The parent node, or None if this node is the root of a tree
         """
-        assert "parent_" in dir(self), "No parent known, please ensure ASTParentVisitor has been run on the AST"
-
-        if self.parent_:
-            assert self in self.parent_.get_children(), "Doubly linked tree is inconsistent: please ensure ASTParentVisitor has been run on the AST"
+        if ASTNode.check_parent_links and self.parent_ is not None:
+            assert any(child is self for child in self.parent_.get_children()), "Doubly linked tree is inconsistent: please ensure ASTParentVisitor has been run on the AST"
 
         return self.parent_
 
+    def adopt_children(self) -> None:
+        r"""
+        Link the children of this node that do not have a parent yet to this node.
+        """
+        for child in self.get_children():
+            if child is not None and child.parent_ is None:
+                child.parent_ = self
+
+    def adopt(self, child: Optional[ASTNode]) -> None:
+        r"""
+        Link a child that has been added to this node, or that has replaced one of its children, to this node.
+        :param child: the new child, or None if a child has been removed
+        """
+        if child is not None:
+            child.parent_ = self
+
+        ASTNode.tree_modified()
+
+    @staticmethod
+    def tree_modified() -> None:
+        r"""
+        Record that a tree has been modified, which invalidates data derived from the trees, such as an ``ASTIndex`` or the structural hashes of the nodes. Code that modifies nodes in place, rather than through their methods, should call this too.
+        """
+        ASTNode.modification_count += 1
+
     @abstractmethod
     def get_children(self) -> List[ASTNode]:
         r"""
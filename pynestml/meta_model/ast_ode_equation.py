@@ -42,6 +42,8 @@ class ASTOdeEquation(ASTNode):
         rhs = None
     """
 
+    __slots__ = ("lhs", "rhs", "decorators")
+
     def __init__(self, lhs, rhs, decorators=None, *args, **kwargs):
         """
         Standard constructor.
@@ -122,10 +124,20 @@ class ASTOdeEquation(ASTNode):
 
         return children
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.get_lhs().structural_hash(), self.get_rhs().structural_hash()
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
         """
         if not isinstance(other, ASTOdeEquation):
             return False
+
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         return self.get_lhs().equals(other.get_lhs()) and self.get_rhs().equals(other.get_rhs())
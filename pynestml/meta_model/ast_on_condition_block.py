@@ -33,6 +33,8 @@ class ASTOnConditionBlock(ASTNode):
     This class is used to store a declaration of an onCondition block
     """
 
+    __slots__ = ("stmts_body", "cond_expr", "const_parameters")
+
     def __init__(self, stmts_body: ASTStmtsBody, cond_expr: ASTExpression, const_parameters: Optional[Mapping] = None, *args, **kwargs):
         r"""
         Standard constructor.
@@ -53,7 +55,7 @@ class ASTOnConditionBlock(ASTNode):
         :return: new AST node instance
         """
         dup = ASTOnConditionBlock(stmts_body=self.stmts_body.clone(),
-                                  cond_expr=self.cond_expr,
+                                  cond_expr=self.cond_expr.clone() if self.cond_expr else None,
                                   const_parameters=self.const_parameters,
                                   # ASTNode common attributes:
                                   source_position=self.source_position,
@@ -38,6 +38,8 @@ class ASTOnReceiveBlock(ASTNode):
 
     """
 
+    __slots__ = ("stmts_body", "port_name", "const_parameters")
+
     def __init__(self, stmts_body: ASTStmtsBody, port_name: str, const_parameters: Optional[Mapping] = None, *args, **kwargs):
         r"""
         Standard constructor.
@@ -50,6 +50,8 @@ class ASTSimpleExpression(ASTExpressionNode):
 
     """
 
+    __slots__ = ("function_call", "is_boolean_true", "is_boolean_false", "numeric_literal", "is_inf_literal", "variable", "string", "has_delay")
+
     def __init__(self, function_call: ASTFunctionCall = None, boolean_literal: bool = None,
                  numeric_literal: Union[int, float] = None, is_inf: bool = False,
                  variable: ASTVariable = None, string: str = None, has_delay: bool = False, *args, **kwargs):
@@ -193,6 +195,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         :type numeric_literal: int or float
         """
         self.numeric_literal = numeric_literal
+        self.tree_modified()
 
     def is_variable(self):
         """
@@ -295,6 +298,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (variable is None or isinstance(variable, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of variable provided (%s)!' % type(variable)
         self.variable = variable
+        self.adopt(variable)
 
     def set_function_call(self, function_call):
         """
@@ -305,6 +309,15 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (function_call is None or isinstance(function_call, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of function call provided (%s)!' % type(function_call)
         self.function_call = function_call
+        self.adopt(function_call)
+
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return (self.get_function_call().structural_hash() if self.is_function_call() else None,
+                self.get_variable().structural_hash() if self.is_variable() else None,
+                self.get_numeric_literal(), self.is_boolean_true, self.is_boolean_false, self.is_inf_literal, self.get_string())
 
     def equals(self, other: ASTNode) -> bool:
         r"""
@@ -313,6 +326,9 @@ class ASTSimpleExpression(ASTExpressionNode):
         if not isinstance(other, ASTSimpleExpression):
             return False
 
+        if self.structural_hash() != other.structural_hash():
+            return False
+
         if self.is_function_call() + other.is_function_call() == 1:
             return False
 
@@ -39,6 +39,8 @@ class ASTSmallStmt(ASTNode):
         return_stmt (ast_return_stmt): A reference to the returns statement.
     """
 
+    __slots__ = ("assignment", "function_call", "declaration", "return_stmt")
+
     def __init__(self, assignment=None, function_call=None, declaration=None, return_stmt=None, *args, **kwargs):
         """
         Standard constructor.
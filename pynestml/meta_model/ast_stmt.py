@@ -34,6 +34,8 @@ class ASTStmt(ASTNode):
         compound_stmt = None
     """
 
+    __slots__ = ("small_stmt", "compound_stmt")
+
     def __init__(self, small_stmt, compound_stmt, *args, **kwargs):
         """
         Standard constructor.
@@ -33,6 +33,8 @@ class ASTStmtsBody(ASTNode):
         stmts = None
     """
 
+    __slots__ = ("stmts",)
+
     def __init__(self, stmts, *args, **kwargs):
         """
         Standard constructor.
@@ -86,6 +88,7 @@ class ASTStmtsBody(ASTNode):
         :type stmt: ASTSmallStmt,ASTCompoundStmt
         """
         self.stmts.append(stmt)
+        self.adopt(stmt)
 
     def delete_stmt(self, stmt):
         """
@@ -96,6 +99,7 @@ class ASTStmtsBody(ASTNode):
         :rtype: bool
         """
         self.stmts.remove(stmt)
+        self.tree_modified()
 
     def get_children(self) -> List[ASTNode]:
         r"""
@@ -35,6 +35,8 @@ class ASTUnaryOperator(ASTNode):
         is_unary_tilde = False
     """
 
+    __slots__ = ("is_unary_plus", "is_unary_minus", "is_unary_tilde")
+
     def __init__(self, is_unary_plus=False, is_unary_minus=False, is_unary_tilde=False, *args, **kwargs):
         """
         Standard constructor.
@@ -82,6 +84,12 @@ class ASTUnaryOperator(ASTNode):
         """
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.is_unary_minus, self.is_unary_plus, self.is_unary_tilde
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
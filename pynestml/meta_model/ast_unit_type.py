@@ -55,6 +55,8 @@ class ASTUnitType(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("is_encapsulated", "compound_unit", "base", "is_pow", "exponent", "lhs", "is_times", "is_div", "rhs", "unit", "type_symbol")
+
     def __init__(self, is_encapsulated=False, compound_unit=None, base=None, is_pow=False,
                  exponent=None, lhs=None, rhs=None, is_div=False, is_times=False, _unit=None, type_symbol=None, *args, **kwargs):
         """
@@ -202,6 +204,17 @@ class ASTUnitType(ASTNode):
 
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return (self.compound_unit.structural_hash() if self.is_encapsulated else None,
+                (self.base.structural_hash(), self.exponent) if self.is_pow else None,
+                (self.lhs.structural_hash() if isinstance(self.lhs, ASTNode) else self.lhs,
+                 self.rhs.structural_hash() if isinstance(self.rhs, ASTNode) else self.rhs,
+                 self.is_times, self.is_div) if self.is_arithmetic_expression() else None,
+                self.unit)
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
@@ -42,6 +42,8 @@ class ASTVariable(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("name", "differential_order", "type_symbol", "vector_parameter", "is_homogeneous", "delay_parameter", "_is_numeric", "_is_post_port")
+
     def __init__(self, name, differential_order=0, type_symbol: Optional[str] = None,
                  vector_parameter: Optional[str] = None, is_homogeneous: bool = False, delay_parameter: Optional[str] = None, *args, **kwargs):
         r"""
@@ -67,6 +69,9 @@ class ASTVariable(ASTNode):
         self.vector_parameter = vector_parameter
         self.is_homogeneous = is_homogeneous
         self.delay_parameter = delay_parameter
+        # set by the code generators and transformers, respectively
+        self._is_numeric = False
+        self._is_post_port = False
 
     def clone(self):
         r"""
@@ -103,6 +108,7 @@ class ASTVariable(ASTNode):
         :name: the name to set.
         """
         self.name = name
+        self.tree_modified()
 
     def get_is_homogeneous(self) -> bool:
         return self.is_homogeneous
@@ -119,6 +125,7 @@ class ASTVariable(ASTNode):
         Returns the differential order of the variable.
         """
         self.differential_order = differential_order
+        self.tree_modified()
 
     def get_complete_name(self) -> str:
         r"""
@@ -169,6 +176,7 @@ class ASTVariable(ASTNode):
         Updates the vector parameter of the variable
         """
         self.vector_parameter = vector_parameter
+        self.tree_modified()
 
     def get_delay_parameter(self):
         r"""
@@ -213,6 +221,12 @@ class ASTVariable(ASTNode):
 
         return []
 
+    def _structural_hash_fields(self) -> tuple:
+        r"""
+        Returns the attributes of this node, and the structural hashes of its children, that ``equals()`` compares in any case.
+        """
+        return self.get_name(), self.get_differential_order()
+
     def equals(self, other: ASTNode) -> bool:
         r"""
         The equality method.
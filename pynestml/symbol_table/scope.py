@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from enum import Enum
 
@@ -52,6 +52,11 @@ class Scope:
         declared_elements Elements declared in this scope, i.e., scopes and symbols. Type: list(Scope,Symbol)
         scope_type The type of this scope. Type: ScopeType
         source_position The position in the source file this scope spans over.
+
+    Symbols are additionally indexed by name and kind, so that symbols are resolved by dictionary lookups rather than by
+    scanning the declared elements. The results of ``resolve_to_all_symbols()`` and ``resolve_to_all_scopes()``, which
+    span all sub-scopes of the global scope, are cached in the global scope; the cache is cleared whenever a symbol or
+    scope is added to or deleted from any scope in the tree.
     """
 
     def __init__(self, scope_type: ScopeType, enclosing_scope: Scope = None, source_position: ASTSourceLocation = None):
@@ -65,21 +70,70 @@ class Scope:
         self.scope_type = scope_type
         self.enclosing_scope = enclosing_scope
         self.source_location = source_position
+        # the symbols and sub-scopes in declared_elements, each in the order of declaration
+        self._symbols: List[Symbol] = list()
+        self._scopes: List[Scope] = list()
+        # the symbols in this scope by name and kind, in the order of declaration
+        self._symbols_by_key: Dict[Tuple[str, SymbolKind], List[Symbol]] = dict()
+        # the results of resolve_to_all_symbols() and resolve_to_all_scopes(); only used in the global scope
+        self._resolution_cache: Dict[Tuple[str, SymbolKind, bool], List[Union[Symbol, Scope]]] = dict()
+
+    def _invalidate_resolution_cache(self) -> None:
+        r"""
+        Clears the cached results of the resolution over all sub-scopes, after this scope has been modified.
+        """
+        g_scope = self.get_global_scope()
+        if g_scope is not None:
+            g_scope._resolution_cache.clear()
 
-    def add_symbol(self, symbol: Symbol) -> None:
+    def add_symbol(self, symbol: Symbol, before: Optional[Symbol] = None) -> None:
         r"""
         Adds the handed over symbol to the current scope.
         :param symbol: a single symbol object.
+        :param before: a symbol in this scope before which the symbol is inserted. If not given, the symbol is added
+                       after all other symbols.
         """
         self.delete_symbol(symbol)
-        self.declared_elements.append(symbol)
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        if not key in self._symbols_by_key.keys():
+            self._symbols_by_key[key] = list()
+
+        symbols = self._symbols_by_key[key]
+        if before is None:
+            self.declared_elements.append(symbol)
+            self._symbols.append(symbol)
+            symbols.append(symbol)
+        else:
+            self.declared_elements.insert(self.declared_elements.index(before), symbol)
+            index = self._symbols.index(before)
+            self._symbols.insert(index, symbol)
+            # keep the symbols with the same name and kind in order of declaration as well
+            symbols.insert(len([sim for sim in self._symbols[:index] if sim.get_symbol_name() == key[0] and sim.get_symbol_kind() == key[1]]), symbol)
+
+        self._invalidate_resolution_cache()
 
     def update_variable_symbol(self, _symbol: Symbol) -> None:
-        for symbol in self.get_symbols_in_this_scope():
-            if (symbol.get_symbol_kind() == SymbolKind.VARIABLE and symbol.get_symbol_name() == _symbol.get_symbol_name()):
-                self.declared_elements.remove(symbol)
-                self.add_symbol(_symbol)
-                break
+        r"""
+        Replaces the variable symbol with the same name as the handed over symbol, retaining its position in the scope.
+        :param _symbol: a single variable symbol.
+        """
+        symbols = self._symbols_by_key.get((_symbol.get_symbol_name(), SymbolKind.VARIABLE))
+        if symbols and symbols[0] is not _symbol:
+            old_symbol = symbols[0]
+            self.add_symbol(_symbol, before=old_symbol)
+            self.delete_symbol(old_symbol)
+
+    def rename_symbol(self, symbol: Symbol, name: str) -> None:
+        r"""
+        Renames a symbol of this scope, retaining its position in the scope.
+        :param symbol: a single symbol of this scope.
+        :param name: the new name of the symbol.
+        """
+        index = self._symbols.index(symbol)
+        next_symbol = self._symbols[index + 1] if index + 1 < len(self._symbols) else None
+        self.delete_symbol(symbol)
+        symbol.name = name
+        self.add_symbol(symbol, before=next_symbol)
 
     def add_scope(self, scope: Scope) -> None:
         r"""
@@ -87,6 +141,8 @@ class Scope:
         :param scope: a single scope object.
         """
         self.declared_elements.append(scope)
+        self._scopes.append(scope)
+        self._invalidate_resolution_cache()
 
     def delete_symbol(self, symbol: Symbol) -> bool:
         r"""
@@ -95,11 +151,22 @@ class Scope:
         :type symbol: Symbol
         :return: True, if the element has been deleted, otherwise False.
         """
-        if symbol in self.declared_elements:
-            self.declared_elements.remove(symbol)
-            return True
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        symbols = self._symbols_by_key.get(key)
+        if symbols is None or not symbol in symbols:
+            return False
 
-        return False
+        # remove the same element (which is equal to, but not necessarily identical with, the handed over one) everywhere
+        symbol = symbols[symbols.index(symbol)]
+        symbols.remove(symbol)
+        if not symbols:
+            del self._symbols_by_key[key]
+
+        self._symbols.remove(symbol)
+        self.declared_elements.remove(symbol)
+        self._invalidate_resolution_cache()
+
+        return True
 
     def delete_scope(self, scope: Scope) -> bool:
         r"""
@@ -107,8 +174,10 @@ class Scope:
         :param scope: a single scope object.
         :return: True, if the element has been deleted, otherwise False.
         """
-        if scope in self.declared_elements:
+        if scope in self._scopes:
+            self._scopes.remove(scope)
             self.declared_elements.remove(scope)
+            self._invalidate_resolution_cache()
             return True
 
         return False
@@ -118,11 +187,7 @@ class Scope:
         Returns the set of elements as defined in this scope, but not in the corresponding super scope.
         :return: a list of symbols defined only in this scope, but not in the upper scopes.
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Symbol):
-                ret.append(elem)
-        return ret
+        return list(self._symbols)
 
     def get_symbols_in_complete_scope(self) -> List[Symbol]:
         r"""
@@ -141,13 +206,9 @@ class Scope:
         :return: a list of scope objects
         :rtype: list
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Scope):
-                ret.append(elem)
-        return ret
+        return list(self._scopes)
 
-    def resolve_to_all_scopes(self, name: str, kind: SymbolKind) -> Optional[Scope]:
+    def resolve_to_all_scopes(self, name: str, kind: SymbolKind) -> Optional[Union[Scope, List[Scope]]]:
         r"""
         Resolves the handed over name and type and returns the scope in which the corresponding symbol has been defined.
         If element has been defined in several scopes, all scopes are returned as a list.
@@ -155,33 +216,7 @@ class Scope:
         :param kind: the type of the element
         :return: the scope in which the element has been defined in
         """
-        g_scope = self.get_global_scope()
-        scopes = g_scope.__resolve_to_scope_in_spanned_scope(name, kind)
-        # the following step is done in order to return, whenever the list contains only one element, only this element
-        if isinstance(scopes, list) and len(scopes) == 1:
-            return scopes[0]
-
-        if isinstance(scopes, list) and len(scopes) == 0:
-            return None
-
-        return scopes
-
-    def __resolve_to_scope_in_spanned_scope(self, name: str, kind: SymbolKind) -> List[Scope]:
-        r"""
-        Private method: returns this scope or one of the sub-scopes in which the handed over symbol is defined in.
-        :param name: the name of the element.
-        :param kind: the type of the element
-        :return: the corresponding scope object.
-        """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(self)
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
-            temp = elem.__resolve_to_scope_in_spanned_scope(name, kind)
-            if temp is not None:
-                ret.extend(temp)
-        return ret
+        return self.__resolve_in_spanned_scopes(name, kind, True)
 
     def resolve_to_all_symbols(self, name: str, kind: SymbolKind) -> Optional[Union[Symbol, List[Symbol]]]:
         r"""
@@ -192,37 +227,41 @@ class Scope:
         :param kind: the type of the element
         :return: a single symbol element.
         """
-        g_scope = self.get_global_scope()
-        symbols = g_scope.__resolve_to_symbol_in_spanned_scope(name, kind)
-        # the following step is done in order to return, whenever the list contains only one element, only this element
-        if isinstance(symbols, list) and len(symbols) == 1:
-            return symbols[0]
-
-        if len(symbols) == 0:
-            return None
-
-        return symbols
+        return self.__resolve_in_spanned_scopes(name, kind, False)
 
-    def __resolve_to_symbol_in_spanned_scope(self, name: str, kind: SymbolKind) -> List[Symbol]:
+    def __resolve_in_spanned_scopes(self, name: str, kind: SymbolKind, to_scopes: bool) -> Optional[Union[Symbol, Scope, List[Union[Symbol, Scope]]]]:
         r"""
-        Private method: returns a symbol if the handed over name and type belong to a symbol in this or one of the
-        sub-scope. Caution: Here, we also take redeclaration into account. This has to be prevented - if required -
-        by cocos.
+        Private method: returns all symbols with the handed over name and type (or the scopes in which they are
+        defined), in the global scope and all of its sub-scopes, in order of declaration.
         :param name: the name of the element.
         :param kind: the type of the element
-        :return: the corresponding symbol object.
+        :param to_scopes: whether to return the scopes instead of the symbols
+        :return: None if there are no matching symbols, the single symbol or scope if there is exactly one, otherwise a list
         """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(sim)
+        g_scope = self.get_global_scope()
+        key = (name, kind, to_scopes)
+        ret = g_scope._resolution_cache.get(key)
+        if ret is None:
+            ret = list()
+            stack = [g_scope]
+            while stack:
+                scope = stack.pop()
+                for sim in scope._symbols_by_key.get((name, kind), ()):
+                    ret.append(scope if to_scopes else sim)
 
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
-            temp = elem.__resolve_to_symbol_in_spanned_scope(name, kind)
-            if temp is not None:
-                ret.extend(temp)
+                # the sub-scopes are searched in order of declaration, i.e., depth-first
+                stack.extend(reversed(scope._scopes))
 
-        return ret
+            g_scope._resolution_cache[key] = ret
+
+        # the following step is done in order to return, whenever the list contains only one element, only this element
+        if len(ret) == 1:
+            return ret[0]
+
+        if len(ret) == 0:
+            return None
+
+        return list(ret)
 
     def resolve_to_scope(self, name: str, kind: SymbolKind) -> Optional[Scope]:
         r"""
@@ -232,14 +271,16 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching scope.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return self
+        key = (name, kind)
+        scope = self
+        while True:
+            if key in scope._symbols_by_key:
+                return scope
 
-        if self.has_enclosing_scope():
-            return self.get_enclosing_scope().resolve_to_scope(name, kind)
+            if not scope.has_enclosing_scope():
+                return None
 
-        return None
+            scope = scope.enclosing_scope
 
     def resolve_to_symbol(self, name: str, kind: SymbolKind) -> Optional[Symbol]:
         r"""
@@ -249,14 +290,17 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching symbol.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return sim
+        key = (name, kind)
+        scope = self
+        while True:
+            symbols = scope._symbols_by_key.get(key)
+            if symbols is not None:
+                return symbols[0]
 
-        if self.has_enclosing_scope():
-            return self.get_enclosing_scope().resolve_to_symbol(name, kind)
+            if not scope.has_enclosing_scope():
+                return None
 
-        return None
+            scope = scope.enclosing_scope
 
     def get_global_scope(self) -> Optional[Scope]:
         r"""
@@ -22,9 +22,10 @@
 from typing import Mapping
 
 from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.utils.compilation_context import ContextScopedMeta
 
 
-class SymbolTable:
+class SymbolTable(metaclass=ContextScopedMeta):
     """
     This class is used to store a single symbol table, consisting of scope and symbols.
 
@@ -32,6 +33,9 @@ class SymbolTable:
         name2model_scope A dict from the name of a model to the corresponding scope. Type str->Scope
         source_position The source position of the overall compilation unit. Type ASTSourceLocation
     """
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["name2model_scope", "source_location"]
+
     name2model_scope = {}   # type: Mapping[str, Scope]
     source_location = None
 
@@ -23,9 +23,10 @@ from typing import Mapping
 
 from pynestml.symbols.function_symbol import FunctionSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.compilation_context import ContextScopedMeta
 
 
-class PredefinedFunctions:
+class PredefinedFunctions(metaclass=ContextScopedMeta):
     r"""
     This class is used to represent all predefined functions of NESTML.
     """
@@ -64,6 +65,9 @@ class PredefinedFunctions:
     DELTA = "delta"
     INTEGRATE_ODES = "integrate_odes"
     CONVOLVE = "convolve"
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["name2function"]
+
     name2function = {}   # type: Mapping[str, FunctionSymbol]
 
     @classmethod
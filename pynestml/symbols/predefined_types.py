@@ -29,11 +29,12 @@ from pynestml.symbols.template_type_symbol import TemplateTypeSymbol
 from pynestml.symbols.type_symbol import TypeSymbol
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.symbols.variadic_type_symbol import VariadicTypeSymbol
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.utils.type_dictionary import TypeDictionary
 from pynestml.utils.unit_type import UnitType
 
 
-class PredefinedTypes:
+class PredefinedTypes(metaclass=ContextScopedMeta):
     """
     This class represents all types which are predefined in the system.
 
@@ -45,6 +46,9 @@ class PredefinedTypes:
         STRING_TYPE   The identifier of the type 'string'. Type: str
         INTEGER_TYPE  The identifier of the type 'integer'. Type: str
     """
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["name2type"]
+
     name2type = {}   # type: Mapping[str, TypeSymbol]
     REAL_TYPE = 'real'
     VOID_TYPE = 'void'
@@ -19,21 +19,26 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping, Sequence
+from typing import List, Mapping, Sequence
 
+import astropy
 from astropy import units as u
 
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.unit_type import UnitType
 
 
-class PredefinedUnits:
+class PredefinedUnits(metaclass=ContextScopedMeta):
     """
     This class represents a collection of physical units. Units can be retrieved by means of get_unit(name).
     Attribute:
         name2unit (dict):  Dict of all predefined units, map from name to unit object.
     """
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["name2unit"]
+
     name2unit = {}   # type: Mapping[str, UnitType]
 
     @classmethod
@@ -41,9 +46,34 @@ class PredefinedUnits:
         """
         Registers all units in astropy.units (more specifically, from the si, cgs and astrophys submodules) as predefined units into NESTML.
         """
-        # first store all base units and the derived units without the prefix in a list
         cls.name2unit = {}
 
+        for unit_attribute in cls.get_astropy_unit_attributes():
+            unit = getattr(u, unit_attribute)
+            for unit_name in unit.names:
+                temp_unit = UnitType(name=str(unit_name), unit=unit)
+                cls.name2unit[str(unit_name)] = temp_unit
+
+    @classmethod
+    def get_astropy_unit_attributes(cls) -> Sequence[str]:
+        """
+        Returns the names under which the units to be registered are found in astropy.units. These are read from the table in ``predefined_units_table``, which is generated for a specific astropy version, so that astropy only has to be searched for units if a different version is installed.
+        :return: the attribute names of the units
+        """
+        from pynestml.symbols import predefined_units_table
+
+        if predefined_units_table.ASTROPY_VERSION == astropy.__version__:
+            return predefined_units_table.UNIT_ATTRIBUTES
+
+        return cls.find_astropy_unit_attributes()
+
+    @classmethod
+    def find_astropy_unit_attributes(cls) -> List[str]:
+        """
+        Searches the si, cgs and astrophys submodules of astropy.units for units.
+        :return: the attribute names of the units
+        """
+        unit_attributes = []
         for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
             try:
                 unit = eval("u." + unit_str)    # grab the unit object
@@ -51,9 +81,9 @@ class PredefinedUnits:
                 unit = None
 
             if issubclass(type(unit), u.core.UnitBase):
-                for unit_name in unit.names:
-                    temp_unit = UnitType(name=str(unit_name), unit=unit)
-                    cls.name2unit[str(unit_name)] = temp_unit
+                unit_attributes.append(unit_str)
+
+        return unit_attributes
 
     @classmethod
     def get_unit(cls, name: str) -> UnitType:
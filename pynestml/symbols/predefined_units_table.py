@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# predefined_units_table.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+# This file has been generated by extras/generate_predefined_units_table.py. Do not edit it manually.
+
+ASTROPY_VERSION = "6.1.5"
+
+# names of the units in astropy.units that are registered as predefined units
+UNIT_ATTRIBUTES = (
+    "A", "AA", "Bq", "C", "Celsius", "Ci", "EA", "EC", "EF", "EH",
+    "EHz", "EJ", "EK", "EL", "EN", "EOhm", "EPa", "ES", "ET", "EV",
+    "EW", "EWb", "Ea", "Earcmin", "Earcsec", "Ecd", "Ed", "Edeg", "EeV", "Eg",
+    "Eh", "Elm", "Elx", "Em", "Emin", "Emol", "Erad", "Es", "Esr", "Eyr",
+    "F", "GA", "GC", "GF", "GH", "GHz", "GJ", "GK", "GL", "GN",
+    "GOhm", "GPa", "GS", "GT", "GV", "GW", "GWb", "Ga", "Garcmin", "Garcsec",
+    "Gcd", "Gd", "Gdeg", "GeV", "Gg", "Gh", "Glm", "Glx", "Gm", "Gmin",
+    "Gmol", "Grad", "Gs", "Gsr", "Gyr", "H", "Hertz", "J", "K", "L",
+    "MA", "MC", "MF", "MH", "MHz", "MJ", "MK", "ML", "MN", "MOhm",
+    "MPa", "MS", "MT", "MV", "MW", "MWb", "Ma", "Marcmin", "Marcsec", "Mcd",
+    "Md", "Mdeg", "MeV", "Mg", "Mh", "Mlm", "Mlx", "Mm", "Mmin", "Mmol",
+    "Mrad", "Ms", "Msr", "Myr", "N", "Ohm", "PA", "PC", "PF", "PH",
+    "PHz", "PJ", "PK", "PL", "PN", "POhm", "PPa", "PS", "PT", "PV",
+    "PW", "PWb", "Pa", "Parcmin", "Parcsec", "Pcd", "Pd", "Pdeg", "PeV", "Pg",
+    "Ph", "Plm", "Plx", "Pm", "Pmin", "Pmol", "Prad", "Ps", "Psr", "Pyr",
+    "QA", "QC", "QF", "QH", "QHz", "QJ", "QK", "QL", "QN", "QOhm",
+    "QPa", "QS", "QT", "QV", "QW", "QWb", "Qa", "Qarcmin", "Qarcsec", "Qcd",
+    "Qd", "Qdeg", "QeV", "Qg", "Qh", "Qlm", "Qlx", "Qm", "Qmin", "Qmol",
+    "Qrad", "Qs", "Qsr", "Qyr", "RA", "RC", "RF", "RH", "RHz", "RJ",
+    "RK", "RL", "RN", "ROhm", "RPa", "RS", "RT", "RV", "RW", "RWb",
+    "Ra", "Rarcmin", "Rarcsec", "Rcd", "Rd", "Rdeg", "ReV", "Rg", "Rh", "Rlm",
+    "Rlx", "Rm", "Rmin", "Rmol", "Rrad", "Rs", "Rsr", "Ryr", "S", "T",
+    "TA", "TC", "TF", "TH", "THz", "TJ", "TK", "TL", "TN", "TOhm",
+    "TPa", "TS", "TT", "TV", "TW", "TWb", "Ta", "Tarcmin", "Tarcsec", "Tcd",
+    "Td", "Tdeg", "TeV", "Tg", "Th", "Tlm", "Tlx", "Tm", "Tmin", "Tmol",
+    "Trad", "Ts", "Tsr", "Tyr", "V", "W", "Wb", "YA", "YC", "YF",
+    "YH", "YHz", "YJ", "YK", "YL", "YN", "YOhm", "YPa", "YS", "YT",
+    "YV", "YW", "YWb", "Ya", "Yarcmin", "Yarcsec", "Ycd", "Yd", "Ydeg", "YeV",
+    "Yg", "Yh", "Ylm", "Ylx", "Ym", "Ymin", "Ymol", "Yrad", "Ys", "Ysr",
+    "Yyr", "ZA", "ZC", "ZF", "ZH", "ZHz", "ZJ", "ZK", "ZL", "ZN",
+    "ZOhm", "ZPa", "ZS", "ZT", "ZV", "ZW", "ZWb", "Za", "Zarcmin", "Zarcsec",
+    "Zcd", "Zd", "Zdeg", "ZeV", "Zg", "Zh", "Zlm", "Zlx", "Zm", "Zmin",
+    "Zmol", "Zrad", "Zs", "Zsr", "Zyr", "a", "aA", "aC", "aF", "aH",
+    "aHz", "aJ", "aK", "aL", "aN", "aOhm", "aPa", "aS", "aT", "aV",
+    "aW", "aWb", "aa", "aarcmin", "aarcsec", "acd", "ad", "adeg", "aeV", "ag",
+    "ah", "alm", "alx", "am", "amin", "amol", "arad", "arcmin", "arcsec", "asr",
+    "attosecond", "attoyear", "cA", "cC", "cF", "cH", "cHz", "cJ", "cK", "cL",
+    "cN", "cOhm", "cPa", "cS", "cT", "cV", "cW", "cWb", "ca", "candela",
+    "carcmin", "carcsec", "ccd", "cdeg", "ceV", "centiday", "centigram", "centihour", "centilumen", "centilux",
+    "centimeter", "centiminute", "centimole", "centiradian", "centisecond", "centisteradian", "centiyear", "d", "dA", "dC",
+    "dF", "dH", "dHz", "dJ", "dK", "dL", "dN", "dOhm", "dPa", "dS",
+    "dT", "dV", "dW", "dWb", "da", "daA", "daC", "daF", "daH", "daHz",
+    "daJ", "daK", "daL", "daN", "daOhm", "daPa", "daS", "daT", "daV", "daW",
+    "daWb", "daa", "daarcmin", "daarcsec", "dacd", "dad", "dadeg", "daeV", "dag", "dah",
+    "dalm", "dalx", "dam", "damin", "damol", "darad", "darcmin", "darcsec", "das", "dasr",
+    "dayr", "dcd", "dd", "ddeg", "deV", "decigram", "decihour", "decilumen", "decilux", "decimeter",
+    "deciminute", "decimole", "deciradian", "decisecond", "decisteradian", "deciyear", "deg", "eV", "fA", "fC",
+    "fF", "fH", "fHz", "fJ", "fK", "fL", "fN", "fOhm", "fPa", "fS",
+    "fT", "fV", "fW", "fWb", "fa", "farcmin", "farcsec", "fcd", "fd", "fdeg",
+    "feV", "femtogram", "femtohour", "femtolumen", "femtolux", "femtometer", "femtominute", "femtomole", "femtoradian", "femtosecond",
+    "femtosteradian", "femtoyear", "fortnight", "g", "h", "hA", "hC", "hF", "hH", "hHz",
+    "hJ", "hK", "hL", "hN", "hOhm", "hPa", "hS", "hT", "hV", "hW",
+    "hWb", "ha", "harcmin", "harcsec", "hcd", "hd", "hdeg", "heV", "hectogram", "hectohour",
+    "hectolumen", "hectolux", "hectometer", "hectominute", "hectomole", "hectoradian", "hectosecond", "hectosteradian", "hectoyear", "hourangle",
+    "kA", "kC", "kF", "kH", "kHz", "kJ", "kK", "kL", "kN", "kOhm",
+    "kPa", "kS", "kT", "kV", "kW", "kWb", "ka", "karcmin", "karcsec", "kcd",
+    "kd", "kdeg", "keV", "kg", "kh", "kilolumen", "kilolux", "kilometer", "kilominute", "kilomole",
+    "kiloradian", "kilosecond", "kilosteradian", "kiloyear", "lm", "lux", "m", "mA", "mAA", "mC",
+    "mF", "mH", "mHz", "mJ", "mK", "mL", "mN", "mOhm", "mPa", "mS",
+    "mT", "mV", "mW", "mWb", "ma", "marcmin", "marcsec", "mas", "mcd", "md",
+    "mdeg", "meV", "mg", "mh", "microFarad", "microHenry", "microHertz", "microJoule", "microKelvin", "microNewton",
+    "microOhm", "microPascal", "microSiemens", "microTesla", "microVolt", "microWatt", "microWeber", "microamp", "microannum", "microarcminute",
+    "microarcsecond", "microcandela", "microcoulomb", "microday", "microdegree", "microelectronvolt", "microgram", "microhour", "microliter", "microlumen",
+    "microlux", "micrometer", "microminute", "micromole", "micron", "microradian", "microsecond", "microsteradian", "microyear", "millilumen",
+    "millilux", "millimeter", "milliminute", "millimole", "milliradian", "millisecond", "millisteradian", "milliyear", "min", "mol",
+    "nA", "nC", "nF", "nH", "nHz", "nJ", "nK", "nL", "nN", "nOhm",
+    "nPa", "nS", "nT", "nV", "nW", "nWb", "na", "nanoarcminute", "nanoarcsecond", "nanocandela",
+    "nanoday", "nanodegree", "nanoelectronvolt", "nanogram", "nanohour", "nanolumen", "nanolux", "nanometer", "nanominute", "nanomole",
+    "nanoradian", "nanosecond", "nanosteradian", "nanoyear", "pA", "pC", "pF", "pH", "pHz", "pJ",
+    "pK", "pL", "pN", "pOhm", "pPa", "pS", "pT", "pV", "pW", "pWb",
+    "pa", "parcmin", "parcsec", "pcd", "pct", "pd", "pdeg", "peV", "petaannum", "pg",
+    "picohour", "picolumen", "picolux", "picometer", "picominute", "picomole", "picoradian", "picosecond", "picosteradian", "picoyear",
+    "qA", "qC", "qF", "qH", "qHz", "qJ", "qK", "qL", "qN", "qOhm",
+    "qPa", "qS", "qT", "qV", "qW", "qWb", "qa", "qarcmin", "qarcsec", "qcd",
+    "qd", "qdeg", "qeV", "qg", "qh", "qlm", "qlx", "qm", "qmin", "qmol",
+    "qrad", "qs", "qsr", "quectoyear", "rA", "rC", "rF", "rH", "rHz", "rJ",
+    "rK", "rL", "rN", "rOhm", "rPa", "rS", "rT", "rV", "rW", "rWb",
+    "ra", "rad", "rarcmin", "rarcsec", "rcd", "rd", "rdeg", "reV", "rg", "rh",
+    "rlm", "rlx", "rm", "rmin", "rmol", "rontoradian", "rontosecond", "rontosteradian", "rontoyear", "s",
+    "sday", "sr", "t", "uas", "week", "yA", "yC", "yF", "yH", "yHz",
+    "yJ", "yK", "yL", "yN", "yOhm", "yPa", "yS", "yT", "yV", "yW",
+    "yWb", "ya", "yarcmin", "yarcsec", "ycd", "ydeg", "yeV", "year", "yg", "yh",
+    "ylm", "ylx", "ym", "ymin", "ymol", "yoctoday", "yoctoradian", "yoctosecond", "yoctosteradian", "yoctoyear",
+    "zA", "zC", "zF", "zH", "zHz", "zJ", "zK", "zL", "zN", "zOhm",
+    "zPa", "zS", "zT", "zV", "zW", "zWb", "za", "zarcmin", "zarcsec", "zcd",
+    "zd", "zdeg", "zeV", "zeptogram", "zeptohour", "zeptolumen", "zeptolux", "zeptometer", "zeptominute", "zeptomole",
+    "zeptoradian", "zeptosecond", "zeptosteradian", "zeptoyear", "Ba", "Bi", "D", "EBa", "ED", "EG",
+    "EGal", "EOe", "EP", "ESt", "Edyn", "Eerg", "Ek", "Fr", "G", "GBa",
+    "GD", "GG", "GGal", "GOe", "GP", "GSt", "Gal", "Gdyn", "Gerg", "Gk",
+    "Kayser", "MBa", "MD", "MG", "MGal", "MOe", "MP", "MSt", "Maxwell", "Mdyn",
+    "Merg", "Mk", "Oe", "P", "PBa", "PD", "PG", "PGal", "POe", "PP",
+    "PSt", "Pdyn", "Perg", "Pk", "QBa", "QD", "QG", "QGal", "QOe", "QP",
+    "QSt", "Qdyn", "Qerg", "Qk", "RBa", "RD", "RG", "RGal", "ROe", "RP",
+    "RSt", "Rdyn", "Rerg", "Rk", "St", "TBa", "TD", "TG", "TGal", "TOe",
+    "TP", "TSt", "Tdyn", "Terg", "Tk", "YBa", "YD", "YG", "YGal", "YOe",
+    "YP", "YSt", "Ydyn", "Yerg", "Yk", "ZBa", "ZD", "ZG", "ZGal", "ZOe",
+    "ZP", "ZSt", "Zdyn", "Zerg", "Zk", "aBa", "aD", "aG", "aGal", "aOe",
+    "aP", "aSt", "abC", "adyn", "aerg", "ak", "cBa", "cD", "cG", "cGal",
+    "cOe", "cP", "cSt", "cdyn", "centiKayser", "cerg", "dBa", "dD", "dG", "dGal",
+    "dOe", "dP", "dSt", "daBa", "daD", "daG", "daGal", "daOe", "daP", "daSt",
+    "dadyn", "daerg", "dak", "ddyn", "deciKayser", "derg", "dyn", "erg", "fBa", "fD",
+    "fG", "fGal", "fOe", "fP", "fSt", "fdyn", "femtoKayser", "ferg", "hBa", "hD",
+    "hG", "hGal", "hOe", "hP", "hSt", "hdyn", "hectoKayser", "herg", "kBa", "kD",
+    "kG", "kGal", "kOe", "kP", "kSt", "kdyn", "kerg", "kiloKayser", "mBa", "mD",
+    "mG", "mGal", "mOe", "mP", "mSt", "mdyn", "merg", "microBarye", "microDebye", "microGauss",
+    "microKayser", "microOersted", "microdyne", "microgal", "micropoise", "microstokes", "milliKayser", "nBa", "nD", "nG",
+    "nGal", "nOe", "nP", "nSt", "nanoKayser", "nanodyne", "nerg", "pBa", "pD", "pG",
+    "pGal", "pOe", "pP", "pSt", "pdyn", "perg", "picoKayser", "qBa", "qD", "qG",
+    "qGal", "qOe", "qP", "qSt", "qdyn", "qerg", "qk", "rBa", "rD", "rG",
+    "rGal", "rOe", "rP", "rSt", "rdyn", "rerg", "rk", "statA", "uerg", "yBa",
+    "yD", "yG", "yGal", "yOe", "yP", "ySt", "ydyn", "yerg", "yk", "zBa",
+    "zD", "zG", "zGal", "zOe", "zP", "zSt", "zdyn", "zeptoKayser", "zerg", "AU",
+    "DN", "EAU", "EJy", "ER", "ERy", "Eadu", "Ebeam", "Ebin", "Echan", "Ecount",
+    "Elyr", "Epc", "Eph", "GAU", "GJy", "GR", "GRy", "Gadu", "Gbeam", "Gbin",
+    "Gchan", "Gcount", "Glyr", "Gpc", "Gph", "Jansky", "L_sun", "MAU", "MJy", "MR",
+    "MRy", "M_earth", "M_jup", "M_sun", "Madu", "Mbeam", "Mbin", "Mchan", "Mcount", "Mlyr",
+    "Mpc", "Mph", "PAU", "PJy", "PR", "PRy", "Padu", "Pbeam", "Pbin", "Pchan",
+    "Pcount", "Plyr", "Ppc", "Pph", "QAU", "QJy", "QR", "QRy", "Qadu", "Qbeam",
+    "Qbin", "Qchan", "Qcount", "Qlyr", "Qpc", "Qph", "R", "RAU", "RJy", "RR",
+    "RRy", "R_earth", "R_jup", "R_sun", "Radu", "Rbeam", "Rbin", "Rchan", "Rcount", "Rlyr",
+    "Rpc", "Rph", "Ry", "Sun", "TAU", "TJy", "TR", "TRy", "Tadu", "Tbeam",
+    "Tbin", "Tchan", "Tcount", "Tlyr", "Tpc", "Tph", "YAU", "YJy", "YR", "YRy",
+    "Yadu", "Ybeam", "Ybin", "Ychan", "Ycount", "Ylyr", "Ypc", "Yph", "ZAU", "ZJy",
+    "ZR", "ZRy", "Zadu", "Zbeam", "Zbin", "Zchan", "Zcount", "Zlyr", "Zpc", "Zph",
+    "aAU", "aJy", "aR", "aRy", "aadu", "abeam", "abin", "achan", "acount", "adu",
+    "alyr", "apc", "aph", "beam", "bin", "cAU", "cJy", "cR", "cRy", "cadu",
+    "cbeam", "cbin", "cchan", "ccount", "centilightyear", "centiparsec", "centiphoton", "chan", "count", "dAU",
+    "dJy", "dR", "dRy", "daAU", "daJy", "daR", "daRy", "daadu", "dabeam", "dabin",
+    "dachan", "dacount", "dadu", "dalyr", "dapc", "daph", "dbeam", "dbin", "dchan", "dcount",
+    "decilightyear", "deciparsec", "deciphoton", "electron", "fAU", "fJy", "fR", "fRy", "fadu", "fbeam",
+    "fbin", "fchan", "fcount", "femtolightyear", "femtoparsec", "femtophoton", "hAU", "hJy", "hR", "hRy",
+    "hadu", "hbeam", "hbin", "hchan", "hcount", "hectolightyear", "hectoparsec", "hectophoton", "kAU", "kJy",
+    "kR", "kRy", "kadu", "kbeam", "kbin", "kchan", "kcount", "kilolightyear", "kiloparsec", "kilophoton",
+    "lightsecond", "lightyear", "mAU", "mJy", "mR", "mRy", "madu", "mbeam", "mbin", "mchan",
+    "mcount", "microJansky", "microRayleigh", "microastronomical_unit", "microcount", "microlightyear", "microparsec", "microphoton", "microrydberg", "millilightyear",
+    "milliparsec", "milliphoton", "nAU", "nJy", "nR", "nRy", "nadu", "nanocount", "nanolightyear", "nanoparsec",
+    "nanophoton", "nbeam", "nbin", "nchan", "pAU", "pJy", "pR", "pRy", "padu", "parsec",
+    "pbeam", "pbin", "pchan", "ph", "picocount", "picolightyear", "picoparsec", "picophoton", "qAU", "qJy",
+    "qR", "qRy", "qadu", "qbeam", "qbin", "qchan", "qcount", "qlyr", "qpc", "qph",
+    "rAU", "rJy", "rR", "rRy", "radu", "rbeam", "rbin", "rchan", "rcount", "rlyr",
+    "rontoparsec", "rontophoton", "uadu", "ubeam", "ubin", "uchan", "yAU", "yJy", "yR", "yRy",
+    "yadu", "ybeam", "ybin", "ychan", "ycount", "ylyr", "yoctoparsec", "yoctophoton", "zAU", "zJy",
+    "zR", "zRy", "zadu", "zbeam", "zbin", "zchan", "zcount", "zeptolightyear", "zeptoparsec", "zeptophoton",
+)
@@ -23,12 +23,16 @@ from typing import Mapping
 
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.variable_symbol import VariableSymbol, BlockType, VariableType
+from pynestml.utils.compilation_context import ContextScopedMeta
 
 
-class PredefinedVariables:
+class PredefinedVariables(metaclass=ContextScopedMeta):
     """
     This class is used to store all predefined variables as generally available.
     """
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["name2variable"]
+
     name2variable: Mapping[str, VariableSymbol] = {}
     E_CONSTANT: str = 'e'
     PI_CONSTANT: str = 'pi'
@@ -19,7 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import operator
+
 from pynestml.symbols.type_symbol import TypeSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
@@ -27,6 +30,17 @@ from pynestml.utils.unit_type import UnitType
 
 
 class UnitTypeSymbol(TypeSymbol):
+    r"""
+    Type symbol of a physical unit.
+
+    Arithmetic on units and the computation of conversion factors are carried out by astropy, which is slow compared to the rest of the type checks. The results are therefore memoised, keyed by the astropy units involved, so that astropy is only invoked the first time that a combination of units is encountered. As the memoised results of arithmetic are the names of the resulting types, which are looked up in the active compilation context, the memo tables are shared between contexts.
+    """
+
+    # map from (operator, astropy unit, astropy unit or power) to the name of the resulting type
+    _operation_results = {}   # type: Dict[Tuple[Callable, Any, Any], str]
+
+    # map from (astropy unit, astropy unit) to the conversion factor from the first to the second unit
+    _conversion_factors = {}   # type: Dict[Tuple[Any, Any], Optional[float]]
 
     @property
     def astropy_unit(self):
@@ -64,8 +78,7 @@ class UnitTypeSymbol(TypeSymbol):
         return self.binary_operation_not_defined_error('*', other)
 
     def multiply_by(self, other):
-        from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit * other.astropy_unit)
+        return self._get_operation_result(operator.mul, self.astropy_unit, other.astropy_unit)
 
     def __truediv__(self, other):
         from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -81,8 +94,7 @@ class UnitTypeSymbol(TypeSymbol):
         return self.__truediv__(other)
 
     def divide_by(self, other):
-        from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit / other.astropy_unit)
+        return self._get_operation_result(operator.truediv, self.astropy_unit, other.astropy_unit)
 
     def __neg__(self):
         return self
@@ -103,8 +115,37 @@ class UnitTypeSymbol(TypeSymbol):
         return self.binary_operation_not_defined_error('**', power)
 
     def to_the_power_of(self, power):
+        return self._get_operation_result(operator.pow, self.astropy_unit, power)
+
+    @classmethod
+    def _get_operation_result(cls, operation: Callable, unit, operand) -> Optional[TypeSymbol]:
+        """
+        Returns the type resulting from an arithmetic operation on a unit, registering the resulting unit if it has not been seen before.
+        :param operation: the operation, one of operator.mul, operator.truediv and operator.pow
+        :param unit: the astropy unit of the left-hand side
+        :param operand: the astropy unit of the right-hand side, or the power
+        :return: the resulting type symbol
+        """
         from pynestml.symbols.predefined_types import PredefinedTypes
-        return PredefinedTypes.get_type(self.astropy_unit ** power)
+        key = (operation, unit, operand)
+        try:
+            type_name = cls._operation_results.get(key)
+        except TypeError:
+            # quantities are not hashable
+            return PredefinedTypes.get_type(operation(unit, operand))
+
+        if type_name is not None:
+            result = PredefinedTypes.get_type(type_name)
+            if result is not None:
+                return result
+
+            # the resulting unit has not been registered in the active compilation context yet
+
+        result = PredefinedTypes.get_type(operation(unit, operand))
+        if result is not None:
+            cls._operation_results[key] = result.get_symbol_name()
+
+        return result
 
     def __add__(self, other):
         from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
@@ -153,11 +194,22 @@ class UnitTypeSymbol(TypeSymbol):
         """
         Calculates the conversion factor from _convertee_unit to target_unit. Behaviour is only well-defined if both units have the same physical base type.
         """
+        key = (_from, to)
+        try:
+            if key in cls._conversion_factors.keys():
+                return cls._conversion_factors[key]
+        except TypeError:
+            # quantities are not hashable
+            key = None
+
         try:
             factor = (_from / to).si.scale
         except BaseException:
             # this can fail in case of e.g. trying to convert from "1/s" to "2/s"
-            return None
+            factor = None
+
+        if key is not None:
+            cls._conversion_factors[key] = factor
 
         return factor
 
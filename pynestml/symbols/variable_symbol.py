@@ -199,6 +199,14 @@ class VariableSymbol(Symbol):
         """
         return self.declaring_expression
 
+    def set_declaring_expression(self, expression):
+        """
+        Updates the rhs declaring the value of this symbol.
+        :param expression: a new declaring rhs.
+        :type expression: ASTExpression or ASTSimpleExpression
+        """
+        self.declaring_expression = expression
+
     def has_declaring_expression(self) -> bool:
         """
         Indicates whether a declaring rhs is present.
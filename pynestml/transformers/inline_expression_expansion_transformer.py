@@ -29,6 +29,7 @@ from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
+from pynestml.symbols.symbol import SymbolKind
 from pynestml.transformers.transformer import Transformer
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
@@ -91,8 +92,12 @@ class InlineExpressionExpansionTransformer(Transformer):
                 target.expression = ModelParser.parse_expression(target_definition)
                 target.expression.update_scope(source.get_scope())
                 target.expression.parent_ = old_parent
+                target.tree_modified()
                 target.expression.accept(ASTParentVisitor())
                 target.expression.accept(ASTSymbolTableVisitor())
+                symbol = target.get_scope().resolve_to_symbol(target.get_variable_name(), SymbolKind.VARIABLE)
+                if symbol is not None:
+                    symbol.set_declaring_expression(target.expression)
 
                 def log_set_source_position(node):
                     if node.get_source_position().is_added_source_position():
@@ -130,6 +135,7 @@ class InlineExpressionExpansionTransformer(Transformer):
                     target.rhs = ModelParser.parse_expression(target_definition)
                     target.update_scope(m.get_scope())
                     target.rhs.parent_ = old_parent
+                    target.tree_modified()
                     target.rhs.accept(ASTParentVisitor())
                     target.accept(ASTSymbolTableVisitor())
 
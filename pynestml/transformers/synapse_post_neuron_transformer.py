@@ -27,11 +27,13 @@ from pynestml.cocos.co_cos_manager import CoCosManager
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
+from pynestml.meta_model.ast_external_variable import ASTExternalVariable
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbol_table.scope import Scope, ScopeType
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.variable_symbol import BlockType
 from pynestml.transformers.transformer import Transformer
@@ -39,7 +41,6 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.string_utils import removesuffix
-from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -242,11 +243,13 @@ class SynapsePostNeuronTransformer(Transformer):
         new_neuron = neuron.clone()
         new_synapse = synapse.clone()
 
-        new_neuron.parent_ = None    # set root element
-        new_neuron.accept(ASTParentVisitor())
-        new_synapse.parent_ = None    # set root element
-        new_synapse.accept(ASTParentVisitor())
-        new_neuron.accept(ASTSymbolTableVisitor())
+        # the neuron is only extended by declarations moved from the synapse. Rather than building the symbol table of the whole neuron here, give its blocks a new scope that is enclosed in the scope of the original neuron, so that symbols declared during the transformation do not leak into the original neuron, while the symbols of the original neuron are still resolved. The scope is not global, as symbols are only resolved in enclosing scopes from scopes that are not global. The symbol table of the new neuron is built at the end.
+        new_neuron_scope = Scope(scope_type=ScopeType.UPDATE, enclosing_scope=neuron.get_scope(), source_position=neuron.get_source_position())
+        new_neuron.update_scope(new_neuron_scope)
+        new_neuron.get_body().update_scope(new_neuron_scope)
+        for body_element in new_neuron.get_body().get_body_elements():
+            body_element.update_scope(new_neuron_scope)
+
         new_synapse.accept(ASTSymbolTableVisitor())
 
         assert len(new_neuron.get_equations_blocks()) <= 1, "Only one equations block per neuron supported for now."
@@ -407,6 +410,7 @@ class SynapsePostNeuronTransformer(Transformer):
         if not new_neuron.get_equations_blocks():
             ASTUtils.create_equations_block(new_neuron)
 
+        moved_decls = []
         post_port_names = []
         for input_block in new_synapse.get_input_blocks():
             for port in input_block.get_input_ports():
@@ -422,6 +426,7 @@ class SynapsePostNeuronTransformer(Transformer):
                                                            new_neuron.get_equations_blocks()[0],
                                                            var_name_suffix,
                                                            mode="move")
+            moved_decls.extend(decls)
             ASTUtils.add_suffix_to_variable_names2(post_port_names + syn_to_neuron_state_vars + syn_to_neuron_params, decls, var_name_suffix)
             ASTUtils.replace_post_moved_variable_names(decls, [name + var_name_suffix for name in post_connected_continuous_input_ports], post_variable_names)
             ASTUtils.remove_state_var_from_integrate_odes_calls(new_synapse, state_var)
@@ -438,12 +443,12 @@ class SynapsePostNeuronTransformer(Transformer):
         for state_var in syn_to_neuron_state_vars:
             Logger.log_message(None, -1, "Moving state variables for equation(s) " + str(state_var),
                                None, LoggingLevel.INFO)
-            ASTUtils.move_decls(var_name=state_var,
-                                from_block=new_synapse.get_state_blocks()[0],
-                                to_block=new_neuron.get_state_blocks()[0],
-                                var_name_suffix=var_name_suffix,
-                                block_type=BlockType.STATE,
-                                mode="move")
+            moved_decls.extend(ASTUtils.move_decls(var_name=state_var,
+                                                   from_block=new_synapse.get_state_blocks()[0],
+                                                   to_block=new_neuron.get_state_blocks()[0],
+                                                   var_name_suffix=var_name_suffix,
+                                                   block_type=BlockType.STATE,
+                                                   mode="move"))
 
         #
         #     mark variables in the neuron pertaining to synapse postsynaptic ports
@@ -470,7 +475,9 @@ class SynapsePostNeuronTransformer(Transformer):
             mark_node.accept(ASTHigherOrderVisitor(lambda x: mark_post_port(x)))
             return post_ports
 
-        mark_post_ports(new_neuron, new_synapse, new_neuron)
+        # only the declarations moved from the synapse can refer to its postsynaptic ports
+        for decl in moved_decls:
+            mark_post_ports(new_neuron, new_synapse, decl)
 
         #
         #    move statements in post receive block from synapse to new_neuron
@@ -502,7 +509,7 @@ class SynapsePostNeuronTransformer(Transformer):
                                 stmt.small_stmt.get_assignment().get_variable().scope = new_neuron.scope
 
                         for stmt in collected_on_post_stmts:
-                            stmts.pop(stmts.index(stmt))
+                            post_receive_block.get_stmts_body().delete_stmt(stmt)
 
         new_neuron.extra_on_emit_spike_stmts_from_synapse = collected_on_post_stmts
 
@@ -602,10 +609,14 @@ class SynapsePostNeuronTransformer(Transformer):
         #    add modified versions of neuron and synapse to list
         #
 
-        new_neuron.accept(ASTParentVisitor())
-        new_synapse.accept(ASTParentVisitor())
         ast_symbol_table_visitor = ASTSymbolTableVisitor()
         new_neuron.accept(ast_symbol_table_visitor)
+
+        # the external variables refer to the neuron by the scope it had during the transformation
+        for external_variable in ASTUtils.get_all(new_synapse, ASTExternalVariable):
+            if external_variable._altscope is new_neuron_scope:
+                external_variable.update_alt_scope(new_neuron.get_scope())
+
         new_synapse.accept(ast_symbol_table_visitor)
 
         ASTUtils.update_blocktype_for_common_parameters(new_synapse)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+#
+# arithmetic_expression_parser.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import List, Optional, Tuple, Union
+
+import re
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.ast_source_location import ASTSourceLocation
+
+
+class ArithmeticExpressionParser:
+    r"""
+    Builds expression ASTs directly from strings that contain purely arithmetic expressions, without instantiating the ANTLR lexer and parser.
+
+    This is used to convert the expressions returned by ODE-toolbox (update expressions, propagators, etc.), which consist only of numeric literals, variables, function calls, parentheses and the operators ``+``, ``-``, ``*``, ``/``, ``%`` and ``**``. The resulting AST is identical to the one that the ANTLR parser builds for the same string, including operator precedence and associativity, and explicit parentheses.
+
+    For any string outside of this subset (for instance, containing physical units, comparison or logical operators, differential orders or keywords), ``parse()`` returns None, and the caller should fall back to the full parser.
+    """
+
+    _token_regex = re.compile(r"[ \t]*(?:(?P<number>(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)(?:[eE][+-]?[0-9]+)?)"
+                              r"|(?P<name>[a-zA-Z_$][a-zA-Z_0-9$]*)"
+                              r"|(?P<op>\*\*|[-+*/%(),]))")
+
+    # NESTML keywords are lexed as separate tokens, and cannot be used as a variable or function name
+    _keywords = frozenset([name.strip("'") for name in PyNestMLLexer.literalNames if name.startswith("'")]
+                          + ["true", "True", "false", "False"])
+
+    # binding power of binary operators; corresponds to the order of alternatives in the ``expression`` grammar rule
+    _POW_PRECEDENCE = 10
+    _UNARY_PRECEDENCE = 9
+    _binary_operator_precedence = {"**": _POW_PRECEDENCE,
+                                   "*": 8,
+                                   "/": 8,
+                                   "%": 8,
+                                   "+": 7,
+                                   "-": 7}
+
+    @classmethod
+    def _tokenize(cls, string: str) -> Optional[List[Tuple[str, str]]]:
+        if not string or string[0].isspace():
+            return None    # leading whitespace is lexed as a NEWLINE token
+
+        tokens = []
+        pos = 0
+        string = string.rstrip(" \t")
+        while pos < len(string):
+            match = cls._token_regex.match(string, pos)
+            if match is None:
+                return None
+
+            kind = match.lastgroup
+            text = match.group(kind)
+            if kind == "name" and text in cls._keywords:
+                return None
+
+            if tokens and tokens[-1][0] in ["number", "name"] and kind in ["number", "name"]:
+                return None    # e.g. a literal with a physical unit
+
+            tokens.append((kind, text))
+            pos = match.end()
+
+        return tokens
+
+    @classmethod
+    def parse(cls, string: str) -> Optional[Union[ASTExpression, ASTSimpleExpression]]:
+        r"""
+        Parse an arithmetic expression.
+        :param string: the expression string
+        :return: the expression AST, or None if the string is not a purely arithmetic expression
+        """
+        tokens = cls._tokenize(string)
+        if not tokens:
+            return None
+
+        parser = cls(tokens)
+        try:
+            expr = parser._parse_expression(0)
+        except ValueError:
+            return None
+
+        if parser.pos != len(tokens):
+            return None
+
+        return expr
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+        return None, None
+
+    def _next(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ValueError("Unexpected end of expression")
+
+        self.pos += 1
+        return self.tokens[self.pos - 1]
+
+    def _expect(self, text: str) -> None:
+        if self._next() != ("op", text):
+            raise ValueError("Expected \"" + text + "\"")
+
+    def _parse_expression(self, min_precedence: int) -> Union[ASTExpression, ASTSimpleExpression]:
+        # precedence climbing, mirroring how ANTLR resolves the left-recursive ``expression`` rule
+        lhs = self._parse_primary()
+        while True:
+            kind, text = self._peek()
+            if kind != "op" or text not in self._binary_operator_precedence.keys():
+                return lhs
+
+            precedence = self._binary_operator_precedence[text]
+            if precedence < min_precedence:
+                return lhs
+
+            self._next()
+            binary_operator = ASTNodeFactory.create_ast_arithmetic_operator(is_times_op=text == "*",
+                                                                            is_div_op=text == "/",
+                                                                            is_modulo_op=text == "%",
+                                                                            is_plus_op=text == "+",
+                                                                            is_minus_op=text == "-",
+                                                                            is_pow_op=text == "**",
+                                                                            source_position=ASTSourceLocation.get_added_source_position())
+            if text == "**":
+                rhs = self._parse_expression(precedence)    # right associative
+            else:
+                rhs = self._parse_expression(precedence + 1)
+
+            lhs = ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=binary_operator, rhs=rhs,
+                                                                source_position=ASTSourceLocation.get_added_source_position())
+
+    def _parse_primary(self) -> Union[ASTExpression, ASTSimpleExpression]:
+        kind, text = self._next()
+        if kind == "op" and text == "(":
+            expr = self._parse_expression(0)
+            self._expect(")")
+            return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=expr,
+                                                        source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind == "op" and text in ["+", "-"]:
+            unary_operator = ASTNodeFactory.create_ast_unary_operator(is_unary_plus=text == "+",
+                                                                      is_unary_minus=text == "-",
+                                                                      source_position=ASTSourceLocation.get_added_source_position())
+            expr = self._parse_expression(self._UNARY_PRECEDENCE)
+            return ASTNodeFactory.create_ast_expression(unary_operator=unary_operator, expression=expr,
+                                                        source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind == "number":
+            if re.fullmatch(r"[0-9]+", text):
+                numeric_literal = int(text)
+            else:
+                numeric_literal = float(text)
+
+            return ASTNodeFactory.create_ast_simple_expression(numeric_literal=numeric_literal,
+                                                               source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind == "name":
+            if self._peek() == ("op", "("):
+                self._next()
+                args = []
+                if self._peek() != ("op", ")"):
+                    args.append(self._parse_expression(0))
+                    while self._peek() == ("op", ","):
+                        self._next()
+                        args.append(self._parse_expression(0))
+
+                self._expect(")")
+                function_call = ASTNodeFactory.create_ast_function_call(callee_name=text, args=args,
+                                                                        source_position=ASTSourceLocation.get_added_source_position())
+                return ASTNodeFactory.create_ast_simple_expression(function_call=function_call,
+                                                                   source_position=ASTSourceLocation.get_added_source_position())
+
+            variable = ASTNodeFactory.create_ast_variable(name=text, source_position=ASTSourceLocation.get_added_source_position())
+            return ASTNodeFactory.create_ast_simple_expression(variable=variable,
+                                                               source_position=ASTSourceLocation.get_added_source_position())
+
+        raise ValueError("Unexpected token \"" + text + "\"")
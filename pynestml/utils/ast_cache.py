@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+# ast_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Optional, Tuple
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+import pynestml
+from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class _ASTPickler(pickle.Pickler):
+    r"""Pickler that stores references to predefined symbols and units by name, rather than by value."""
+
+    def __init__(self, file, predefined_ids: Dict[int, Tuple[Tuple[str, str], Any]]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.predefined_ids = predefined_ids
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, str]]:
+        if id(obj) in self.predefined_ids.keys():
+            pid, predefined_obj = self.predefined_ids[id(obj)]
+            if predefined_obj is obj:
+                return pid
+
+        return None
+
+
+class _ASTUnpickler(pickle.Unpickler):
+    r"""Unpickler that resolves references to predefined symbols and units to the instances of the current process."""
+
+    def persistent_load(self, pid: Tuple[str, str]) -> Any:
+        kind, name = pid
+        obj = ASTCache.get_predefined_registries()[kind].get(name)
+        if obj is None:
+            raise pickle.UnpicklingError("Predefined " + kind + " \"" + name + "\" does not exist")
+
+        return obj
+
+
+class ASTCache:
+    r"""
+    Persistent cache of parsed models.
+
+    Each entry contains the ``ASTNestMLCompilationUnit`` of one NESTML file, after the symbol tables have been built, in pickled form. The key is a hash of the file contents, the PyNestML version, the Python version and the format version of the cache entries, so that entries are automatically invalidated when any of these change.
+
+    Predefined types, units, functions and variables are singletons that are compared by identity throughout the toolchain. They are therefore not stored by value, but by name, and resolved to the instances of the current process upon loading. Types and units that were created while building the symbol tables (for instance, for a compound physical unit that occurs in the model) are stored by value, and are registered again upon loading.
+    """
+
+    # to be incremented whenever the layout of the stored objects changes, e.g. when attributes are added to the AST or symbol table classes
+    format_version = 4
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.hits = 0
+        self.misses = 0
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    @classmethod
+    def get_predefined_registries(cls) -> Dict[str, Dict[str, Any]]:
+        return {"type": PredefinedTypes.get_types(),
+                "unit": PredefinedUnits.get_units(),
+                "function": PredefinedFunctions.get_function_symbols(),
+                "variable": PredefinedVariables.get_variables()}
+
+    @classmethod
+    def get_predefined_ids(cls) -> Dict[int, Tuple[Tuple[str, str], Any]]:
+        r"""
+        Take a snapshot of the predefined symbols and units that currently exist. Should be called before parsing, and the result passed to ``put()``.
+        :return: a mapping from object id to a tuple of the (kind, name) reference and the object itself (which keeps the object alive, so that its id cannot be reused when it is replaced in the registry)
+        """
+        predefined_ids = {}
+        for kind, registry in cls.get_predefined_registries().items():
+            for name, obj in registry.items():
+                predefined_ids[id(obj)] = ((kind, name), obj)
+
+        return predefined_ids
+
+    def get_key(self, model_source: str) -> str:
+        r"""
+        Compute the cache key for the contents of a NESTML file.
+        :param model_source: the contents of the file
+        :return: a hexadecimal digest string
+        """
+        h = hashlib.sha256()
+        h.update(("pynestml " + pynestml.__version__ + "\n").encode("utf-8"))
+        h.update(("python " + ".".join(str(x) for x in sys.version_info[:3]) + "\n").encode("utf-8"))
+        h.update(("format " + str(self.format_version) + "\n").encode("utf-8"))
+        h.update(model_source.encode("utf-8"))
+
+        return h.hexdigest()
+
+    def _get_filename(self, key: str) -> str:
+        return os.path.join(self.path, key + ".pickle")
+
+    def get(self, key: str) -> Optional[ASTNestMLCompilationUnit]:
+        r"""
+        Load a compilation unit from the cache.
+        :param key: the cache key, as returned by ``get_key()``
+        :return: the compilation unit, or None if the key is not present or the entry could not be loaded
+        """
+        try:
+            with open(self._get_filename(key), "rb") as f:
+                entry = _ASTUnpickler(f).load()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            # a corrupt or incompatible entry is treated as a miss; it will be overwritten by ``put()``
+            Logger.log_message(None, None, "Could not load parsed model from cache (key: " + key + "): " + str(e), None, LoggingLevel.DEBUG)
+            self.misses += 1
+            return None
+
+        for unit in entry["units"]:
+            if not PredefinedUnits.is_unit(unit.get_name()):
+                PredefinedUnits.register_unit(unit)
+
+        for type_symbol in entry["types"]:
+            PredefinedTypes.register_type(type_symbol)
+
+        self.hits += 1
+        Logger.log_message(None, None, "Loaded parsed model from cache (key: " + key + ")", None, LoggingLevel.DEBUG)
+
+        return entry["ast"]
+
+    def put(self, key: str, ast: ASTNestMLCompilationUnit, predefined_ids: Dict[int, Tuple[Tuple[str, str], Any]]) -> None:
+        r"""
+        Store a compilation unit in the cache.
+        :param key: the cache key, as returned by ``get_key()``
+        :param ast: the compilation unit
+        :param predefined_ids: the predefined symbols and units as they existed before parsing, as returned by ``get_predefined_ids()``
+        """
+        registries = self.get_predefined_registries()
+        entry = {"ast": ast,
+                 "types": [obj for obj in registries["type"].values() if id(obj) not in predefined_ids],
+                 "units": [obj for obj in registries["unit"].values() if id(obj) not in predefined_ids]}
+
+        fd, tmp_fn = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                _ASTPickler(f, predefined_ids).dump(entry)
+            os.replace(tmp_fn, self._get_filename(key))    # atomic, so concurrent readers never see partial entries
+        except (OSError, pickle.PicklingError, RecursionError) as e:
+            if os.path.exists(tmp_fn):
+                os.remove(tmp_fn)
+
+            Logger.log_message(None, None, "Could not store parsed model in cache (key: " + key + "): " + str(e), None, LoggingLevel.DEBUG)
+
+    def clear(self) -> None:
+        r"""
+        Remove all entries from the cache and reset the statistics.
+        """
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".pickle"):
+                os.remove(entry.path)
+
+        self.hits = 0
+        self.misses = 0
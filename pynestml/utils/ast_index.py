@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# ast_index.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type, Union
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import itemgetter
+
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.variable_symbol import BlockType
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+class ASTIndex:
+    r"""
+    Index of the nodes of a model, which allows the ``ASTUtils`` helpers to find nodes without traversing the tree.
+
+    Nodes are indexed by type, variables by name, function calls by the name of the called function, and declarations by the names of the variables that they declare. Each node has a position, which is the order in which an ``ASTVisitor`` visits the nodes of the model, and the index records the range of positions spanned by the subtree of each node. Queries can therefore be restricted to the subtree of any node in the model, and return the nodes in the same order as a traversal of that subtree.
+
+    In addition, the variables declared in the state, parameters and internals blocks of the model and its inline expressions are mapped by name, so that the templates can resolve variables in constant time.
+
+    Indices are only used within ``ASTIndex.enabled()``, for instance while the code generator renders the templates. This context only applies to the current thread (or asyncio task), so that compilations that run concurrently in other threads, and that may be modifying their models, keep traversing the trees. The index of a model is built on the first query, and built again on the first query after any tree has been modified (see ``ASTNode.tree_modified()``). Outside of this context, and for nodes that are not part of a model, ``get_index()`` returns None, and the helpers traverse the tree instead.
+    """
+
+    # the indices of the models that have been queried in the current context, by id of the model, or None outside of ``ASTIndex.enabled()``
+    _indices: ContextVar[Optional[Dict[int, Tuple[ASTModel, ASTIndex]]]] = ContextVar("nestml_ast_indices", default=None)
+
+    def __init__(self, model: ASTModel):
+        r"""
+        Create an empty index; its parts are built on first use.
+        :param model: the model to index
+        """
+        self.modification_count = ASTNode.modification_count
+        self._model = model
+
+        self._subtrees: Optional[Dict[int, Tuple[int, int]]] = None
+        self._nodes_by_type: Dict[Type[ASTNode], Tuple[List[int], List[ASTNode]]] = {}
+        self._variables_by_name: Dict[str, Tuple[List[int], List[ASTVariable]]] = {}
+        self._function_calls_by_name: Dict[str, Tuple[List[int], List[ASTFunctionCall]]] = {}
+        self._declarations_by_variable_name: Dict[str, Tuple[List[int], List[ASTDeclaration]]] = {}
+        self._subclasses: Dict[Union[type, Tuple[type, ...]], List[Type[ASTNode]]] = {}
+
+        self._declared_variables: Optional[Dict[BlockType, Dict[str, Tuple[ASTVariable, ASTDeclaration]]]] = None
+        self._inline_expressions: Optional[Dict[str, ASTInlineExpression]] = None
+
+    def _index_nodes(self) -> None:
+        r"""
+        Index the nodes of the model by traversing it.
+        """
+        self._subtrees = {}
+        first_positions = []
+        n_visited = 0
+
+        def visit(node: ASTNode):
+            nonlocal n_visited
+            position = n_visited
+            n_visited += 1
+            first_positions.append(position)
+
+            ASTIndex._add(self._nodes_by_type, type(node), position, node)
+            if isinstance(node, ASTVariable):
+                ASTIndex._add(self._variables_by_name, node.get_name(), position, node)
+            elif isinstance(node, ASTFunctionCall):
+                ASTIndex._add(self._function_calls_by_name, node.get_name(), position, node)
+            elif isinstance(node, ASTDeclaration):
+                for variable_name in dict.fromkeys(variable.get_name() for variable in node.get_variables()):
+                    ASTIndex._add(self._declarations_by_variable_name, variable_name, position, node)
+
+        def endvisit(node: ASTNode):
+            # if a node occurs more than once in the tree, the subtree of its first occurrence is used
+            self._subtrees.setdefault(id(node), (first_positions.pop(), n_visited))
+
+        self._model.accept(ASTHigherOrderVisitor(visit_funcs=visit, endvisit_funcs=endvisit))
+
+    def contains(self, node: ASTNode) -> bool:
+        r"""
+        Returns whether ``node`` is visited when traversing the model, so that the index can be queried for its subtree.
+        :param node: a node
+        """
+        if self._subtrees is None:
+            self._index_nodes()
+
+        return id(node) in self._subtrees.keys()
+
+    @staticmethod
+    def _add(entries: Dict[Hashable, Tuple[List[int], List[Any]]], key: Hashable, position: int, node: ASTNode) -> None:
+        if key not in entries:
+            entries[key] = ([], [])
+
+        positions, nodes = entries[key]
+        positions.append(position)
+        nodes.append(node)
+
+    def _find(self, root: ASTNode, entries: Iterable[Tuple[List[int], List[Any]]]) -> List[Any]:
+        r"""
+        Returns the nodes from one or more index entries that are in the subtree of ``root``, in the order in which they are visited.
+        """
+        first, end = self._subtrees[id(root)]
+        found = []
+        for positions, nodes in entries:
+            start = bisect_left(positions, first)
+            stop = bisect_left(positions, end, lo=start)
+            found.append((positions[start:stop], nodes[start:stop]))
+
+        found = [(positions, nodes) for positions, nodes in found if nodes]
+        if len(found) == 0:
+            return []
+
+        if len(found) == 1:
+            return found[0][1]
+
+        return [node for _, node in sorted((pair for positions, nodes in found for pair in zip(positions, nodes)), key=itemgetter(0))]
+
+    def get_nodes(self, root: ASTNode, node_type: Union[type, Tuple[type, ...]]) -> List[ASTNode]:
+        r"""
+        Returns all nodes in the subtree of ``root`` (including ``root`` itself) that are instances of ``node_type``.
+        :param root: a node of the indexed model
+        :param node_type: a type, or a tuple of types, as for ``isinstance()``
+        :return: the nodes, in the order in which they are visited
+        """
+        if self._subtrees is None:
+            self._index_nodes()
+
+        if node_type not in self._subclasses.keys():
+            self._subclasses[node_type] = [cls for cls in self._nodes_by_type.keys() if issubclass(cls, node_type)]
+
+        return self._find(root, [self._nodes_by_type[cls] for cls in self._subclasses[node_type]])
+
+    def get_variables(self, root: ASTNode, name: str) -> List[ASTVariable]:
+        r"""
+        Returns all variables with the given name (regardless of their differential order) in the subtree of ``root``.
+        :param root: a node of the indexed model
+        :param name: the name of the variable
+        :return: the variables, in the order in which they are visited
+        """
+        if self._subtrees is None:
+            self._index_nodes()
+
+        return self._find(root, [self._variables_by_name[name]] if name in self._variables_by_name.keys() else [])
+
+    def get_function_calls(self, root: ASTNode, function_names: Iterable[str]) -> List[ASTFunctionCall]:
+        r"""
+        Returns all calls to any of the given functions in the subtree of ``root``.
+        :param root: a node of the indexed model
+        :param function_names: the names of the functions
+        :return: the function calls, in the order in which they are visited
+        """
+        if self._subtrees is None:
+            self._index_nodes()
+
+        return self._find(root, [self._function_calls_by_name[name] for name in dict.fromkeys(function_names) if name in self._function_calls_by_name.keys()])
+
+    def get_declarations(self, root: ASTNode, variable_name: str) -> List[ASTDeclaration]:
+        r"""
+        Returns all declarations of a variable with the given name (regardless of its differential order) in the subtree of ``root``.
+        :param root: a node of the indexed model
+        :param variable_name: the name of the variable
+        :return: the declarations, in the order in which they are visited
+        """
+        if self._subtrees is None:
+            self._index_nodes()
+
+        return self._find(root, [self._declarations_by_variable_name[variable_name]] if variable_name in self._declarations_by_variable_name.keys() else [])
+
+    def get_declared_variable(self, name: str, block_type: BlockType) -> Tuple[Optional[ASTVariable], Optional[ASTDeclaration]]:
+        r"""
+        Returns the first variable with the given name (regardless of its differential order) that is declared in a state, parameters or internals block of the model, and its declaration.
+        :param name: the name of the variable
+        :param block_type: ``BlockType.STATE``, ``BlockType.PARAMETERS`` or ``BlockType.INTERNALS``
+        :return: the variable and its declaration, or None and None if there is no such variable
+        """
+        if self._declared_variables is None:
+            self._declared_variables = {}
+            for _block_type, blocks in [(BlockType.STATE, self._model.get_state_blocks()),
+                                        (BlockType.PARAMETERS, self._model.get_parameters_blocks()),
+                                        (BlockType.INTERNALS, self._model.get_internals_blocks())]:
+                declared_variables = self._declared_variables[_block_type] = {}
+                for block in blocks:
+                    for decl in block.get_declarations():
+                        for var in decl.get_variables():
+                            declared_variables.setdefault(var.get_name(), (var, decl))
+
+        return self._declared_variables[block_type].get(name, (None, None))
+
+    def get_inline_expression(self, name: str) -> Optional[ASTInlineExpression]:
+        r"""
+        Returns the first inline expression with the given name in the equations blocks of the model.
+        :param name: the name of the inline expression
+        :return: the inline expression, or None if there is no such inline expression
+        """
+        if self._inline_expressions is None:
+            self._inline_expressions = {}
+            for equations_block in self._model.get_equations_blocks():
+                for inline_expr in equations_block.get_inline_expressions():
+                    self._inline_expressions.setdefault(inline_expr.variable_name, inline_expr)
+
+        return self._inline_expressions.get(name)
+
+    @classmethod
+    @contextmanager
+    def enabled(cls):
+        r"""
+        Context in which the ``ASTUtils`` helpers use the indices of the models in the current thread. The indices are discarded when leaving the outermost context.
+        """
+        if cls._indices.get() is not None:
+            # nested context; keep using the indices of the enclosing one
+            yield
+            return
+
+        token = cls._indices.set({})
+        try:
+            yield
+        finally:
+            cls._indices.reset(token)
+
+    @classmethod
+    def get_index(cls, node: ASTNode) -> Optional[ASTIndex]:
+        r"""
+        Returns the index of the model that contains ``node``, creating it if necessary.
+        :param node: a node
+        :return: the index, or None if indices are not enabled in the current thread, or if the node is not part of a model
+        """
+        indices = cls._indices.get()
+        if indices is None:
+            return None
+
+        root = node
+        while root.get_parent() is not None:
+            root = root.get_parent()
+
+        if not isinstance(root, ASTModel):
+            return None
+
+        model, index = indices.get(id(root), (None, None))
+        if model is not root or index.modification_count != ASTNode.modification_count:
+            index = ASTIndex(root)
+            indices[id(root)] = (root, index)
+
+        if node is not root and not index.contains(node):
+            # for instance, because the parent link of the node is out of date
+            return None
+
+        return index
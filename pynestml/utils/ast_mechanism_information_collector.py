@@ -22,12 +22,17 @@
 from collections import defaultdict
 
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.visitors.ast_visitor import ASTVisitor
 
 
-class ASTMechanismInformationCollector(object):
+class ASTMechanismInformationCollector(metaclass=ContextScopedMeta):
     """This class contains all basic mechanism information collection. Further collectors may be implemented to collect
     further information for specific mechanism types (example: ASTSynapseInformationCollector)"""
+
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["collector_visitor", "neuron"]
+
     collector_visitor = None
     neuron = None
 
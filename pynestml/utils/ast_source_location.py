@@ -29,8 +29,14 @@ class ASTSourceLocation:
         start_column = 0
         end_line = 0
         end_column = 0
+
+    Source locations are not modified after they have been created. Those created by ``make_ast_source_position()`` are therefore interned, so that all nodes (and their clones) that span the same part of a file share a single object.
     """
 
+    __slots__ = ("start_line", "start_column", "end_line", "end_column")
+
+    _interned = {}
+
     def __init__(self, start_line, start_column, end_line, end_column):
         """
         Standard constructor.
@@ -60,10 +66,19 @@ class ASTSourceLocation:
         :type end_line: int
         :param end_column: The end column of the object
         :type end_column: int
-        :return: a new ASTSourceLocation object
+        :return: an ASTSourceLocation object
         :rtype: ASTSourceLocation
         """
-        return cls(start_line=start_line, start_column=start_column, end_line=end_line, end_column=end_column)
+        key = (start_line, start_column, end_line, end_column)
+        source_position = ASTSourceLocation._interned.get(key)
+        if source_position is None:
+            source_position = ASTSourceLocation._interned.setdefault(key, cls(start_line=start_line, start_column=start_column, end_line=end_line, end_column=end_column))
+
+        return source_position
+
+    def __reduce__(self):
+        # intern source locations again when they are unpickled, e.g. from the cache of parsed models
+        return ASTSourceLocation.make_ast_source_position, (self.start_line, self.start_column, self.end_line, self.end_column)
 
     def get_start_line(self):
         """
@@ -150,7 +165,7 @@ class ASTSourceLocation:
         :return: a source position
         :rtype: ASTSourceLocation
         """
-        return cls(-1, -1, -1, -1)
+        return cls.make_ast_source_position(-1, -1, -1, -1)
 
     @classmethod
     def get_added_source_position(cls):
@@ -159,7 +174,7 @@ class ASTSourceLocation:
         :return: a source position.
         :rtype: ASTSourceLocation
         """
-        return cls(sys.maxsize, sys.maxsize, sys.maxsize, sys.maxsize)
+        return cls.make_ast_source_position(sys.maxsize, sys.maxsize, sys.maxsize, sys.maxsize)
 
     def is_predefined_source_position(self):
         """
@@ -22,9 +22,6 @@
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 import re
-import sympy
-
-import odetoolbox
 
 from pynestml.codegeneration.printers.ast_printer import ASTPrinter
 from pynestml.codegeneration.printers.cpp_variable_printer import CppVariablePrinter
@@ -60,6 +57,7 @@ from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.symbols.variable_symbol import BlockType
 from pynestml.symbols.variable_symbol import VariableSymbol, VariableType
+from pynestml.utils.ast_index import ASTIndex
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
@@ -269,18 +267,8 @@ class ASTUtils:
         :param ast: a single AST node
         :return: a list of all inline expression variable symbols
         """
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-        from pynestml.meta_model.ast_variable import ASTVariable
-        res = list()
-
-        def loc_get_vars(node):
-            if isinstance(node, ASTVariable):
-                res.append(node)
-
-        ast.accept(ASTHigherOrderVisitor(visit_funcs=loc_get_vars))
-
         ret = list()
-        for var in res:
+        for var in cls.get_all(ast, ASTVariable):
             if '\'' not in var.get_complete_name():
                 symbol = ast.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
                 if symbol is not None and symbol.is_inline_expression:
@@ -325,7 +313,10 @@ class ASTUtils:
         :return: a list of all meta_model of the specified type
         :rtype: list(AST_)
         """
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+        index = ASTIndex.get_index(ast)
+        if index is not None:
+            return index.get_nodes(ast, node_type)
+
         ret = list()
 
         def loc_get_all_of_type(node):
@@ -398,7 +389,10 @@ class ASTUtils:
         :return: a list of all function calls contained in _ast
         :rtype: list(ASTFunctionCall)
         """
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+        index = ASTIndex.get_index(ast)
+        if index is not None:
+            return index.get_function_calls(ast, [function_name])
+
         ret = list()
 
         def loc_get_function(node):
@@ -450,9 +444,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            model.get_body().adopt(block)
 
         return model
 
@@ -470,9 +462,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            model.get_body().adopt(block)
 
         return model
 
@@ -490,9 +480,7 @@ class ASTUtils:
                                                                    ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            model.get_body().adopt(block)
 
         return model
 
@@ -510,9 +498,7 @@ class ASTUtils:
                                                               ASTSourceLocation.get_added_source_position())
             block.update_scope(model.get_scope())
             model.get_body().get_body_elements().append(block)
-
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        model.accept(ASTParentVisitor())
+            model.get_body().adopt(block)
 
         return model
 
@@ -600,6 +586,7 @@ class ASTUtils:
             def visit_function_call(self, node: ASTFunctionCall):
                 if node.get_name() == PredefinedFunctions.INTEGRATE_ODES:
                     node.args = [arg for arg in node.args if not arg.get_variable().get_complete_name()]
+                    node.tree_modified()
 
         remove_state_var_from_integrate_odes_calls_visitor = RemoveStateVarFromIntegrateODEsCallsVisitor()
         model.accept(remove_state_var_from_integrate_odes_calls_visitor)
@@ -666,6 +653,10 @@ class ASTUtils:
 
     @classmethod
     def get_inline_expression_by_name(cls, node, name: str) -> Optional[ASTInlineExpression]:
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            return index.get_inline_expression(name)
+
         for equations_block in node.get_equations_blocks():
             for inline_expr in equations_block.get_inline_expressions():
                 if name == inline_expr.variable_name:
@@ -755,13 +746,13 @@ class ASTUtils:
 
             if isinstance(_expr, ASTSimpleExpression) and _expr.is_variable():
                 _expr.set_variable(ast_ext_var)
-                ast_ext_var.parent_ = _expr
                 return
 
             if isinstance(_expr, ASTVariable):
                 ast_ext_var.parent_ = _expr.get_parent()
                 if isinstance(_expr.get_parent(), ASTAssignment):
                     _expr.get_parent().lhs = ast_ext_var
+                    _expr.get_parent().adopt(ast_ext_var)
                 elif isinstance(_expr.get_parent(), ASTSimpleExpression) and _expr.get_parent().is_variable():
                     _expr.get_parent().set_variable(ast_ext_var)
                 elif isinstance(_expr.get_parent(), ASTDeclaration):
@@ -779,8 +770,6 @@ class ASTUtils:
             raise Exception()
 
         node.accept(ASTHigherOrderVisitor(lambda x: replace_var(x)))
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        node.accept(ASTParentVisitor())
 
     @classmethod
     def add_suffix_to_decl_lhs(cls, decl, suffix: str):
@@ -802,27 +791,19 @@ class ASTUtils:
         if node is None:
             return []
 
-        class ASTVariablesFinderVisitor(ASTVisitor):
-            _variables = []
-
-            def __init__(self):
-                super(ASTVariablesFinderVisitor, self).__init__()
-
-            def visit_declaration(self, node):
-                symbol = node.get_scope().resolve_to_symbol(node.get_variables()[0].get_complete_name(),
-                                                            SymbolKind.VARIABLE)
-                if symbol is None:
-                    code, message = Messages.get_variable_not_defined(node.get_variable().get_complete_name())
-                    Logger.log_message(code=code, message=message, error_position=node.get_source_position(),
-                                       log_level=LoggingLevel.ERROR, astnode=node)
-                    return
+        variables = []
+        for decl in cls.get_all(node, ASTDeclaration):
+            symbol = decl.get_scope().resolve_to_symbol(decl.get_variables()[0].get_complete_name(),
+                                                        SymbolKind.VARIABLE)
+            if symbol is None:
+                code, message = Messages.get_variable_not_defined(decl.get_variables()[0].get_complete_name())
+                Logger.log_message(code=code, message=message, error_position=decl.get_source_position(),
+                                   log_level=LoggingLevel.ERROR, astnode=decl)
+                continue
 
-                self._variables.append(symbol)
+            variables.append(symbol)
 
-        visitor = ASTVariablesFinderVisitor()
-        node.accept(visitor)
-        all_variables = [v.name for v in visitor._variables]
-        return all_variables
+        return [v.name for v in variables]
 
     @classmethod
     def get_all_variables_used_in_convolutions(cls, nodes: Union[ASTEquationsBlock, List[ASTEquationsBlock]], parent_node: ASTNode) -> List[str]:
@@ -870,7 +851,7 @@ class ASTUtils:
 
     @classmethod
     def move_decls(cls, var_name, from_block, to_block, var_name_suffix: str, block_type: BlockType, mode="move") -> List[ASTDeclaration]:
-        r"""Move or copy declarations from ``from_block`` to ``to_block``."""
+        r"""Move or copy declarations from ``from_block`` to ``to_block``, updating the symbol tables of both blocks."""
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         assert mode in ["move", "copy"]
 
@@ -888,12 +869,18 @@ class ASTUtils:
             for decl in decls:
                 if mode == "move":
                     from_block.declarations.remove(decl)
+                    for var in decl.get_variables():
+                        symbol = from_block.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+                        if symbol is not None and symbol.get_referenced_object() is decl:
+                            symbol.get_corresponding_scope().delete_symbol(symbol)
+
                 if mode == "copy":
                     decl = decl.clone()
                 assert len(decl.get_variables()) <= 1
                 if not decl.get_variables()[0].name.endswith(var_name_suffix) and var_name_suffix:
                     ASTUtils.add_suffix_to_decl_lhs(decl, suffix=var_name_suffix)
                 to_block.get_declarations().append(decl)
+                to_block.adopt(decl)
                 decl.update_scope(to_block.get_scope())
 
                 ast_symbol_table_visitor = ASTSymbolTableVisitor()
@@ -901,9 +888,6 @@ class ASTUtils:
                 decl.accept(ast_symbol_table_visitor)
                 ast_symbol_table_visitor.block_type_stack.pop()
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        to_block.accept(ASTParentVisitor())
-
         return decls
 
     @classmethod
@@ -920,6 +904,7 @@ class ASTUtils:
                 from_block.declarations.remove(decl)
             ASTUtils.add_suffix_to_decl_lhs(decl, suffix=var_name_suffix)
             to_block.get_declarations().append(decl)
+            to_block.adopt(decl)
             decl.update_scope(to_block.get_scope())
 
         return decls
@@ -1108,7 +1093,6 @@ class ASTUtils:
         assert len(neuron.get_internals_blocks()) <= 1, "Only one internals block supported for now"
 
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
         tmp = ModelParser.parse_expression(init_expression)
         vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
@@ -1121,15 +1105,6 @@ class ASTUtils:
             ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
         neuron.add_to_internals_block(ast_declaration)
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        neuron.accept(ASTParentVisitor())
-
-        ast_declaration.update_scope(neuron.get_internals_blocks()[0].get_scope())
-        symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.INTERNALS)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
-
         return neuron
 
     @classmethod
@@ -1155,7 +1130,6 @@ class ASTUtils:
         :return: a modified neuron
         """
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
         tmp = ModelParser.parse_expression(initial_value)
         vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
@@ -1167,14 +1141,6 @@ class ASTUtils:
             ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
         neuron.add_to_state_block(ast_declaration)
 
-        from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
-        neuron.accept(ASTParentVisitor())
-
-        symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.STATE)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
-
         return neuron
 
     @classmethod
@@ -1214,7 +1180,7 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks()[0].get_stmts_body().get_stmts().append(stmt)
+        neuron.get_update_blocks()[0].get_stmts_body().add_stmt(stmt)
         small_stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
         stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
         return neuron
@@ -1234,7 +1200,7 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks()[0].get_stmts_body().get_stmts().append(stmt)
+        neuron.get_update_blocks()[0].get_stmts_body().add_stmt(stmt)
         small_stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
         stmt.update_scope(neuron.get_update_blocks()[0].get_stmts_body().get_scope())
         return neuron
@@ -1516,6 +1482,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: declaration containing the variable
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.PARAMETERS)
+            return decl
+
         for param_block in node.get_parameters_blocks():
             for decl in param_block.get_declarations():
                 for var in decl.get_variables():
@@ -1531,6 +1502,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: the parameter node
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.PARAMETERS)
+            return var
+
         for param_block in node.get_parameters_blocks():
             for decl in param_block.get_declarations():
                 for var in decl.get_variables():
@@ -1546,6 +1522,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: declaration containing the variable
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.INTERNALS)
+            return decl
+
         for internals_block in node.get_internals_blocks():
             for decl in internals_block.get_declarations():
                 for var in decl.get_variables():
@@ -1561,6 +1542,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: declaration containing the variable
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.INTERNALS)
+            return var
+
         for internals_block in node.get_internals_blocks():
             for decl in internals_block.get_declarations():
                 for var in decl.get_variables():
@@ -1601,6 +1587,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: the node if found, otherwise None
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.STATE)
+            return var
+
         for state_block in node.get_state_blocks():
             for decl in state_block.get_declarations():
                 for var in decl.get_variables():
@@ -1616,6 +1607,11 @@ class ASTUtils:
         :param var_name: variable name to be searched
         :return: declaration containing the variable if found, otherwise None
         """
+        index = ASTIndex.get_index(node) if isinstance(node, ASTModel) else None
+        if index is not None:
+            var, decl = index.get_declared_variable(var_name, BlockType.STATE)
+            return decl
+
         for state_block in node.get_state_blocks():
             for decl in state_block.get_declarations():
                 for var in decl.get_variables():
@@ -1675,7 +1671,7 @@ class ASTUtils:
         """
         vars_used_ = []
 
-        def collect_vars(_expr=None):
+        for _expr in cls.get_all(expr, (ASTSimpleExpression, ASTVariable)):
             var = None
             if isinstance(_expr, ASTSimpleExpression) and _expr.is_variable():
                 var = _expr.get_variable()
@@ -1689,8 +1685,6 @@ class ASTUtils:
             if var and symbol:
                 vars_used_.append(var)
 
-        expr.accept(ASTHigherOrderVisitor(lambda x: collect_vars(x)))
-
         return vars_used_
 
     @classmethod
@@ -1769,6 +1763,32 @@ class ASTUtils:
 
         return list(set(vars_used))
 
+    @classmethod
+    def remove_symbols_of_declarations(cls, model: ASTModel, decls: Iterable[ASTNode]) -> None:
+        r"""
+        Update the symbol table of the model after declarations (of variables, kernels or ODEs) have been removed from the model: the symbols that were declared by them are removed, and variables whose ODE or kernel was removed no longer refer to it.
+        :param model: the model from which the declarations have been removed
+        :param decls: the removed declarations
+        """
+        removed_ids = set()
+        for decl in decls:
+            removed_ids.add(id(decl))
+            if isinstance(decl, ASTKernel):
+                removed_ids |= set(id(expr) for expr in decl.get_expressions())
+
+        if not removed_ids:
+            return
+
+        for symbol in model.get_scope().get_symbols_in_this_scope():
+            if not isinstance(symbol, VariableSymbol):
+                continue
+
+            if id(symbol.get_referenced_object()) in removed_ids:
+                model.get_scope().delete_symbol(symbol)
+            elif id(symbol.get_ode_or_kernel()) in removed_ids:
+                symbol.set_ode_or_kernel(None)
+                symbol.set_variable_type(VariableType.VARIABLE)
+
     @classmethod
     def remove_initial_values_for_kernels(cls, model: ASTModel) -> None:
         """
@@ -1794,11 +1814,17 @@ class ASTUtils:
                         for var in decl.get_variables():
                             if var.get_name() == symbol_name:
                                 decl.variables.remove(var)
+                                symbol = decl.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+                                if symbol is not None and symbol.get_referenced_object() is decl:
+                                    decl.get_scope().delete_symbol(symbol)
 
         for decl in decl_to_remove:
             for state_block in model.get_state_blocks():
                 if decl in state_block.get_declarations():
                     state_block.get_declarations().remove(decl)
+                    state_block.tree_modified()
+
+        cls.remove_symbols_of_declarations(model, decl_to_remove)
 
     @classmethod
     def update_initial_values_for_odes(cls, model: ASTModel, solver_dicts: List[dict]) -> None:
@@ -1827,10 +1853,15 @@ class ASTUtils:
                         assert iv_expr is not None
                         iv_expr = ModelParser.parse_expression(iv_expr)
                         iv_expr.update_scope(state_block.get_scope())
+                        iv_expr.parent_ = iv_decl
+                        iv_expr.accept(ASTParentVisitor())
+                        iv_expr.accept(ASTSymbolTableVisitor())
                         iv_decl.set_expression(iv_expr)
 
-        model.accept(ASTParentVisitor())
-        model.accept(ASTSymbolTableVisitor())
+                        # update the symbol in-place, so that the order of the symbols is retained
+                        symbol = state_block.get_scope().resolve_to_symbol(var_name, SymbolKind.VARIABLE)
+                        symbol.set_declaring_expression(iv_expr)
+                        symbol.set_initial_value(iv_expr)
 
     @classmethod
     def integrate_odes_args_strs_from_function_call(cls, function_call: ASTFunctionCall):
@@ -2039,6 +2070,7 @@ class ASTUtils:
             def __init__(self):
                 super().__init__()
                 self.calls = []
+                self.calls_by_hash = {}
 
             def visit_small_stmt(self, node: ASTSmallStmt):
                 self._visit(node)
@@ -2047,8 +2079,13 @@ class ASTUtils:
                 self._visit(node)
 
             def _visit(self, node):
-                if node.is_function_call() and node.get_function_call().get_name() == "integrate_odes" and not any([call.equals(node.get_function_call()) for call in self.calls]):
-                    self.calls.append(node.get_function_call())
+                if node.is_function_call() and node.get_function_call().get_name() == "integrate_odes":
+                    call = node.get_function_call()
+                    # only the calls with the same structural hash have to be compared
+                    calls_with_hash = self.calls_by_hash.setdefault(call.structural_hash(), [])
+                    if not any(other_call.equals(call) for other_call in calls_with_hash):
+                        calls_with_hash.append(call)
+                        self.calls.append(call)
 
         visitor = IntegrateODEsFunctionCallVisitor()
         model.accept(visitor)
@@ -2178,12 +2215,19 @@ class ASTUtils:
 
             for decl in decl_to_remove:
                 equations_block.get_declarations().remove(decl)
+                equations_block.tree_modified()
+
+            cls.remove_symbols_of_declarations(model, decl_to_remove)
 
     @classmethod
     def get_delta_factors_(cls, neuron: ASTModel, equations_block: ASTEquationsBlock) -> dict:
         r"""
         For every occurrence of a convolution of the form `x^(n) = a * convolve(kernel, inport) + ...` where `kernel` is a delta function, add the element `(x^(n), inport) --> a` to the set.
         """
+        # sympy and ODE-toolbox are slow to import; they are only imported when they are needed, so that they do not add to the startup time of the frontend
+        import odetoolbox
+        import sympy
+
         delta_factors = {}
 
         for ode_eq in equations_block.get_ode_equations():
@@ -2222,6 +2266,9 @@ class ASTUtils:
 
             for decl in decl_to_remove:
                 equations_block.get_declarations().remove(decl)
+                equations_block.tree_modified()
+
+            cls.remove_symbols_of_declarations(model, decl_to_remove)
 
         return decl_to_remove
 
@@ -2267,6 +2314,22 @@ class ASTUtils:
 
         return kernel_buffers
 
+    @classmethod
+    def rename_declared_variable_symbol(cls, var: ASTVariable, new_name: str) -> None:
+        r"""
+        If the variable is the left-hand side of a declaration, rename the symbol declared by it. This is called before the variable itself is renamed.
+        :param var: the variable that is about to be renamed
+        :param new_name: the new name of the variable
+        """
+        if var.get_scope() is None:
+            return
+
+        symbol = var.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+        if symbol is not None \
+           and isinstance(symbol.get_referenced_object(), ASTDeclaration) \
+           and any(decl_var is var for decl_var in symbol.get_referenced_object().get_variables()):
+            symbol.get_corresponding_scope().rename_symbol(symbol, new_name)
+
     @classmethod
     def replace_convolution_aliasing_inlines(cls, neuron: ASTModel) -> None:
         """
@@ -2279,11 +2342,14 @@ class ASTUtils:
                     ast_variable = ASTVariable(replace_with_var_name + '__d' * var.get_differential_order(),
                                                differential_order=0)
                     ast_variable.set_source_position(var.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
+                    ast_variable.parent_ = _expr
                     _expr.set_variable(ast_variable)
 
             elif isinstance(_expr, ASTVariable):
                 var = _expr
                 if var.get_name() == replace_var_name:
+                    cls.rename_declared_variable_symbol(var, replace_with_var_name + '__d' * var.get_differential_order())
                     var.set_name(replace_with_var_name + '__d' * var.get_differential_order())
                     var.set_differential_order(0)
 
@@ -2316,11 +2382,14 @@ class ASTUtils:
                     ast_variable = ASTVariable(cls.to_ode_toolbox_processed_name(
                         var.get_complete_name()), differential_order=0)
                     ast_variable.set_source_position(var.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
+                    ast_variable.parent_ = _expr
                     _expr.set_variable(ast_variable)
 
             elif isinstance(_expr, ASTVariable):
                 var = _expr
                 if cls.variable_in_solver(cls.to_ode_toolbox_processed_name(var.get_complete_name()), solver_dicts):
+                    cls.rename_declared_variable_symbol(var, cls.to_ode_toolbox_processed_name(var.get_complete_name()))
                     var.set_name(cls.to_ode_toolbox_processed_name(var.get_complete_name()))
                     var.set_differential_order(0)
 
@@ -2334,8 +2403,6 @@ class ASTUtils:
         r"""
         Replace all occurrences of `convolve(kernel[']^n, spike_input_port)` with the corresponding buffer variable, e.g. `g_E__X__spikes_exc[__d]^n` for a kernel named `g_E` and a spike input port named `spikes_exc`.
         """
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
-
         def replace_function_call_through_var(_expr=None):
             if _expr.is_function_call() and _expr.get_function_call().get_name() == "convolve":
                 convolve = _expr.get_function_call()
@@ -2359,13 +2426,14 @@ class ASTUtils:
                 else:
                     ast_variable = ASTVariable(buffer_var)
                     ast_variable.set_source_position(_expr.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
+                    ast_variable.parent_ = _expr
                     _expr.set_variable(ast_variable)
 
         def func(x):
             return replace_function_call_through_var(x) if isinstance(x, ASTSimpleExpression) else True
 
         equations_block.accept(ASTHigherOrderVisitor(func))
-        equations_block.accept(ASTSymbolTableVisitor())
 
     @classmethod
     def update_blocktype_for_common_parameters(cls, node):
@@ -2423,7 +2491,7 @@ class ASTUtils:
 
         function_calls = []
         for node in nodes:
-            function_calls.extend(cls.get_function_calls(node, PredefinedFunctions.CONVOLVE))
+            function_calls.extend(cls.get_function_calls(node, [PredefinedFunctions.CONVOLVE]))
 
         return function_calls
 
@@ -2434,7 +2502,7 @@ class ASTUtils:
         :param ast: a single meta_model
         :return: True if sum is contained, otherwise False.
         """
-        return len(cls.get_function_calls(ast, PredefinedFunctions.CONVOLVE)) > 0
+        return len(cls.get_function_calls(ast, [PredefinedFunctions.CONVOLVE])) > 0
 
     @classmethod
     def get_function_calls(cls, ast_node: ASTNode, function_list: List[str]) -> List[ASTFunctionCall]:
@@ -2447,8 +2515,11 @@ class ASTUtils:
         res = list()
         if ast_node is None:
             return res
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-        from pynestml.meta_model.ast_function_call import ASTFunctionCall
+
+        index = ASTIndex.get_index(ast_node)
+        if index is not None:
+            return index.get_function_calls(ast_node, function_list)
+
         fun = (lambda x: res.append(x) if isinstance(x, ASTFunctionCall) and x.get_name() in function_list else True)
         vis = ASTHigherOrderVisitor(visit_funcs=fun)
         ast_node.accept(vis)
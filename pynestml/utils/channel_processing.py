@@ -21,7 +21,6 @@
 
 from pynestml.utils.mechanism_processing import MechanismProcessing
 
-import sympy
 import re
 
 
@@ -46,6 +45,8 @@ class ChannelProcessing(MechanismProcessing):
         check if var being zero leads to the expression always being zero so that
         the computation may be skipped if this is determined to be the case during simulation.
         """
+        import sympy
+
         if not re.search("1/.*", rhs_expression_str):
             sympy_expression = sympy.parsing.sympy_parser.parse_expr(rhs_expression_str, evaluate=False)
             if isinstance(sympy_expression, sympy.core.add.Add) \
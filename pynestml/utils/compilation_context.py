@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# compilation_context.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Optional
+
+import contextlib
+import contextvars
+import copy
+
+
+class CompilationContext:
+    r"""
+    The state of one run of the toolchain: the frontend configuration, the log, the symbol tables and the predefined type, unit, function and variable registries.
+
+    This state is accessed through class attributes of ``FrontendConfiguration``, ``Logger``, ``SymbolTable``, ``PredefinedTypes``, etc. (see :py:class:`ContextScopedMeta`), which resolve to the context that is active in the current thread (or asyncio task). Unless another context has been activated, this is the default context, so that the module-level API behaves as a single, process-wide toolchain instance. To run several compilations concurrently in the same process, activate a separate context in each thread, for instance by passing it to ``generate_target()``:
+
+    .. code-block:: python
+
+       context = CompilationContext()
+       generate_target(input_path, "NONE", context=context)
+
+    or explicitly:
+
+    .. code-block:: python
+
+       with context.activate():
+           ...
+    """
+
+    _current: contextvars.ContextVar[Optional[CompilationContext]] = contextvars.ContextVar("nestml_compilation_context", default=None)
+    _default: Optional[CompilationContext] = None
+
+    def __init__(self):
+        self._state: Dict[type, Dict[str, Any]] = {}
+
+    @classmethod
+    def get_default(cls) -> CompilationContext:
+        r"""
+        Return the default context, which is used when no other context is active.
+        """
+        if cls._default is None:
+            cls._default = CompilationContext()
+
+        return cls._default
+
+    @classmethod
+    def get_current(cls) -> CompilationContext:
+        r"""
+        Return the context that is active in the current thread.
+        """
+        context = cls._current.get()
+        if context is None:
+            return cls.get_default()
+
+        return context
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[CompilationContext]:
+        r"""
+        Make this the active context in the current thread, for the duration of the ``with`` block.
+        """
+        token = CompilationContext._current.set(self)
+        try:
+            yield self
+        finally:
+            CompilationContext._current.reset(token)
+
+    def get_state(self, owner: type) -> Dict[str, Any]:
+        r"""
+        Return the attribute values of a context-scoped class in this context. Upon first access, the attributes are initialised to (copies of) the values given in the class body.
+        """
+        state = self._state.get(owner)
+        if state is None:
+            if self is CompilationContext._default:
+                # the default context uses the values from the class body as they are, as a process-wide singleton would
+                state = dict(owner._context_scoped_defaults)
+            else:
+                state = {name: copy.copy(value) for name, value in owner._context_scoped_defaults.items()}
+
+            self._state[owner] = state
+
+        return state
+
+
+def _make_context_scoped_property(owner: type, name: str) -> property:
+    current_context = CompilationContext._current
+
+    # this is on the path of every access to e.g. the log or the predefined types, so the lookup is inlined
+    def getter(cls):
+        context = current_context.get()
+        if context is None:
+            context = CompilationContext._default or CompilationContext.get_default()
+
+        state = context._state.get(owner)
+        if state is None:
+            state = context.get_state(owner)
+
+        return state[name]
+
+    def setter(cls, value):
+        CompilationContext.get_current().get_state(owner)[name] = value
+
+    return property(getter, setter, doc="Context-scoped attribute " + owner.__name__ + "." + name)
+
+
+class ContextScopedMeta(type):
+    r"""
+    Metaclass for classes that keep their state in class attributes, such as ``Logger``. The attributes listed in ``_context_scoped_attributes`` are stored in the active :py:class:`CompilationContext` rather than in the class itself, while they are still read and assigned as class attributes, e.g. ``Logger.log`` or ``cls.name2type = {}``. The values given in the class body are the initial values in each context.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        attribute_names = namespace.get("_context_scoped_attributes", ())
+        defaults = {attribute_name: namespace.pop(attribute_name) for attribute_name in attribute_names}
+
+        # properties have to be defined on the metaclass to intercept class attribute access, so each class gets its own metaclass
+        meta = type.__new__(type, name + "ContextScopedMeta", (mcs,), {})
+        cls = type.__new__(meta, name, bases, namespace)
+        type.__setattr__(cls, "_context_scoped_defaults", defaults)
+        for attribute_name in attribute_names:
+            setattr(meta, attribute_name, _make_context_scoped_property(cls, attribute_name))
+
+        return cls
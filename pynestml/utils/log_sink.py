@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# log_sink.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, IO, Union
+
+from abc import ABCMeta, abstractmethod
+import json
+
+
+class LogSink(metaclass=ABCMeta):
+    r"""
+    A destination to which the ``Logger`` streams each message at the moment it is logged, as a record with the fields "filename", "nodeName", "severity", "code" (optional), "row", "col" and "message".
+
+    Sinks are attached with ``Logger.add_sink()``. As the messages do not need to be kept in memory to be written out afterwards, a sink can be combined with ``Logger.set_max_retained_messages()`` to bound the memory used by the log.
+    """
+
+    @abstractmethod
+    def write(self, record: Dict[str, str]) -> None:
+        r"""
+        Write a single log record.
+
+        Parameters
+        ----------
+        record
+            The log record.
+        """
+        pass
+
+    def close(self) -> None:
+        r"""
+        Release any resources held by the sink. No records may be written afterwards.
+        """
+        pass
+
+
+class JSONLinesLogSink(LogSink):
+    r"""
+    Writes each log record as a single line of JSON to a file. The file is flushed after every record, so that the messages are available on disk while processing is still ongoing, and are not lost if the process terminates abnormally.
+    """
+
+    def __init__(self, file: Union[str, IO[str]]):
+        r"""
+        Parameters
+        ----------
+        file
+            Path of the file to write to, which is overwritten if it exists, or an already opened text file. A file that is handed over as an object is not closed by ``close()``.
+        """
+        if isinstance(file, str):
+            self._file = open(file, "w")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+    def write(self, record: Dict[str, str]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+
+class QueueLogSink(LogSink):
+    r"""
+    Puts each log record into a queue, such as a ``queue.Queue`` or a ``multiprocessing.Queue``, from which it can be consumed by another thread or process.
+    """
+
+    def __init__(self, queue: Any):
+        r"""
+        Parameters
+        ----------
+        queue
+            The queue; any object with a ``put()`` method.
+        """
+        self._queue = queue
+
+    def write(self, record: Dict[str, str]) -> None:
+        self._queue.put(record)
@@ -19,14 +19,15 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-from collections import OrderedDict
 from enum import Enum
 import json
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.compilation_context import ContextScopedMeta
+from pynestml.utils.log_sink import LogSink
 from pynestml.utils.messages import MessageCode
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 
@@ -42,7 +43,7 @@ class LoggingLevel(Enum):
     NO = 4
 
 
-class Logger:
+class Logger(metaclass=ContextScopedMeta):
     """
     This class represents a logger which can be used to print messages to the screen depending on the logging
     level.
@@ -63,13 +64,28 @@ class Logger:
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_node The currently processed model. This enables to retrieve all messages belonging to a certain model
+        max_retained_messages The maximum number of DEBUG and INFO messages that are kept in the log, or None to keep all of them. Warnings and errors are always kept.
+        sinks     The sinks to which each message is streamed as a record when it is logged.
+
+    The ids of the messages in the log are indexed by level, by artifact name and level, and by artifact name and node as the messages are logged, so that messages can be retrieved without scanning the whole log.
     """
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["log", "curr_message", "log_frozen", "logging_level", "current_node", "no_print", "max_retained_messages", "sinks",
+                                  "_message_ids_by_level", "_message_ids_by_artifact_and_level", "_message_ids_by_artifact_and_node"]
+
     log = {}
     curr_message = None
     log_frozen = False
     logging_level = None
     current_node = None
     no_print = False
+    max_retained_messages = None
+    sinks = []
+
+    # ordered sets (dicts with values None) of message ids
+    _message_ids_by_level = {}
+    _message_ids_by_artifact_and_level = {}
+    _message_ids_by_artifact_and_node = {}
 
     @classmethod
     def init_logger(cls, logging_level: LoggingLevel):
@@ -83,6 +99,7 @@ class Logger:
         cls.curr_message = 0
         cls.log = {}
         cls.log_frozen = False
+        cls._index_log()
 
     @classmethod
     def freeze_log(cls, do_freeze: bool = True):
@@ -110,6 +127,133 @@ class Logger:
         """
         cls.log = log
         cls.curr_message = counter
+        cls._index_log()
+
+    @classmethod
+    def set_max_retained_messages(cls, max_retained_messages: Optional[int]) -> None:
+        """
+        Limits the number of DEBUG and INFO messages that are kept in the log, in order to bound the memory used by long-running processes. When the limit is exceeded, the oldest of these messages are removed from the log. Messages are printed as before, and warnings and errors are always kept.
+
+        :param max_retained_messages: the maximum number of DEBUG and INFO messages to keep, or None to keep all of them
+        """
+        cls.max_retained_messages = max_retained_messages
+        cls._drop_messages_over_limit()
+
+    @classmethod
+    def add_sink(cls, sink: LogSink, replay_log: bool = False) -> None:
+        """
+        Attaches a sink, to which each subsequently logged message is streamed as a record.
+
+        :param sink: the sink
+        :param replay_log: if True, the messages that are currently in the log are written to the sink first
+        """
+        if replay_log:
+            for log_entry in cls.log.values():
+                sink.write(cls.get_log_record(log_entry))
+
+        cls.sinks = cls.sinks + [sink]
+
+    @classmethod
+    def remove_sink(cls, sink: LogSink) -> None:
+        """
+        Detaches a sink that has been attached with ``add_sink()``. The sink is not closed.
+
+        :param sink: the sink
+        """
+        cls.sinks = [sink_ for sink_ in cls.sinks if sink_ is not sink]
+
+    @classmethod
+    def get_log_record(cls, log_entry: Tuple) -> Dict[str, str]:
+        """
+        Converts an entry of the log into a record that can be serialised to JSON.
+
+        :param log_entry: the entry (ARTIFACT_NAME, NODE, LEVEL, CODE, ERROR_POSITION, MESSAGE)
+        :return: a dict with the fields "filename", "nodeName", "severity", "code" (only if the message has a code), "row", "col" and "message"
+        """
+        artifact_name, node, log_level, code, error_position, message = log_entry
+        record = {"filename": artifact_name,
+                  "nodeName": node.get_name() if node is not None else "GLOBAL",
+                  "severity": log_level.name}
+        if code is not None:
+            record["code"] = code.name if isinstance(code, MessageCode) else str(code)
+
+        record["row"] = str(error_position.get_start_line()) if error_position is not None else ""
+        record["col"] = str(error_position.get_start_column()) if error_position is not None else ""
+        record["message"] = str(message)
+
+        return record
+
+    @classmethod
+    def _index_log(cls) -> None:
+        """
+        Rebuilds the indexes of the message ids from the log.
+        """
+        cls._message_ids_by_level = {}
+        cls._message_ids_by_artifact_and_level = {}
+        cls._message_ids_by_artifact_and_node = {}
+        for message_id in cls.log.keys():
+            cls._index_message(message_id)
+
+        cls._drop_messages_over_limit()
+
+    @classmethod
+    def _index_message(cls, message_id: int) -> None:
+        """
+        Adds the id of a message in the log to the indexes.
+
+        :param message_id: the id of the message
+        """
+        artifact_name, node, log_level = cls.log[message_id][:3]
+        for index, key in ((cls._message_ids_by_level, log_level),
+                           (cls._message_ids_by_artifact_and_level, (artifact_name, log_level)),
+                           (cls._message_ids_by_artifact_and_node, (artifact_name, node))):
+            if not key in index.keys():
+                index[key] = {}
+
+            index[key][message_id] = None
+
+    @classmethod
+    def _drop_messages_over_limit(cls) -> None:
+        """
+        Removes the oldest DEBUG and INFO messages from the log and the indexes, until no more than ``max_retained_messages`` of them are left.
+        """
+        if cls.max_retained_messages is None:
+            return
+
+        debug_ids = cls._message_ids_by_level.get(LoggingLevel.DEBUG, {})
+        info_ids = cls._message_ids_by_level.get(LoggingLevel.INFO, {})
+        while len(debug_ids) + len(info_ids) > cls.max_retained_messages:
+            if not info_ids or (debug_ids and next(iter(debug_ids)) < next(iter(info_ids))):
+                message_id = next(iter(debug_ids))
+            else:
+                message_id = next(iter(info_ids))
+
+            artifact_name, node, log_level = cls.log.pop(message_id)[:3]
+            for index, key in ((cls._message_ids_by_level, log_level),
+                               (cls._message_ids_by_artifact_and_level, (artifact_name, log_level)),
+                               (cls._message_ids_by_artifact_and_node, (artifact_name, node))):
+                del index[key][message_id]
+                if not index[key]:
+                    del index[key]
+
+            debug_ids = cls._message_ids_by_level.get(LoggingLevel.DEBUG, {})
+            info_ids = cls._message_ids_by_level.get(LoggingLevel.INFO, {})
+
+    @classmethod
+    def _get_messages_by_ids(cls, message_ids: Iterable[int], node: Optional[ASTNode] = None) -> List[Tuple[ASTNode, LoggingLevel, str]]:
+        """
+        Returns the messages with the handed over ids, as tuples (NODE, LEVEL, MESSAGE).
+
+        :param message_ids: ids of messages in the log
+        :param node: the node to return for each message; if None, the node the message was logged for
+        :return: a list of messages with their levels.
+        """
+        ret = list()
+        for message_id in message_ids:
+            (artifactName, node_i, logLevel, code, errorPosition, message) = cls.log[message_id]
+            ret.append((node if node is not None else node_i, logLevel, message))
+
+        return ret
 
     @classmethod
     def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: str = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None):
@@ -137,16 +281,24 @@ class Logger:
         from pynestml.meta_model.ast_model import ASTModel
 
         if isinstance(node, ASTModel):
-            cls.log[cls.curr_message] = (
-                node.get_artifact_name(), node, log_level, code, error_position, message)
+            log_entry = (node.get_artifact_name(), node, log_level, code, error_position, message)
         else:
             if cls.current_node is not None:
                 artifact_name = cls.current_node.get_artifact_name()
             else:
                 artifact_name = ""
 
-            cls.log[cls.curr_message] = (artifact_name, cls.current_node,
-                                         log_level, code, error_position, message)
+            log_entry = (artifact_name, cls.current_node, log_level, code, error_position, message)
+
+        cls.log[cls.curr_message] = log_entry
+        cls._index_message(cls.curr_message)
+        if cls.sinks:
+            record = cls.get_log_record(log_entry)
+            for sink in cls.sinks:
+                sink.write(record)
+
+        if log_level in [LoggingLevel.DEBUG, LoggingLevel.INFO]:
+            cls._drop_messages_over_limit()
 
         cls.curr_message += 1
         if cls.no_print:
@@ -250,20 +402,17 @@ class Logger:
         if level is None and node is None:
             return cls.get_log()
 
-        if isinstance(node, str):
-            # search by artifact name
-            node_artifact_name = node
-            node = None
-        else:
-            # search by artifact class object
-            node_artifact_name = None
+        if node is None or isinstance(node, str):
+            # a name is not matched against the artifact names, so all messages of the level are returned
+            message_ids = cls.log.keys() if level is None else cls._message_ids_by_level.get(level, {})
 
-        ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (level == logLevel if level is not None else True) and (node if node is not None else True) and (node_artifact_name == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
+            return [(None, logLevel, message) for (_, logLevel, message) in cls._get_messages_by_ids(message_ids)]
 
-        return ret
+        # a node is matched against the messages that have been logged without an artifact name
+        levels = [level] if level is not None else list(LoggingLevel)
+        message_ids = sorted(message_id for level_ in levels for message_id in cls._message_ids_by_artifact_and_level.get((None, level_), {}))
+
+        return cls._get_messages_by_ids(message_ids, node=node)
 
     @classmethod
     def get_all_messages_of_level(cls, level: LoggingLevel) -> List[Tuple[ASTNode, LoggingLevel, str]]:
@@ -276,12 +425,7 @@ class Logger:
         if level is None:
             return cls.get_log()
 
-        ret = list()
-        for (artifactName, node, logLevel, code, errorPosition, message) in cls.log.values():
-            if level == logLevel:
-                ret.append((node, logLevel, message))
-
-        return ret
+        return cls._get_messages_by_ids(cls._message_ids_by_level.get(level, {}))
 
     @classmethod
     def get_all_messages_of_node(cls, node: ASTNode) -> List[Tuple[ASTNode, LoggingLevel, str]]:
@@ -294,13 +438,7 @@ class Logger:
         if node is None:
             return cls.get_log()
 
-        ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (node_i == node if node is not None else True) and \
-                    (node.get_artifact_name() == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
-
-        return ret
+        return cls._get_messages_by_ids(cls._message_ids_by_artifact_and_node.get((node.get_artifact_name(), node), {}), node=node)
 
     @classmethod
     def has_errors(cls, node: ASTNode) -> bool:
@@ -310,7 +448,10 @@ class Logger:
         :param node: a single node instance.
         :return: True if errors detected, otherwise False
         """
-        return len(cls.get_all_messages_of_level_and_or_node(node, LoggingLevel.ERROR)) > 0
+        if node is None or isinstance(node, str):
+            return len(cls._message_ids_by_level.get(LoggingLevel.ERROR, {})) > 0
+
+        return len(cls._message_ids_by_artifact_and_level.get((None, LoggingLevel.ERROR), {})) > 0
 
     @classmethod
     def get_json_format(cls) -> str:
@@ -318,36 +459,10 @@ class Logger:
         Returns the log in a format which can be used to be stored to a file.
         :return: a string containing the log
         """
-        ret = '['
-        for messageNr in cls.log.keys():
-            (artifactName, node, logLevel, code, errorPosition, message) = cls.log[messageNr]
-            ret += '{' + \
-                   '"filename":"' + \
-                   artifactName + \
-                   '", ' + \
-                   '"nodeName":"' + \
-                   (node.get_name() if node is not None else 'GLOBAL') + '", ' + \
-                   '"severity":"' \
-                   + str(logLevel.name) + '", '
-
-            if code is not None:
-                ret += '"code":"' + \
-                       code.name + \
-                       '", '
-            ret += '"row":"' + \
-                   (str(errorPosition.get_start_line()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"col":"' \
-                   + (str(errorPosition.get_start_column()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"message":"' + str(message).replace('"', "'") + '"}'
-            ret += ','
-
-        if len(cls.log.keys()) == 0:
-            parsed = json.loads('[]', object_pairs_hook=OrderedDict)
-        else:
-            ret = ret[:-1]  # delete the last ","
-            ret += ']'
-            parsed = json.loads(ret, object_pairs_hook=OrderedDict)
+        records = []
+        for log_entry in cls.log.values():
+            record = cls.get_log_record(log_entry)
+            record["message"] = record["message"].replace('"', "'")
+            records.append(record)
 
-        return json.dumps(parsed, indent=2, sort_keys=False)
+        return json.dumps(records, indent=2, sort_keys=False)
@@ -19,8 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Any, Dict, List, Optional
+
 from collections import defaultdict
 
+import contextlib
+import contextvars
 import copy
 
 from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
@@ -34,15 +38,18 @@ from pynestml.meta_model.ast_model import ASTModel
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.utils.ast_mechanism_information_collector import ASTMechanismInformationCollector
 from pynestml.utils.ast_utils import ASTUtils
-
-from odetoolbox import analysis
+from pynestml.utils.compilation_context import ContextScopedMeta
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
 
 
-class MechanismProcessing:
+class MechanismProcessing(metaclass=ContextScopedMeta):
     """Manages the collection of basic information necesary for all types of mechanisms and uses the
     collect_information_for_specific_mech_types interface that needs to be implemented by the specific mechanism type
     processing classes"""
 
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["first_time_run", "mechs_info"]
+
     # used to keep track of whenever check_co_co was already called
     # see inside check_co_co
     first_time_run = defaultdict(lambda: defaultdict(lambda: True))
@@ -51,6 +58,12 @@ class MechanismProcessing:
 
     mechType = str()
 
+    # maximum number of worker processes used to run ODE-toolbox in the current code generator run (see ``code_generator_run()``)
+    _parallel_jobs: contextvars.ContextVar[int] = contextvars.ContextVar("nestml_mechanism_parallel_jobs", default=1)
+
+    # memoised ODE-toolbox results of the current code generator run (see ``code_generator_run()``), or None outside of a run
+    _ode_toolbox_results: contextvars.ContextVar[Optional[Dict[str, List[Dict[str, Any]]]]] = contextvars.ContextVar("nestml_mechanism_ode_toolbox_results", default=None)
+
     # ODE-toolbox printers
     _constant_printer = ConstantPrinter()
     _ode_toolbox_variable_printer = ODEToolboxVariablePrinter(None)
@@ -64,6 +77,19 @@ class MechanismProcessing:
     _ode_toolbox_variable_printer._expression_printer = _ode_toolbox_printer
     _ode_toolbox_function_call_printer._expression_printer = _ode_toolbox_printer
 
+    @classmethod
+    @contextlib.contextmanager
+    def code_generator_run(cls, parallel_jobs: int = 1):
+        """Within this context, ODE-toolbox is run in up to ``parallel_jobs`` worker processes, and its results are memoised, so that mechanisms with identical definitions are only analysed once, also across neurons. The results are discarded when leaving the outermost context. The settings and the memo only apply to the current thread, so that concurrent compilations do not share them."""
+        memo = cls._ode_toolbox_results.get()
+        parallel_jobs_token = cls._parallel_jobs.set(parallel_jobs)
+        memo_token = cls._ode_toolbox_results.set({} if memo is None else memo)
+        try:
+            yield
+        finally:
+            cls._ode_toolbox_results.reset(memo_token)
+            cls._parallel_jobs.reset(parallel_jobs_token)
+
     @classmethod
     def prepare_equations_for_ode_toolbox(cls, neuron, mechs_info):
         """Transforms the collected ode equations to the required input format of ode-toolbox and adds it to the
@@ -103,10 +129,17 @@ class MechanismProcessing:
     @classmethod
     def collect_raw_odetoolbox_output(cls, mechs_info):
         """calls ode-toolbox for each ode individually and collects the raw output"""
-        for mechanism_name, mechanism_info in mechs_info.items():
-            for ode_variable_name, ode_info in mechanism_info["ODEs"].items():
-                solver_result = analysis(ode_info["ode_toolbox_input"], disable_stiffness_check=True)
-                mechs_info[mechanism_name]["ODEs"][ode_variable_name]["ode_toolbox_output"] = solver_result
+        odes = [(mechanism_name, ode_variable_name, ode_info["ode_toolbox_input"])
+                for mechanism_name, mechanism_info in mechs_info.items()
+                for ode_variable_name, ode_info in mechanism_info["ODEs"].items()]
+
+        solver_results = ODEToolboxUtils.analysis_batch([indict for _, _, indict in odes],
+                                                        n_jobs=cls._parallel_jobs.get(),
+                                                        memo=cls._ode_toolbox_results.get(),
+                                                        disable_stiffness_check=True)
+
+        for (mechanism_name, ode_variable_name, _), solver_result in zip(odes, solver_results):
+            mechs_info[mechanism_name]["ODEs"][ode_variable_name]["ode_toolbox_output"] = solver_result
 
         return mechs_info
 
@@ -114,7 +114,6 @@ class MechsInfoEnricher:
                             neuron.get_scope())
                         update_expr_ast.accept(ASTParentVisitor())
                         update_expr_ast.accept(ASTSymbolTableVisitor())
-                        neuron.accept(ASTSymbolTableVisitor())
 
                         solution_transformed["states"][variable_name] = {
                             "ASTVariable": variable,
@@ -19,14 +19,16 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Tuple
+from typing import Callable, Tuple
 
-from antlr4 import CommonTokenStream, FileStream, InputStream
+from antlr4 import CommonTokenStream, FileStream, InputStream, ParserRuleContext
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
 from antlr4.error.Errors import ParseCancellationException
 
 from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
@@ -67,6 +69,8 @@ from pynestml.meta_model.ast_update_block import ASTUpdateBlock
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.arithmetic_expression_parser import ArithmeticExpressionParser
+from pynestml.utils.ast_cache import ASTCache
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.error_listener import NestMLErrorListener
 from pynestml.utils.logger import Logger, LoggingLevel
@@ -74,7 +78,6 @@ from pynestml.utils.messages import Messages
 from pynestml.visitors.assign_implicit_conversion_factors_visitor import AssignImplicitConversionFactorsVisitor
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
 
@@ -98,6 +101,23 @@ class ModelParser:
         code, message = Messages.get_start_processing_file(file_path)
         Logger.log_message(node=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
 
+        ast_cache = None
+        if FrontendConfiguration.get_parse_cache_path():
+            ast_cache = ASTCache(FrontendConfiguration.get_parse_cache_path())
+            ast_cache_key = ast_cache.get_key(input_file.strdata)
+            ast = ast_cache.get(ast_cache_key)
+            if ast is not None:
+                SymbolTable.initialize_symbol_table(ast.get_source_position())
+                for model in ast.get_model_list():
+                    SymbolTable.add_model_scope(model.get_name(), model.get_scope())
+
+                cls._set_file_path(ast, file_path)
+
+                return ast
+
+            predefined_ids = ASTCache.get_predefined_ids()
+            first_message = Logger.curr_message
+
         # create a lexer and hand over the input
         lexer = PyNestMLLexer()
         lexer.removeErrorListeners()
@@ -124,10 +144,8 @@ class ModelParser:
         parser.removeErrorListeners()
         parserErrorListener = NestMLErrorListener()
         parser.addErrorListener(parserErrorListener)
-        # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
-        # parser._errHandler.reset(parser)
         parser.setTokenStream(stream)
-        compilation_unit = parser.nestMLCompilationUnit()
+        compilation_unit = parse_rule(parser, parser.nestMLCompilationUnit)
         if parserErrorListener._error_occurred:
             error_location = ASTSourceLocation(parserErrorListener.line,
                                                parserErrorListener.column,
@@ -142,10 +160,7 @@ class ModelParser:
         ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
         ast = ast_builder_visitor.visit(compilation_unit)
 
-        # create links back from children in the tree to their parents
-        for model in ast.get_model_list():
-            model.parent_ = None   # root node has no parent
-            model.accept(ASTParentVisitor())
+        # the links back from children in the tree to their parents have been set while the nodes were constructed; each model is the root node of its tree and has no parent
 
         # create and update the corresponding symbol tables
         SymbolTable.initialize_symbol_table(ast.get_source_position())
@@ -156,19 +171,34 @@ class ModelParser:
             model.accept(AssignImplicitConversionFactorsVisitor())
             Logger.set_current_node(None)
 
-        # store source paths
+        cls._set_file_path(ast, file_path)
+
+        # only models that were processed without warnings or errors are cached, so that loading a model from the cache does not suppress any messages
+        if ast_cache is not None and not any(Logger.get_log()[i][2] in [LoggingLevel.WARNING, LoggingLevel.ERROR] for i in range(first_message, Logger.curr_message) if i in Logger.get_log().keys()):
+            ast_cache.put(ast_cache_key, ast, predefined_ids)
+
+        return ast
+
+    @classmethod
+    def _set_file_path(cls, ast: ASTNestMLCompilationUnit, file_path: str) -> None:
+        """
+        Store the source path in the compilation unit and its models.
+        """
         for model in ast.get_model_list():
             model.file_path = file_path
 
         ast.file_path = file_path
 
-        return ast
-
     @classmethod
     def parse_expression(cls, string):
         # type: (str) -> ASTExpression
+        ret = ArithmeticExpressionParser.parse(string)
+        if ret is not None:
+            # fast path for purely arithmetic expressions, such as those returned by ODE-toolbox
+            return ret
+
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.expression())
+        ret = builder.visit(parse_rule(parser, parser.expression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -176,7 +206,7 @@ class ModelParser:
     def parse_declaration(cls, string):
         # type: (str) -> ASTDeclaration
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.declaration())
+        ret = builder.visit(parse_rule(parser, parser.declaration))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -184,7 +214,7 @@ class ModelParser:
     def parse_stmt(cls, string):
         # type: (str) -> ASTStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmt())
+        ret = builder.visit(parse_rule(parser, parser.stmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -192,7 +222,7 @@ class ModelParser:
     def parse_assignment(cls, string):
         # type: (str) -> ASTAssignment
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.assignment())
+        ret = builder.visit(parse_rule(parser, parser.assignment))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -200,7 +230,7 @@ class ModelParser:
     def parse_bit_operator(cls, string):
         # type: (str) -> ASTArithmeticOperator
         builder, parser = tokenize(string)
-        ret = builder.visit(parser.bitOperator())
+        ret = builder.visit(parse_rule(parser, parser.bitOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -208,14 +238,14 @@ class ModelParser:
     def parse_block_with_variables(cls, string):
         # type: (str) -> ASTBlockWithVariables
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.blockWithVariables())
+        ret = builder.visit(parse_rule(parser, parser.blockWithVariables))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_model_body(cls, string: str) -> ASTModelBody:
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.modelBody())
+        ret = builder.visit(parse_rule(parser, parser.modelBody))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -223,7 +253,7 @@ class ModelParser:
     def parse_comparison_operator(cls, string):
         # type: (str) -> ASTComparisonOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.comparisonOperator())
+        ret = builder.visit(parse_rule(parser, parser.comparisonOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -231,7 +261,7 @@ class ModelParser:
     def parse_compound_stmt(cls, string):
         # type: (str) -> ASTCompoundStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.compoundStmt())
+        ret = builder.visit(parse_rule(parser, parser.compoundStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -239,7 +269,7 @@ class ModelParser:
     def parse_data_type(cls, string):
         # type: (str) -> ASTDataType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.dataType())
+        ret = builder.visit(parse_rule(parser, parser.dataType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -247,7 +277,7 @@ class ModelParser:
     def parse_elif_clause(cls, string):
         # type: (str) -> ASTElifClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elifClause())
+        ret = builder.visit(parse_rule(parser, parser.elifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -255,7 +285,7 @@ class ModelParser:
     def parse_else_clause(cls, string):
         # type: (str) -> ASTElseClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elseClause())
+        ret = builder.visit(parse_rule(parser, parser.elseClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -263,7 +293,7 @@ class ModelParser:
     def parse_equations_block(cls, string):
         # type: (str) -> ASTEquationsBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.equationsBlock())
+        ret = builder.visit(parse_rule(parser, parser.equationsBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -271,7 +301,7 @@ class ModelParser:
     def parse_for_stmt(cls, string):
         # type: (str) -> ASTForStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.forStmt())
+        ret = builder.visit(parse_rule(parser, parser.forStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -279,7 +309,7 @@ class ModelParser:
     def parse_function(cls, string):
         # type: (str) -> ASTFunction
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.function())
+        ret = builder.visit(parse_rule(parser, parser.function))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -287,7 +317,7 @@ class ModelParser:
     def parse_function_call(cls, string):
         # type: (str) -> ASTFunctionCall
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.functionCall())
+        ret = builder.visit(parse_rule(parser, parser.functionCall))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -295,7 +325,7 @@ class ModelParser:
     def parse_if_clause(cls, string):
         # type: (str) -> ASTIfClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifClause())
+        ret = builder.visit(parse_rule(parser, parser.ifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -303,7 +333,7 @@ class ModelParser:
     def parse_if_stmt(cls, string):
         # type: (str) -> ASTIfStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifStmt())
+        ret = builder.visit(parse_rule(parser, parser.ifStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -311,7 +341,7 @@ class ModelParser:
     def parse_input_block(cls, string):
         # type: (str) -> ASTInputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputBlock())
+        ret = builder.visit(parse_rule(parser, parser.inputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -319,7 +349,7 @@ class ModelParser:
     def parse_input_port(cls, string):
         # type: (str) -> ASTInputPort
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputPort())
+        ret = builder.visit(parse_rule(parser, parser.inputPort))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -327,7 +357,7 @@ class ModelParser:
     def parse_input_qualifier(cls, string):
         # type: (str) -> ASTInputQualifier
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputQualifier())
+        ret = builder.visit(parse_rule(parser, parser.inputQualifier))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -335,7 +365,7 @@ class ModelParser:
     def parse_logic_operator(cls, string):
         # type: (str) -> ASTLogicalOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.logicalOperator())
+        ret = builder.visit(parse_rule(parser, parser.logicalOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -343,7 +373,7 @@ class ModelParser:
     def parse_nestml_compilation_unit(cls, string):
         # type: (str) -> ASTNestMLCompilationUnit
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.nestMLCompilationUnit())
+        ret = builder.visit(parse_rule(parser, parser.nestMLCompilationUnit))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -351,7 +381,7 @@ class ModelParser:
     def parse_model(cls, string):
         # type: (str) -> ASTModel
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.model())
+        ret = builder.visit(parse_rule(parser, parser.model))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -359,7 +389,7 @@ class ModelParser:
     def parse_ode_equation(cls, string):
         # type: (str) -> ASTOdeEquation
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeEquation())
+        ret = builder.visit(parse_rule(parser, parser.odeEquation))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -367,7 +397,7 @@ class ModelParser:
     def parse_inline_expression(cls, string):
         # type: (str) -> ASTInlineExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inlineExpression())
+        ret = builder.visit(parse_rule(parser, parser.inlineExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -375,7 +405,7 @@ class ModelParser:
     def parse_kernel(cls, string):
         # type: (str) -> ASTKernel
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.kernel())
+        ret = builder.visit(parse_rule(parser, parser.kernel))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -383,7 +413,7 @@ class ModelParser:
     def parse_output_block(cls, string):
         # type: (str) -> ASTOutputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.outputBlock())
+        ret = builder.visit(parse_rule(parser, parser.outputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -391,7 +421,7 @@ class ModelParser:
     def parse_parameter(cls, string):
         # type: (str) -> ASTParameter
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.parameter())
+        ret = builder.visit(parse_rule(parser, parser.parameter))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -399,7 +429,7 @@ class ModelParser:
     def parse_return_stmt(cls, string):
         # type: (str) -> ASTReturnStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.returnStmt())
+        ret = builder.visit(parse_rule(parser, parser.returnStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -407,7 +437,7 @@ class ModelParser:
     def parse_simple_expression(cls, string):
         # type: (str) -> ASTSimpleExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.simpleExpression())
+        ret = builder.visit(parse_rule(parser, parser.simpleExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -415,7 +445,7 @@ class ModelParser:
     def parse_small_stmt(cls, string):
         # type: (str) -> ASTSmallStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.smallStmt())
+        ret = builder.visit(parse_rule(parser, parser.smallStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -423,7 +453,7 @@ class ModelParser:
     def parse_unary_operator(cls, string):
         # type: (str) -> ASTUnaryOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unaryOperator())
+        ret = builder.visit(parse_rule(parser, parser.unaryOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -431,7 +461,7 @@ class ModelParser:
     def parse_unit_type(cls, string):
         # type: (str) -> ASTUnitType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unitType())
+        ret = builder.visit(parse_rule(parser, parser.unitType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -439,7 +469,7 @@ class ModelParser:
     def parse_update_block(cls, string):
         # type: (str) -> ASTUpdateBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.updateBlock())
+        ret = builder.visit(parse_rule(parser, parser.updateBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -447,7 +477,7 @@ class ModelParser:
     def parse_variable(cls, string):
         # type: (str) -> ASTVariable
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.variable())
+        ret = builder.visit(parse_rule(parser, parser.variable))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -455,7 +485,7 @@ class ModelParser:
     def parse_while_stmt(cls, string):
         # type: (str) -> ASTWhileStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.whileStmt())
+        ret = builder.visit(parse_rule(parser, parser.whileStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -463,7 +493,7 @@ class ModelParser:
     def parse_stmts_body(cls, string):
         # type: (str) -> ASTStmtsBody
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmtsBody())
+        ret = builder.visit(parse_rule(parser, parser.stmtsBody))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -490,5 +520,31 @@ def tokenize(string: str) -> Tuple[ASTBuilderVisitor, PyNestMLParser]:
     return builder, parser
 
 
+def parse_rule(parser: PyNestMLParser, rule: Callable[[], ParserRuleContext]) -> ParserRuleContext:
+    r"""
+    Invoke a parser rule in two stages. The input is first parsed using the faster SLL prediction mode, without error recovery or reporting. This succeeds for virtually all valid input. Only if it fails, the input is parsed again using full LL prediction mode, with the error strategy and error listeners that were configured on the parser, so that syntax errors are reported exactly as before.
+    :param parser: the parser, with the token stream set
+    :param rule: the rule method of the parser to invoke, e.g. ``parser.expression``
+    :return: the parse tree
+    """
+    error_handler = parser._errHandler
+    error_listeners = list(parser._listeners)
+
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    try:
+        return rule()
+    except ParseCancellationException:
+        pass
+    finally:
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = error_handler
+        parser._listeners = error_listeners
+
+    parser.reset()    # also rewinds the token stream
+    return rule()
+
+
 def log_set_added_source_position(node):
     node.set_source_position(ASTSourceLocation.get_added_source_position())
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+#
+# ode_toolbox_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import hashlib
+import json
+import os
+import tempfile
+
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class ODEToolboxCache:
+    r"""
+    Persistent, content-addressed cache of ODE-toolbox analysis results.
+
+    Each entry is stored as a JSON file in the cache directory. The key is a hash of the canonicalised ODE-toolbox input dictionary, the options passed to ``odetoolbox.analysis()``, and the installed ODE-toolbox and sympy versions, so that results are automatically invalidated when any of these change.
+
+    The total size of the cache directory is bounded by ``max_size`` (in bytes). When the bound is exceeded, least recently used entries are evicted first (the file modification time is updated on every cache hit).
+    """
+
+    def __init__(self, path: str, max_size: int = 256 * 1024 * 1024):
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    @classmethod
+    def _get_versions(cls) -> Dict[str, str]:
+        import importlib.metadata
+        versions = {}
+        for pkg in ["odetoolbox", "sympy"]:
+            try:
+                versions[pkg] = importlib.metadata.version(pkg)
+            except importlib.metadata.PackageNotFoundError:
+                versions[pkg] = ""
+
+        return versions
+
+    def get_key(self, indict: Mapping[str, Any], options: Mapping[str, Any]) -> str:
+        r"""
+        Compute the cache key for a given ODE-toolbox input dictionary and analysis options.
+        :param indict: the ODE-toolbox input dictionary
+        :param options: keyword arguments passed to ``odetoolbox.analysis()``
+        :return: a hexadecimal digest string
+        """
+        canonical = json.dumps({"indict": indict,
+                                "options": options,
+                                "versions": self._get_versions()},
+                               sort_keys=True, separators=(",", ":"), default=str)
+
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _get_filename(self, key: str) -> str:
+        return os.path.join(self.path, key + ".json")
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        r"""
+        Look up a solver result in the cache.
+        :param key: the cache key, as returned by ``get_key()``
+        :return: the cached solver result, or None if the key is not present
+        """
+        fn = self._get_filename(key)
+        try:
+            with open(fn, "r") as f:
+                solver_result = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(fn)    # mark as recently used
+        except OSError:
+            pass
+
+        self.hits += 1
+        Logger.log_message(None, None, "ODE-toolbox cache hit (key: " + key + ")", None, LoggingLevel.DEBUG)
+
+        return solver_result
+
+    def put(self, key: str, solver_result: List[Dict]) -> None:
+        r"""
+        Store a solver result in the cache, evicting old entries if the size bound is exceeded.
+        :param key: the cache key, as returned by ``get_key()``
+        :param solver_result: the result returned by ``odetoolbox.analysis()``
+        """
+        fd, tmp_fn = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(solver_result, f)
+            os.replace(tmp_fn, self._get_filename(key))    # atomic, so concurrent readers never see partial entries
+        except OSError:
+            if os.path.exists(tmp_fn):
+                os.remove(tmp_fn)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        r"""
+        Remove least recently used entries until the total cache size is within the bound.
+        """
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".json"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total_size += st.st_size
+
+        entries.sort()
+        while total_size > self.max_size and entries:
+            _, size, fn = entries.pop(0)
+            try:
+                os.remove(fn)
+            except OSError:
+                continue
+
+            total_size -= size
+            Logger.log_message(None, None, "ODE-toolbox cache: evicted " + fn, None, LoggingLevel.DEBUG)
+
+    def clear(self) -> None:
+        r"""
+        Remove all entries from the cache and reset the statistics.
+        """
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".json"):
+                os.remove(entry.path)
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        r"""
+        Returns hit/miss statistics of this cache instance.
+        :return: a dictionary with keys ``"hits"``, ``"misses"``, ``"entries"`` and ``"size"`` (in bytes)
+        """
+        entries = 0
+        size = 0
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".json"):
+                entries += 1
+                size += entry.stat().st_size
+
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "size": size}
@@ -19,8 +19,14 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-import sympy
-from sympy.printing.str import StrPrinter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import json
+import threading
 
 
 class ODEToolboxUtils:
@@ -32,6 +38,8 @@ class ODEToolboxUtils:
     def _rewrite_piecewise_into_ternary(cls, s: str) -> str:
         r"""Rewrite calls to ``Piecewise((expr_if_true, cond), (expr_if_false, True))`` in sympy syntax to ``cond ? expr_if_true : expr_if_false`` in NESTML syntax.
         """
+        import sympy
+        from sympy.printing.str import StrPrinter
 
         _sympy_globals_no_functions = {"Symbol": sympy.Symbol,
                                        "Integer": sympy.Integer,
@@ -58,3 +66,103 @@ class ODEToolboxUtils:
         s_reformatted = MySympyPrinter().doprint(sympy_expr)
 
         return s_reformatted
+
+    # memoised ODE-toolbox shapes of the ``shared_shapes()`` context that is active in the current thread, if any
+    _shapes_memo: contextvars.ContextVar[Optional[Dict[str, Tuple[Any, Any]]]] = contextvars.ContextVar("nestml_ode_toolbox_shapes_memo", default=None)
+
+    # ``odetoolbox._from_json_to_shapes()`` is replaced while any thread is within a ``shared_shapes()`` context
+    _shared_shapes_lock = threading.Lock()
+    _shared_shapes_users = 0
+    _orig_from_json_to_shapes = None
+
+    @classmethod
+    def _memoised_from_json_to_shapes(cls, indict, parameters=None):
+        memo = cls._shapes_memo.get()
+        if memo is None:
+            # called from a thread that is not within a ``shared_shapes()`` context
+            return cls._orig_from_json_to_shapes(indict, parameters=parameters)
+
+        key = json.dumps({"dynamics": indict["dynamics"],
+                          "options": indict.get("options", {}),
+                          "parameters": {str(k): v for k, v in parameters.items()} if parameters else parameters}, sort_keys=True, default=str)
+        if key not in memo:
+            memo[key] = cls._orig_from_json_to_shapes(indict, parameters=parameters)
+
+        shapes, parameters_ = memo[key]
+
+        return shapes, dict(parameters_)
+
+    @classmethod
+    @contextlib.contextmanager
+    def shared_shapes(cls) -> Iterator[None]:
+        r"""Context manager that shares the symbolic preprocessing between repeated calls to ``odetoolbox.analysis()`` on the same input.
+
+        Converting the input dictionary into ODE-toolbox ``Shape`` instances (parsing, simplification and linearity analysis of every ODE and kernel) is the dominant cost of an analysis. It does not depend on whether the analytic solver is enabled, so within this context, the shapes that are created for a given input are memoised and reused by subsequent calls. The results returned by ODE-toolbox are identical to those without sharing.
+
+        The memoised shapes belong to the context, and are only used by calls in the same thread (or asyncio task), so that concurrent compilations do not share them. While any thread is within such a context, ``odetoolbox._from_json_to_shapes()`` is replaced by a function that looks up the memo of the calling thread; the original function is restored when the last context is left.
+
+        If the installed ODE-toolbox version does not expose ``_from_json_to_shapes()``, this context manager has no effect.
+        """
+        import odetoolbox
+
+        if not hasattr(odetoolbox, "_from_json_to_shapes"):
+            yield
+            return
+
+        with cls._shared_shapes_lock:
+            if cls._shared_shapes_users == 0:
+                cls._orig_from_json_to_shapes = odetoolbox._from_json_to_shapes
+                odetoolbox._from_json_to_shapes = cls._memoised_from_json_to_shapes
+
+            cls._shared_shapes_users += 1
+
+        token = cls._shapes_memo.set({})
+        try:
+            yield
+        finally:
+            cls._shapes_memo.reset(token)
+            with cls._shared_shapes_lock:
+                cls._shared_shapes_users -= 1
+                if cls._shared_shapes_users == 0:
+                    odetoolbox._from_json_to_shapes = cls._orig_from_json_to_shapes
+                    cls._orig_from_json_to_shapes = None
+
+    @classmethod
+    def _analysis_worker(cls, args: Tuple[Dict[str, Any], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        import odetoolbox
+
+        indict, options = args
+        return odetoolbox.analysis(indict, **options)
+
+    @classmethod
+    def analysis_batch(cls, indicts: Sequence[Dict[str, Any]], n_jobs: int = 1, memo: Optional[Dict[str, List[Dict[str, Any]]]] = None, **options) -> List[List[Dict[str, Any]]]:
+        r"""Invoke ``odetoolbox.analysis()`` on each of a sequence of independent input dictionaries.
+
+        Inputs that are identical (for instance, the same mechanism occurring in several neurons) are analysed only once. If a ``memo`` dictionary is passed, results are additionally looked up in and stored into it, so that they can be reused across batches. The remaining inputs are distributed over a pool of ``n_jobs`` worker processes.
+
+        :param indicts: ODE-toolbox input dictionaries
+        :param n_jobs: maximum number of worker processes; if 1, the analyses are run sequentially in the calling process
+        :param memo: optional dictionary in which results are memoised, keyed by the canonicalised input and options
+        :param options: keyword arguments passed to ``odetoolbox.analysis()``
+        :return: the solver results, in the same order as ``indicts``
+        """
+        if memo is None:
+            memo = {}
+
+        keys = [json.dumps({"indict": indict, "options": options}, sort_keys=True, default=str) for indict in indicts]
+
+        todo = {}
+        for key, indict in zip(keys, indicts):
+            if key not in memo and key not in todo:
+                todo[key] = indict
+
+        if n_jobs > 1 and len(todo) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(n_jobs, len(todo))) as executor:
+                solver_results = list(executor.map(cls._analysis_worker, [(indict, options) for indict in todo.values()]))
+        else:
+            solver_results = [cls._analysis_worker((indict, options)) for indict in todo.values()]
+
+        memo.update(zip(todo.keys(), solver_results))
+
+        # return copies, as callers may modify the results
+        return [copy.deepcopy(memo[key]) for key in keys]
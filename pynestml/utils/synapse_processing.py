@@ -31,8 +31,7 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.mechanism_processing import MechanismProcessing
 from pynestml.utils.messages import Messages
-
-from odetoolbox import analysis
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
 
 
 class SynapseProcessing(MechanismProcessing):
@@ -124,11 +123,20 @@ class SynapseProcessing(MechanismProcessing):
 
         parameters_block = neuron.get_parameters_blocks()[0]
 
-        for synapse_name, synapse_info in syns_info.items():
-            for convolution_name, convolution_info in synapse_info["convolutions"].items():
-                kernel_buffer = (convolution_info["kernel"]["ASTKernel"], convolution_info["spikes"]["ASTInputPort"])
-                convolution_solution = cls.ode_solve_convolution(neuron, parameters_block, kernel_buffer)
-                syns_info[synapse_name]["convolutions"][convolution_name]["analytic_solution"] = convolution_solution
+        convolutions = [(synapse_name, convolution_name, (convolution_info["kernel"]["ASTKernel"], convolution_info["spikes"]["ASTInputPort"]))
+                        for synapse_name, synapse_info in syns_info.items()
+                        for convolution_name, convolution_info in synapse_info["convolutions"].items()]
+
+        # all convolutions are independent, so analyse them in a single batch
+        full_solver_results = ODEToolboxUtils.analysis_batch([cls.create_ode_indict(neuron, parameters_block, kernel_buffer) for _, _, kernel_buffer in convolutions],
+                                                             n_jobs=cls._parallel_jobs.get(),
+                                                             memo=cls._ode_toolbox_results.get(),
+                                                             disable_stiffness_check=True,
+                                                             log_level=FrontendConfiguration.logging_level)
+
+        for (synapse_name, convolution_name, _), full_solver_result in zip(convolutions, full_solver_results):
+            convolution_solution = cls.get_analytic_solver(full_solver_result)
+            syns_info[synapse_name]["convolutions"][convolution_name]["analytic_solution"] = convolution_solution
         return syns_info
 
     @classmethod
@@ -138,10 +146,15 @@ class SynapseProcessing(MechanismProcessing):
                               kernel_buffer):
         odetoolbox_indict = cls.create_ode_indict(
             neuron, parameters_block, kernel_buffer)
-        full_solver_result = analysis(
-            odetoolbox_indict,
-            disable_stiffness_check=True,
-            log_level=FrontendConfiguration.logging_level)
+        full_solver_result = ODEToolboxUtils.analysis_batch([odetoolbox_indict],
+                                                            memo=cls._ode_toolbox_results.get(),
+                                                            disable_stiffness_check=True,
+                                                            log_level=FrontendConfiguration.logging_level)[0]
+
+        return cls.get_analytic_solver(full_solver_result)
+
+    @classmethod
+    def get_analytic_solver(cls, full_solver_result):
         analytic_solver = None
         analytic_solvers = [
             x for x in full_solver_result if x["solver"] == "analytical"]
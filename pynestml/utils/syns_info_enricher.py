@@ -29,6 +29,7 @@ from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.compilation_context import ContextScopedMeta
 from pynestml.utils.mechs_info_enricher import MechsInfoEnricher
 from pynestml.utils.model_parser import ModelParser
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
@@ -270,7 +271,10 @@ class SynsInfoEnricher(MechsInfoEnricher):
         return result
 
 
-class SynsInfoEnricherVisitor(ASTVisitor):
+class SynsInfoEnricherVisitor(ASTVisitor, metaclass=ContextScopedMeta):
+    # these attributes are stored in the active compilation context
+    _context_scoped_attributes = ["variables_to_internal_declarations", "internal_variable_name_to_variable", "inline_name_to_transformed_inline", "declarations_ordered"]
+
     variables_to_internal_declarations = {}
     internal_variable_name_to_variable = {}
     inline_name_to_transformed_inline = {}
@@ -322,7 +326,7 @@ class SynsInfoEnricherVisitor(ASTVisitor):
         self.inside_simple_expression = False
 
     def visit_declaration(self, node):
-        self.declarations_ordered.append(node)
+        SynsInfoEnricherVisitor.declarations_ordered.append(node)
         self.inside_declaration = True
         if self.inside_internals_block:
             variable = node.get_variables()[0]
@@ -104,6 +104,30 @@ class ASTBuilderVisitor(PyNestMLParserVisitor):
 
     # Visit a parse tree produced by PyNESTMLParser#rhs.
     def visitExpression(self, ctx):
+        # the sub-expressions are built bottom-up rather than recursively, so that expressions of any depth (e.g. long automatically generated sums) can be built
+        sub_contexts = []
+        stack = [ctx]
+        while stack:
+            sub_ctx = stack.pop()
+            sub_contexts.append(sub_ctx)
+            for child_ctx in (sub_ctx.term, sub_ctx.left, sub_ctx.right, sub_ctx.condition, sub_ctx.ifTrue, sub_ctx.ifNot):
+                if child_ctx is not None:
+                    stack.append(child_ctx)
+
+        expressions = {}
+        for sub_ctx in reversed(sub_contexts):
+            expressions[id(sub_ctx)] = self.build_expression(sub_ctx, expressions)
+
+        return expressions[id(ctx)]
+
+    def build_expression(self, ctx, expressions):
+        """
+        Builds an expression from a parse tree produced by PyNESTMLParser#rhs, whose sub-expressions have already been built.
+        :param ctx: the parse tree of the expression
+        :param expressions: the sub-expressions, by the ``id()`` of their parse tree
+        :return: the expression
+        :rtype: ASTExpression
+        """
         # first check if it is a simple rhs
         if ctx.simpleExpression() is not None:
             return self.visitSimpleExpression(ctx.simpleExpression())
@@ -113,9 +137,9 @@ class ASTBuilderVisitor(PyNestMLParserVisitor):
         # or a term or negated
         unary_operator = (self.visit(ctx.unaryOperator()) if ctx.unaryOperator() is not None else None)
         is_logical_not = (True if ctx.logicalNot is not None else False)
-        expression = self.visit(ctx.term) if ctx.term is not None else None
+        expression = expressions[id(ctx.term)] if ctx.term is not None else None
         # otherwise it is a combined one, check first lhs, then the operator and finally rhs
-        lhs = (self.visit(ctx.left) if ctx.left is not None else None)
+        lhs = (expressions[id(ctx.left)] if ctx.left is not None else None)
         if ctx.powOp is not None:
             source_pos = ASTSourceLocation.make_ast_source_position(start_line=ctx.powOp.line,
                                                                     start_column=ctx.powOp.column,
@@ -166,11 +190,11 @@ class ASTBuilderVisitor(PyNestMLParserVisitor):
             binary_operator = self.visit(ctx.logicalOperator())
         else:
             binary_operator = None
-        rhs = (self.visit(ctx.right) if ctx.right is not None else None)
+        rhs = (expressions[id(ctx.right)] if ctx.right is not None else None)
         # not it was not an operator, thus the ternary one ?
-        condition = (self.visit(ctx.condition) if ctx.condition is not None else None)
-        if_true = (self.visit(ctx.ifTrue) if ctx.ifTrue is not None else None)
-        if_not = (self.visit(ctx.ifNot) if ctx.ifNot is not None else None)
+        condition = (expressions[id(ctx.condition)] if ctx.condition is not None else None)
+        if_true = (expressions[id(ctx.ifTrue)] if ctx.ifTrue is not None else None)
+        if_not = (expressions[id(ctx.ifNot)] if ctx.ifNot is not None else None)
         source_pos = create_source_pos(ctx)
         # finally construct the corresponding rhs
         if expression is not None:
@@ -68,12 +68,44 @@ class ASTExpressionTypeVisitor(ASTVisitor):
     def handle(self, _node):
         """
         Handles the handed over node and executes the required sub routines.
+
+        The type of each node is derived after the types of its children: the ``traverse_*`` methods select the sub-visitor that derives the type of the node, after handing over its children to ``accept()``. As in ``ASTVisitor.handle()``, these children are collected and handled with an explicit stack rather than recursively.
         :param _node: a meta_model node.
         :type _node: AST_
         """
-        self.traverse(_node)
-        self.get_real_self().visit(_node)
-        self.get_real_self().endvisit(_node)
+        if self._pending_nodes is not None:
+            self._pending_nodes.append(_node)
+            return
+
+        # the stack holds triples of a node, a flag that indicates whether the node has already been traversed and the sub-visitor that was selected when traversing the node
+        stack = [(_node, False, None)]
+        try:
+            while stack:
+                node, traversed, real_self = stack.pop()
+                if traversed:
+                    if real_self is not None:
+                        self.set_real_self(real_self)
+
+                    self.get_real_self().visit(node)
+                    self.get_real_self().endvisit(node)
+                    continue
+
+                previous_real_self = self.get_real_self()
+                self.set_real_self(self)
+                children = self._pending_nodes = []
+                self.traverse(node)
+                self._pending_nodes = None
+                real_self = self.get_real_self()
+                if real_self is self:
+                    # no sub-visitor was selected: use the one that was selected last, as would be the case in a recursive traversal
+                    real_self = None
+                    self.set_real_self(previous_real_self)
+
+                stack.append((node, True, real_self))
+                for child in reversed(children):
+                    stack.append((child, False, None))
+        finally:
+            self._pending_nodes = None
 
     def traverse_simple_expression(self, node):
         """
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# ast_multi_visitor.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTMultiVisitor(ASTVisitor):
+    r"""
+    Runs several visitors together, in a single depth-first traversal of the AST. For each node, the ``visit_*`` methods of all visitors are called (in the order in which the visitors were given), then the children of the node are traversed, and then the ``endvisit_*`` methods of all visitors are called.
+
+    Only the handlers that a visitor actually overrides are called, so that the cost per node does not depend on the number of visitors that do nothing for that kind of node. Visitors that customise the traversal itself (by overriding ``handle()`` or any of the ``traverse_*`` methods, for instance to skip a subtree) cannot be combined.
+    """
+
+    def __init__(self, visitors: Sequence[ASTVisitor]):
+        super(ASTMultiVisitor, self).__init__()
+        for visitor in visitors:
+            assert not self.overrides_traversal(visitor), "Visitor " + type(visitor).__name__ + " overrides the traversal and cannot be combined with other visitors"
+
+        self.visitors = list(visitors)
+        self._handlers: Dict[type, Tuple[List[Callable[[ASTNode], None]], List[Callable[[ASTNode], None]]]] = {}
+
+    @classmethod
+    def overrides_traversal(cls, visitor: ASTVisitor) -> bool:
+        r"""
+        Check whether a visitor overrides ``handle()`` or any of the ``traverse_*`` methods.
+        """
+        for name in dir(ASTVisitor):
+            if (name == "handle" or name.startswith("traverse")) and getattr(type(visitor), name) is not getattr(ASTVisitor, name):
+                return True
+
+        return False
+
+    def _get_handlers(self, node_type: type) -> Tuple[List[Callable[[ASTNode], None]], List[Callable[[ASTNode], None]]]:
+        handler_names = ASTVisitor.get_handler_names(node_type)
+        visit_handlers = []
+        endvisit_handlers = []
+        for visitor in self.visitors:
+            for dispatcher_name, handler_name, handlers in [("visit", handler_names[0] if handler_names else None, visit_handlers),
+                                                            ("endvisit", handler_names[2] if handler_names else None, endvisit_handlers)]:
+                if getattr(type(visitor), dispatcher_name) is not getattr(ASTVisitor, dispatcher_name):
+                    # the visitor does its own dispatching, e.g. ``ASTHigherOrderVisitor``
+                    handlers.append(getattr(visitor, dispatcher_name))
+                elif handler_name is not None and getattr(type(visitor), handler_name) is not getattr(ASTVisitor, handler_name):
+                    handlers.append(getattr(visitor, handler_name))
+
+        self._handlers[node_type] = visit_handlers, endvisit_handlers
+
+        return visit_handlers, endvisit_handlers
+
+    def visit(self, node: ASTNode):
+        handlers = self._handlers.get(type(node))
+        if handlers is None:
+            handlers = self._get_handlers(type(node))
+
+        for handler in handlers[0]:
+            handler(node)
+
+    def endvisit(self, node: ASTNode):
+        handlers = self._handlers.get(type(node))
+        if handlers is None:
+            handlers = self._get_handlers(type(node))
+
+        for handler in handlers[1]:
+            handler(node)
@@ -35,9 +35,30 @@ class ASTParentAwareVisitor(ASTVisitor):
         self.parents = Stack()
 
     def handle(self, _node):
-        self.visit(_node)
-        self.parents.push(_node)
-        self.traverse(_node)
-        self.parents.pop()
-        self.endvisit(_node)
-        return
+        if self._pending_nodes is not None:
+            # called from a ``traverse_*`` method, see ``ASTVisitor.handle()``
+            self._pending_nodes.append(_node)
+            return
+
+        stack = [_node, False]
+        try:
+            while stack:
+                visited = stack.pop()
+                node = stack.pop()
+                if visited:
+                    self.parents.pop()
+                    self.endvisit(node)
+                    continue
+
+                self.visit(node)
+                self.parents.push(node)
+                children = self._pending_nodes = []
+                self.traverse(node)
+                self._pending_nodes = None
+                stack.append(node)
+                stack.append(True)
+                for child in reversed(children):
+                    stack.append(child)
+                    stack.append(False)
+        finally:
+            self._pending_nodes = None
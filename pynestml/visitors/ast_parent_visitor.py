@@ -36,3 +36,5 @@ class ASTParentVisitor(ASTVisitor):
         children = node.get_children()
         for child in children:
             child.parent_ = node
+
+        node.tree_modified()
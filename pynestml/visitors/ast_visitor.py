@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Callable, Dict, List, Optional, Tuple
+
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
@@ -70,6 +72,12 @@ class ASTVisitor:
         real_self (ASTVisitor): The visitor which will be used during the visiting of a node.
     """
 
+    # the children of the node that is currently being traversed, see ``handle()``
+    _pending_nodes = None    # type: Optional[List[ASTNode]]
+
+    # the visit, traverse and endvisit methods for each node class, see ``handle()``
+    _bound_handlers = None    # type: Optional[Dict[type, Tuple[Optional[Callable[[ASTNode], None]], Callable[[ASTNode], None], Optional[Callable[[ASTNode], None]]]]]
+
     def __init__(self):
         """
         Standard constructor.
@@ -727,139 +735,160 @@ class ASTVisitor:
         return self.real_self
 
     def handle(self, _node):
-        self.get_real_self().visit(_node)
-        self.get_real_self().traverse(_node)
-        self.get_real_self().endvisit(_node)
+        """
+        Visits the handed over node, traverses its children and endvisits it.
+
+        The traversal is carried out with an explicit stack instead of recursion, so that trees of any depth (for instance, long sums in automatically generated ODEs) can be handled. To this end, the children that the ``traverse_*`` methods hand over to ``accept()`` are collected rather than handled immediately. Calls of ``accept()`` from within the ``visit_*`` and ``endvisit_*`` methods are handled immediately, as before.
+        :param _node: a single node
+        :type _node: ASTNode
+        """
+        if self._pending_nodes is not None:
+            # called from a ``traverse_*`` method: handle the child node once the traversal of its parent is complete
+            self._pending_nodes.append(_node)
+            return
+
+        if self.get_real_self() is not self:
+            self.get_real_self().visit(_node)
+            self.get_real_self().traverse(_node)
+            self.get_real_self().endvisit(_node)
+            return
+
+        bound_handlers = self._bound_handlers
+        if bound_handlers is None:
+            bound_handlers = self._bound_handlers = {}
+
+        # the stack holds pairs of a node and a flag that indicates whether the node has already been visited and traversed
+        stack = [_node, False]
+        try:
+            while stack:
+                visited = stack.pop()
+                node = stack.pop()
+                handlers = bound_handlers.get(type(node))
+                if handlers is None:
+                    handlers = self._get_bound_handlers(type(node))
+
+                if visited:
+                    handlers[2](node)
+                    continue
+
+                if handlers[0] is not None:
+                    handlers[0](node)
+
+                children = self._pending_nodes = []
+                handlers[1](node)
+                self._pending_nodes = None
+                if not children:
+                    if handlers[2] is not None:
+                        handlers[2](node)
+
+                    continue
+
+                if handlers[2] is not None:
+                    stack.append(node)
+                    stack.append(True)
+
+                for child in reversed(children):
+                    stack.append(child)
+                    stack.append(False)
+        finally:
+            self._pending_nodes = None
+
+    def _get_bound_handlers(self, node_type: type) -> Tuple[Optional[Callable[[ASTNode], None]], Callable[[ASTNode], None], Optional[Callable[[ASTNode], None]]]:
+        r"""
+        Return the methods of this visitor that visit, traverse and endvisit nodes of the given type, as used by ``handle()``. Visit and endvisit methods that are not overridden do nothing and are returned as ``None``. If this visitor overrides one of the dispatcher methods ``visit()``, ``traverse()`` and ``endvisit()``, the dispatcher method is returned instead.
+        """
+        handler_names = ASTVisitor.get_handler_names(node_type)
+        handlers = []
+        for i, dispatcher_name in enumerate(["visit", "traverse", "endvisit"]):
+            if getattr(type(self), dispatcher_name) is not getattr(ASTVisitor, dispatcher_name):
+                handlers.append(getattr(self, dispatcher_name))
+            elif handler_names is None:
+                handlers.append(None if dispatcher_name != "traverse" else self.traverse)
+            elif dispatcher_name != "traverse" and getattr(type(self), handler_names[i]) is getattr(ASTVisitor, handler_names[i]):
+                handlers.append(None)
+            else:
+                handlers.append(getattr(self, handler_names[i]))
+
+        self._bound_handlers[node_type] = handlers = tuple(handlers)
+
+        return handlers
+
+    # node classes and the suffix of their handler methods, e.g. ``visit_block()``, in the order in which they are matched: nodes of a subclass that is not listed are handled as their first matching base class
+    _dispatch_order = [(ASTArithmeticOperator, "arithmetic_operator"),
+                       (ASTAssignment, "assignment"),
+                       (ASTBitOperator, "bit_operator"),
+                       (ASTStmtsBody, "block"),
+                       (ASTBlockWithVariables, "block_with_variables"),
+                       (ASTModelBody, "model_body"),
+                       (ASTComparisonOperator, "comparison_operator"),
+                       (ASTCompoundStmt, "compound_stmt"),
+                       (ASTDataType, "data_type"),
+                       (ASTDeclaration, "declaration"),
+                       (ASTElifClause, "elif_clause"),
+                       (ASTElseClause, "else_clause"),
+                       (ASTEquationsBlock, "equations_block"),
+                       (ASTExpression, "expression"),
+                       (ASTForStmt, "for_stmt"),
+                       (ASTFunction, "function"),
+                       (ASTFunctionCall, "function_call"),
+                       (ASTIfClause, "if_clause"),
+                       (ASTIfStmt, "if_stmt"),
+                       (ASTInputBlock, "input_block"),
+                       (ASTInputPort, "input_port"),
+                       (ASTInputQualifier, "input_qualifier"),
+                       (ASTLogicalOperator, "logical_operator"),
+                       (ASTNestMLCompilationUnit, "compilation_unit"),
+                       (ASTModel, "model"),
+                       (ASTOdeEquation, "ode_equation"),
+                       (ASTInlineExpression, "inline_expression"),
+                       (ASTKernel, "kernel"),
+                       (ASTOutputBlock, "output_block"),
+                       (ASTParameter, "parameter"),
+                       (ASTReturnStmt, "return_stmt"),
+                       (ASTSimpleExpression, "simple_expression"),
+                       (ASTSmallStmt, "small_stmt"),
+                       (ASTUnaryOperator, "unary_operator"),
+                       (ASTUnitType, "unit_type"),
+                       (ASTUpdateBlock, "update_block"),
+                       (ASTOnReceiveBlock, "on_receive_block"),
+                       (ASTOnConditionBlock, "on_condition_block"),
+                       (ASTVariable, "variable"),
+                       (ASTWhileStmt, "while_stmt"),
+                       (ASTStmt, "stmt")]
+
+    # concrete node class -> names of its visit, traverse and endvisit handler methods; resolved once per class
+    _handler_names: Dict[type, Optional[Tuple[str, str, str]]] = {}
+
+    @classmethod
+    def get_handler_names(cls, node_type: type) -> Optional[Tuple[str, str, str]]:
+        r"""
+        Return the names of the methods that handle nodes of the given class.
+        :param node_type: the class of the node
+        :return: a tuple of the names of the visit, traverse and endvisit methods, or None if nodes of this class are not handled
+        """
+        try:
+            return ASTVisitor._handler_names[node_type]
+        except KeyError:
+            pass
+
+        handler_names = None
+        for ast_class, suffix in ASTVisitor._dispatch_order:
+            if issubclass(node_type, ast_class):
+                handler_names = ("visit_" + suffix, "traverse_" + suffix, "endvisit_" + suffix)
+                break
+
+        ASTVisitor._handler_names[node_type] = handler_names
+
+        return handler_names
 
     def visit(self, node: ASTNode):
         """
         Dispatcher for visitor pattern.
         :param node: The ASTNode to visit
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.visit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.visit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.visit_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.visit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.visit_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.visit_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.visit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.visit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.visit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.visit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.visit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.visit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.visit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.visit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.visit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.visit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.visit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.visit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.visit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.visit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.visit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.visit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.visit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.visit_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.visit_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.visit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.visit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.visit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.visit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.visit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.visit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.visit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.visit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.visit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.visit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.visit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.visit_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.visit_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.visit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.visit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.visit_stmt(node)
-            return
-        return
+        handler_names = ASTVisitor.get_handler_names(type(node))
+        if handler_names is not None:
+            getattr(self, handler_names[0])(node)
 
     def traverse(self, node):
         """
@@ -867,130 +896,9 @@ class ASTVisitor:
         :param node: The ASTElement to visit
         :type node: Inherited from ASTElement
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.traverse_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.traverse_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.traverse_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.traverse_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.traverse_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.traverse_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.traverse_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.traverse_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.traverse_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.traverse_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.traverse_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.traverse_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.traverse_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.traverse_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.traverse_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.traverse_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.traverse_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.traverse_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.traverse_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.traverse_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.traverse_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.traverse_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.traverse_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.traverse_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.traverse_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.traverse_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.traverse_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.traverse_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.traverse_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.traverse_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.traverse_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.traverse_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.traverse_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.traverse_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.traverse_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.traverse_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.traverse_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.traverse_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.traverse_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.traverse_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.traverse_stmt(node)
-            return
-        return
+        handler_names = ASTVisitor.get_handler_names(type(node))
+        if handler_names is not None:
+            getattr(self, handler_names[1])(node)
 
     def endvisit(self, node):
         """
@@ -998,129 +906,9 @@ class ASTVisitor:
         :param node: The ASTElement to endvisit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.endvisit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.endvisit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.endvisit_bit_operator(node)
-            return
-        if isinstance(node, ASTStmtsBody):
-            self.endvisit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.endvisit_block_with_variables(node)
-            return
-        if isinstance(node, ASTModelBody):
-            self.endvisit_model_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.endvisit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.endvisit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.endvisit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.endvisit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.endvisit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.endvisit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.endvisit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.endvisit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.endvisit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.endvisit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.endvisit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.endvisit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.endvisit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.endvisit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.endvisit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.endvisit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.endvisit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.endvisit_compilation_unit(node)
-            return
-        if isinstance(node, ASTModel):
-            self.endvisit_model(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.endvisit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.endvisit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.endvisit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.endvisit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.endvisit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.endvisit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.endvisit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.endvisit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.endvisit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.endvisit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.endvisit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.endvisit_on_receive_block(node)
-            return
-        if isinstance(node, ASTOnConditionBlock):
-            self.endvisit_on_condition_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.endvisit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.endvisit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.endvisit_stmt(node)
-            return
+        handler_names = ASTVisitor.get_handler_names(type(node))
+        if handler_names is not None:
+            getattr(self, handler_names[2])(node)
 
     def traverse_arithmetic_operator(self, node):
         return
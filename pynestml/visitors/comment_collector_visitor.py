@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pynestml.generated.PyNestMLParserVisitor import PyNestMLParserVisitor
 
@@ -44,122 +44,135 @@ class CommentCollectorVisitor(PyNestMLParserVisitor):
         self.__tokens = tokens
         self.__strip_delim = strip_delim
 
+        # comments are memoised by the index of the start token of the context
+        self.__pre_comments = {}
+        self.__in_comments = {}
+
+        # index of the first token that is part of a definition; any context that starts before or at this token has nothing defined before it
+        self.__first_definition_index = len(tokens)
+        for i, token in enumerate(tokens):
+            if token.channel == 0 and not is_newline(token) and not is_indent(token):
+                self.__first_definition_index = i
+                break
+
     def visitBlockWithVariables(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitModel(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitOdeEquation(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitInlineExpression(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitKernel(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitSmallStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitCompoundStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitSpikeInputPort(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitContinuousInputPort(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitDeclaration(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitAssignment(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitUpdateBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitOnReceiveBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comments(ctx, self.__tokens),
-                get_in_comment(ctx, self.__tokens))
+        return self.__collect(ctx)
 
     def visitOnConditionBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comments(ctx, self.__tokens),
-                get_in_comment(ctx, self.__tokens))
+        return self.__collect(ctx)
 
     def visitEquationsBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitInputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitOutputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitFunctionCall(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitFunction(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitForStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitWhileStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens, self.__strip_delim), get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim))
+        return self.__collect(ctx, self.__strip_delim)
 
     def visitIfClause(self, ctx):
+        _, pre_comments, in_comment = self.__collect(ctx, self.__strip_delim)
         temp = list()
-        temp.extend(get_pre_comments(ctx, self.__tokens, self.__strip_delim))
-        temp.append(get_in_comment(ctx, self.__tokens, self.__strip_delim))
-        return (temp, get_pre_comments(ctx, self.__tokens, self.__strip_delim),
-                get_in_comment(ctx, self.__tokens, self.__strip_delim), list())
+        temp.extend(pre_comments)
+        temp.append(in_comment)
+        return (temp, list(pre_comments), in_comment, list())
 
     def visitElifClause(self, ctx):
-        temp = get_in_comment(ctx, self.__tokens, self.__strip_delim)
-        if temp is None:
+        in_comment = self.__get_in_comment(ctx, self.__strip_delim)
+        if in_comment is None:
             temp = list()
         else:
-            temp = list(temp)
+            temp = list(in_comment)
         # for elif clauses, only in comments are supported
-        return (temp, list(), get_in_comment(ctx, self.__tokens, self.__strip_delim),
+        return (temp, list(), in_comment,
                 list())
 
     def visitElseClause(self, ctx):
-        temp = get_in_comment(ctx, self.__tokens, self.__strip_delim)
-        if temp is None:
+        in_comment = self.__get_in_comment(ctx, self.__strip_delim)
+        if in_comment is None:
             temp = list()
         else:
-            temp = list(temp)
-        return temp, list(), get_in_comment(ctx, self.__tokens, self.__strip_delim)
+            temp = list(in_comment)
+        return temp, list(), in_comment
+
+    def __collect(self, ctx, strip_delim: bool = True) -> Tuple[List[str], List[str], Optional[str]]:
+        """
+        Returns the comments, pre-comments and in-comment of a context. Nested contexts that start at the same token (e.g. a statement and its assignment) have the same comments, so these are computed only once per start token.
+        """
+        key = (ctx.start.tokenIndex, strip_delim)
+        if key not in self.__pre_comments.keys():
+            self.__pre_comments[key] = get_pre_comments(ctx, self.__tokens, strip_delim, empty_before=ctx.start.tokenIndex <= self.__first_definition_index)
+
+        pre_comments = self.__pre_comments[key]
+        in_comment = self.__get_in_comment(ctx, strip_delim)
+
+        # return copies, as the lists are stored in the AST and may be modified
+        comments = list(pre_comments)
+        if in_comment is not None:
+            comments.append(in_comment)
+
+        return comments, list(pre_comments), in_comment
+
+    def __get_in_comment(self, ctx, strip_delim: bool = True) -> Optional[str]:
+        key = (ctx.start.tokenIndex, strip_delim)
+        if key not in self.__in_comments.keys():
+            self.__in_comments[key] = get_in_comment(ctx, self.__tokens, strip_delim)
+
+        return self.__in_comments[key]
 
 
 def is_newline(tok):
@@ -174,6 +187,17 @@ def is_dedent(tok):
     return tok.type == 2  # DEDENT token
 
 
+def _get_start_index(ctx, tokens) -> int:
+    """
+    Returns the position of the start token of ctx in the list of tokens.
+    """
+    index = ctx.start.tokenIndex
+    if 0 <= index < len(tokens) and tokens[index] is ctx.start:
+        return index
+
+    return tokens.index(ctx.start)
+
+
 def get_comments(ctx, tokens, strip_delim: bool = True) -> List[str]:
     """
     Returns all pre- and inline comments.
@@ -193,21 +217,24 @@ def get_comments(ctx, tokens, strip_delim: bool = True) -> List[str]:
     return ret
 
 
-def get_pre_comments(ctx, tokens, strip_delim: bool = True) -> List[str]:
+def get_pre_comments(ctx, tokens, strip_delim: bool = True, empty_before: Optional[bool] = None) -> List[str]:
     """
     Returns the comment which has been started before this element but also before the next previous token.
     :param ctx: a context
     :type ctx: ctx
     :param tokens: list of token objects
     :type tokens: list(Tokens)
+    :param empty_before: whether nothing has been defined before the start of ctx; computed if not given
     :return: the corresponding comments
     """
     # first find the position of this token in the stream
     comments = list()
-    empty_before = __no_definitions_before(ctx, tokens)
+    if empty_before is None:
+        empty_before = __no_definitions_before(ctx, tokens)
     temp = None
     lastToken = None
-    for possibleCommentToken in reversed(tokens[0:tokens.index(ctx.start)]):
+    for i in range(_get_start_index(ctx, tokens) - 1, -1, -1):
+        possibleCommentToken = tokens[i]
         # if we hit a normal token (i.e. not whitespace and not newline) then stop
         if possibleCommentToken.channel == 0 \
                 and not (is_newline(possibleCommentToken)
@@ -264,7 +291,8 @@ def __no_definitions_before(ctx, tokens):
     :return: True if nothing defined before, otherwise False.
     :rtype: bool
     """
-    for token in tokens[0:tokens.index(ctx.start)]:
+    for i in range(_get_start_index(ctx, tokens)):
+        token = tokens[i]
         if token.channel == 0 and not is_newline(token) and not is_indent(token):
             return False
     return True
@@ -280,7 +308,8 @@ def get_in_comment(ctx, tokens, strip_delim: bool = True) -> Optional[str]:
     :return: a comment
     """
     prevToken = None
-    for possibleComment in tokens[tokens.index(ctx.start):]:
+    for i in range(_get_start_index(ctx, tokens), len(tokens)):
+        possibleComment = tokens[i]
         if possibleComment.channel == 2:
             if is_newline(possibleComment):  # new line, thus the one line comment ends here
                 break
@@ -34,6 +34,7 @@ from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+from pynestml.visitors.comment_collector_visitor import CommentCollectorVisitor, get_comments, get_in_comment, get_pre_comments
 
 # setups the infrastructure
 PredefinedUnits.register_units()
@@ -99,6 +100,31 @@ class CommentTest(unittest.TestCase):
         # check that update comment is detected
         self.assertEqual(model_body_elements[6].get_comment()[0], 'update comment ok')
 
+    def test_comment_collector_memoisation(self):
+        """
+        Check that the comments returned by the visitor (which memoises by start token) are the same as those computed for each context individually, and are not shared between contexts.
+        """
+        input_file = FileStream(
+            os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), 'resources')),
+                         'CommentTest.nestml'))
+        stream = CommonTokenStream(PyNestMLLexer(input_file))
+        stream.fill()
+        compilation_unit = PyNestMLParser(stream).nestMLCompilationUnit()
+
+        comment_collector = CommentCollectorVisitor(stream.tokens)
+        n_checked = 0
+        contexts = [compilation_unit]
+        while contexts:
+            ctx = contexts.pop()
+            contexts.extend(child for child in ctx.getChildren() if isinstance(child, ParserRuleContext))
+            if type(ctx).__name__ in ["StmtContext", "SmallStmtContext", "DeclarationContext", "BlockWithVariablesContext", "EquationsBlockContext"]:
+                comments = comment_collector.visit(ctx)
+                assert comments == (get_comments(ctx, stream.tokens), get_pre_comments(ctx, stream.tokens), get_in_comment(ctx, stream.tokens))
+                assert comment_collector.visit(ctx)[0] is not comments[0]
+                n_checked += 1
+
+        assert n_checked > 0
+
 
 if __name__ == '__main__':
     unittest.main()
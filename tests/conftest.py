@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# conftest.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.meta_model.ast_node import ASTNode
+
+
+@pytest.fixture(autouse=True, scope="session")
+def check_parent_links():
+    r"""Check the consistency of the parent links of the AST whenever a parent is looked up during the tests"""
+    ASTNode.check_parent_links = True
+    yield
+    ASTNode.check_parent_links = False
@@ -25,9 +25,11 @@ import unittest
 
 from antlr4 import *
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.model_parser import parse_rule, tokenize
 
 
 class LexerParserTest(unittest.TestCase):
@@ -60,6 +62,32 @@ class LexerParserTest(unittest.TestCase):
             compilation_unit = parser.nestMLCompilationUnit()
             assert compilation_unit is not None
 
+    def test_parse_rule(self):
+        """
+        Check that two-stage (SLL, then LL) parsing yields the same parse trees as parsing in LL mode, and that syntax errors are still reported.
+        """
+        model_files = glob.glob(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(os.pardir, "models", "neurons", "*.nestml"))))
+        assert len(model_files) > 0
+
+        for filename in model_files:
+            trees = []
+            for two_stage in [False, True]:
+                stream = CommonTokenStream(PyNestMLLexer(FileStream(filename)))
+                stream.fill()
+                parser = PyNestMLParser(stream)
+                if two_stage:
+                    compilation_unit = parse_rule(parser, parser.nestMLCompilationUnit)
+                else:
+                    compilation_unit = parser.nestMLCompilationUnit()
+
+                trees.append(compilation_unit.toStringTree(recog=parser))
+
+            assert trees[0] == trees[1]
+
+        builder, parser = tokenize("a + (b * c")
+        with self.assertRaises(ParseCancellationException):
+            parse_rule(parser, parser.expression)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# test_arithmetic_expression_parser.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.arithmetic_expression_parser import ArithmeticExpressionParser
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import tokenize
+
+
+class TestArithmeticExpressionParser:
+    r"""Test that the direct expression parser builds the same ASTs as the ANTLR parser"""
+
+    @pytest.fixture(scope="module", autouse=True)
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.INFO)
+
+    @pytest.mark.parametrize("string", ["a*(b+c)**-2",
+                                        "-x**2",
+                                        "2**3**4",
+                                        "a - b - c",
+                                        "a / b * c % d",
+                                        "exp(-__h/tau_syn)*I_syn + __P__V_m__I_syn*(-x)",
+                                        "1.0e-3*V_m",
+                                        "1e3 + .5 + 2. + 1.e-2 + 42",
+                                        "-(+a)",
+                                        "max(a, min(b, 0))",
+                                        "foo()",
+                                        "a**-b*c",
+                                        "V_m "])
+    def test_same_ast_as_antlr(self, string):
+        expr = ArithmeticExpressionParser.parse(string)
+        builder, parser = tokenize(string)
+        expected = builder.visit(parser.expression())
+
+        assert expr is not None
+        assert expr.equals(expected)
+        assert NESTMLPrinter().print(expr) == NESTMLPrinter().print(expected)
+
+    @pytest.mark.parametrize("string", ["",
+                                        " a + b",
+                                        "a +\nb",
+                                        "10 mV",
+                                        "V_m'",
+                                        "a < b",
+                                        "a and b",
+                                        "true",
+                                        "inf",
+                                        "a[1]",
+                                        "a ? b : c",
+                                        "(a + b",
+                                        "a + b)",
+                                        "a b",
+                                        "a +",
+                                        "\"abc\""])
+    def test_unsupported_expression(self, string):
+        assert ArithmeticExpressionParser.parse(string) is None
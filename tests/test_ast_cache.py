@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+import tempfile
+
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_cache import ASTCache
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+class TestASTCache:
+    r"""Test the persistent cache of parsed models"""
+
+    @pytest.fixture(scope="module", autouse=True)
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.INFO)
+
+    def test_parse_cache(self):
+        fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        cache_path = tempfile.mkdtemp(prefix="nestml-parse-cache-")
+
+        FrontendConfiguration.parse_cache_path = cache_path
+        try:
+            ast = ModelParser.parse_file(fname)
+            cached_ast = ModelParser.parse_file(fname)
+        finally:
+            FrontendConfiguration.parse_cache_path = None
+
+        cache = ASTCache(cache_path)
+        with open(fname, "r", encoding="utf-8") as f:
+            key = cache.get_key(f.read())
+
+        assert os.path.isfile(os.path.join(cache_path, key + ".pickle"))
+        assert cached_ast is not ast
+        assert NESTMLPrinter().print(cached_ast) == NESTMLPrinter().print(ast)
+        assert cached_ast.file_path == fname
+
+        # the symbol table of the cached model refers to the predefined symbols of the current process
+        model = cached_ast.get_model_list()[0]
+        assert SymbolTable.name2model_scope[model.get_name()] is model.get_scope()
+        assert model.get_scope().resolve_to_symbol("exp", SymbolKind.FUNCTION) is PredefinedFunctions.get_function("exp")
+        assert model.get_scope().resolve_to_symbol("e", SymbolKind.VARIABLE) is PredefinedVariables.get_euler_constant()
+
+    def test_key_depends_on_content(self):
+        cache = ASTCache(tempfile.mkdtemp(prefix="nestml-parse-cache-"))
+        assert cache.get_key("model a:\n") == cache.get_key("model a:\n")
+        assert cache.get_key("model a:\n") != cache.get_key("model b:\n")
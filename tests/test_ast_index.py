@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_index.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import threading
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.utils.ast_index import ASTIndex
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+def get_nodes(ast):
+    nodes = []
+    ast.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+    return nodes
+
+
+def query(node):
+    r"""Run the ``ASTUtils`` helpers that can use the index on the subtree of ``node``"""
+    return [ASTUtils.get_all(node, ASTVariable),
+            ASTUtils.get_all(node, ASTExpression),
+            ASTUtils.get_all(node, (ASTSimpleExpression, ASTDeclaration)),
+            ASTUtils.get_function_call(node, PredefinedFunctions.EXP),
+            ASTUtils.get_function_calls(node, [PredefinedFunctions.CONVOLVE, PredefinedFunctions.INTEGRATE_ODES]),
+            ASTUtils.get_inline_expression_symbols(node) if node.get_scope() is not None else [],
+            ASTUtils.collect_variable_names_in_expression(node)]
+
+
+def lookup(model, name):
+    r"""Run the ``ASTUtils`` helpers that look up variables and declarations by name in a model"""
+    return [ASTUtils.get_state_variable_by_name(model, name),
+            ASTUtils.get_state_variable_declaration_by_name(model, name),
+            ASTUtils.get_parameter_variable_by_name(model, name),
+            ASTUtils.get_parameter_by_name(model, name),
+            ASTUtils.get_internal_variable_by_name(model, name),
+            ASTUtils.get_internal_by_name(model, name),
+            ASTUtils.get_inline_expression_by_name(model, name),
+            ASTUtils.get_variable_by_name(model, name) if len(model.get_equations_blocks()) <= 1 else None]
+
+
+@pytest.fixture(scope="module")
+def models():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    fnames = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, "models", "**", "*.nestml"), recursive=True))
+    return [model for fname in fnames for model in ModelParser.parse_file(fname).get_model_list()]
+
+
+class TestASTIndex:
+
+    def test_index(self, models):
+        r"""Check that the helpers give the same results with the index as by traversing the tree, for the subtree of every node of each model"""
+        for model in models:
+            nodes = [node for node in get_nodes(model) if isinstance(node, (ASTVariable, ASTFunctionCall)) or node.get_children()]
+            expected = [query(node) for node in nodes]
+            with ASTIndex.enabled():
+                assert ASTIndex.get_index(model) is ASTIndex.get_index(nodes[-1])
+                for node, expected_results in zip(nodes, expected):
+                    assert ASTIndex.get_index(node) is not None
+                    results = query(node)
+                    assert all([len(result) == len(expected_result) and all(a is b for a, b in zip(result, expected_result)) for result, expected_result in zip(results, expected_results)])
+
+            assert ASTIndex.get_index(model) is None
+
+    def test_index_by_name(self, models):
+        r"""Check the lookup of variables and declarations by name"""
+        model = [model for model in models if model.get_name() == "iaf_psc_exp_neuron"][0]
+        with ASTIndex.enabled():
+            index = ASTIndex.get_index(model)
+            state_block = model.get_state_blocks()[0]
+            assert index.get_declarations(model, "V_m") == [state_block.get_declarations()[0]]
+            assert index.get_declarations(model.get_parameters_blocks()[0], "V_m") == []
+            assert all(variable.get_name() == "V_m" for variable in index.get_variables(model, "V_m"))
+            assert len(index.get_variables(model, "V_m")) == len([node for node in get_nodes(model) if isinstance(node, ASTVariable) and node.get_name() == "V_m"])
+            assert index.get_variables(model, "no_such_variable") == []
+
+    def test_variable_lookup(self, models):
+        r"""Check that variables, declarations and inline expressions are looked up by name with the index in the same way as by searching the blocks of the model"""
+        for model in models:
+            names = [variable.get_name() for variable in get_nodes(model) if isinstance(variable, ASTVariable)] + ["no_such_variable"]
+            expected = [lookup(model, name) for name in names]
+            with ASTIndex.enabled():
+                for name, expected_results in zip(names, expected):
+                    results = lookup(model, name)
+                    assert results[:-1] == expected_results[:-1]
+                    assert (results[-1] is None) == (expected_results[-1] is None)
+                    if results[-1] is not None:
+                        assert results[-1].get_name() == expected_results[-1].get_name()
+                        assert results[-1].get_scope() is expected_results[-1].get_scope()
+
+    def test_invalidation(self, models):
+        r"""Check that the index is built again after the model has been modified"""
+        model = models[0].clone()
+        declaration = model.get_state_blocks()[0].get_declarations()[0]
+        source_position = ASTSourceLocation.get_added_source_position()
+        with ASTIndex.enabled():
+            index = ASTIndex.get_index(model)
+            assert ASTIndex.get_index(model) is index
+
+            declaration.set_expression(ASTNodeFactory.create_ast_simple_expression(variable=ASTNodeFactory.create_ast_variable("foo", source_position=source_position), source_position=source_position))
+            assert ASTIndex.get_index(model) is not index
+            assert ASTUtils.get_all(model, ASTVariable) == [node for node in get_nodes(model) if isinstance(node, ASTVariable)]
+            assert [variable.get_name() for variable in ASTIndex.get_index(model).get_variables(model, "foo")] == ["foo"]
+
+            index = ASTIndex.get_index(model)
+            declaration.get_variables()[0].set_name("bar")
+            assert ASTIndex.get_index(model) is not index
+            assert [variable.get_name() for variable in ASTIndex.get_index(model).get_variables(model, "bar")] == ["bar"]
+
+            # nodes that are not part of a model are not indexed
+            assert ASTIndex.get_index(ASTNodeFactory.create_ast_variable("foo", source_position=source_position)) is None
+
+    def test_threads(self, models):
+        r"""Check that the index is only used in the thread that has enabled it"""
+        model = models[0]
+        indices_in_thread = []
+        thread = threading.Thread(target=lambda: indices_in_thread.append(ASTIndex.get_index(model)))
+        with ASTIndex.enabled():
+            assert ASTIndex.get_index(model) is not None
+            thread.start()
+            thread.join()
+
+            with ASTIndex.enabled():
+                assert ASTIndex.get_index(model) is not None
+
+            assert ASTIndex.get_index(model) is not None
+
+        assert indices_in_thread == [None]
+        assert ASTIndex.get_index(model) is None
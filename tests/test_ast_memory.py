@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_memory.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import pickle
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_model import ASTModel
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTNodeCollector(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.nodes = []
+
+    def visit(self, node):
+        self.nodes.append(node)
+
+
+def get_nodes(ast):
+    collector = ASTNodeCollector()
+    ast.accept(collector)
+    return collector.nodes
+
+
+@pytest.fixture(scope="module")
+def asts():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    fnames = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, "models", "**", "*.nestml"), recursive=True))
+    return [ModelParser.parse_file(fname) for fname in fnames]
+
+
+class TestASTMemory:
+
+    def test_slots(self, asts):
+        r"""Check that AST nodes do not carry a ``__dict__``, and that comments and source positions are shared between nodes"""
+        n_nodes_without_comments = 0
+        for ast in asts:
+            for node in get_nodes(ast):
+                assert isinstance(node, ASTModel) or not hasattr(node, "__dict__"), type(node).__name__ + " has a __dict__"
+                assert node.get_source_position() is ASTSourceLocation.make_ast_source_position(node.get_source_position().get_start_line(), node.get_source_position().get_start_column(), node.get_source_position().get_end_line(), node.get_source_position().get_end_column())
+                if not node.get_comments():
+                    assert node.pre_comments is ASTNode._no_pre_comments
+                    n_nodes_without_comments += 1
+
+        assert n_nodes_without_comments > 0
+
+    def test_comments(self, asts):
+        r"""Check that comments can be set, cleared and cloned"""
+        node = asts[0].get_model_list()[0].clone()
+        node.pre_comments = ["pre comment"]
+        node.in_comment = "in comment"
+        assert node.get_comments() == ["pre comment", "in comment"]
+        assert node.clone().get_comments() == ["pre comment", "in comment"]
+
+        node.comment = None
+        node.pre_comments = []
+        node.in_comment = None
+        assert node.get_comments() == []
+        assert node._comments is None
+
+    def test_pickle(self, asts):
+        r"""Check that source positions are interned again when an AST is unpickled"""
+        model = pickle.loads(pickle.dumps(asts[0].get_model_list()[0].get_body()))
+        assert model.get_source_position() is ASTSourceLocation.make_ast_source_position(model.get_source_position().get_start_line(), model.get_source_position().get_start_column(), model.get_source_position().get_end_line(), model.get_source_position().get_end_column())
+        assert str(model) == str(asts[0].get_model_list()[0].get_body())
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_parent.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTNodeCollector(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.nodes = []
+
+    def visit(self, node):
+        self.nodes.append(node)
+
+
+def get_nodes(ast):
+    collector = ASTNodeCollector()
+    ast.accept(collector)
+    return collector.nodes
+
+
+def check_parent_links(model):
+    assert model.get_parent() is None
+    for node in get_nodes(model):
+        for child in node.get_children():
+            assert child.get_parent() is node
+
+
+@pytest.fixture(scope="module")
+def models():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    fnames = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, "models", "**", "*.nestml"), recursive=True))
+    return [model for fname in fnames for model in ModelParser.parse_file(fname).get_model_list()]
+
+
+class TestASTParent:
+
+    def test_parent_links(self, models):
+        r"""Check that the parent links are set while parsing and cloning, without running the ASTParentVisitor"""
+        for model in models:
+            check_parent_links(model)
+            clone = model.clone()
+            clone.parent_ = None
+            check_parent_links(clone)
+
+    def test_decorators(self, models):
+        r"""Check that models with namespace decorators, which only occur in compartmental models, can be parsed and cloned"""
+        model = ModelParser.parse_file(os.path.join(os.path.dirname(__file__), "nest_compartmental_tests", "resources", "concmech.nestml")).get_model_list()[0]
+        decorators = [decorator for node in get_nodes(model) if isinstance(node, ASTInlineExpression) for decorator in node.get_decorators()]
+        assert ("mechanism", "channel") in [(decorator.get_namespace(), decorator.get_name()) for decorator in decorators]
+        check_parent_links(model)
+
+        clone = model.clone()
+        check_parent_links(clone)
+        assert str(clone) == str(model)
+
+    def test_mutators(self):
+        r"""Check that children that are added or replaced are linked to their new parent"""
+        source_position = ASTSourceLocation.get_added_source_position()
+        variable = ASTNodeFactory.create_ast_variable("foo", source_position=source_position)
+        simple_expression = ASTNodeFactory.create_ast_simple_expression(variable=variable, source_position=source_position)
+        assert variable.get_parent() is simple_expression
+
+        other_variable = ASTNodeFactory.create_ast_variable("bar", source_position=source_position)
+        simple_expression.set_variable(other_variable)
+        assert other_variable.get_parent() is simple_expression
+
+        # children that already have a parent keep it when they are passed to a constructor
+        other_simple_expression = ASTNodeFactory.create_ast_simple_expression(variable=other_variable, source_position=source_position)
+        assert other_variable.get_parent() is simple_expression
+        other_simple_expression.set_variable(other_variable)
+        assert other_variable.get_parent() is other_simple_expression
+
+    def test_inconsistent_parent_links(self):
+        r"""Check that inconsistent parent links are detected if checking is enabled"""
+        source_position = ASTSourceLocation.get_added_source_position()
+        variable = ASTNodeFactory.create_ast_variable("foo", source_position=source_position)
+        ASTNodeFactory.create_ast_simple_expression(variable=variable, source_position=source_position).set_variable(None)
+
+        check_parent_links_bak = ASTNode.check_parent_links
+        try:
+            ASTNode.check_parent_links = True
+            with pytest.raises(AssertionError):
+                variable.get_parent()
+
+            ASTNode.check_parent_links = False
+            assert variable.get_parent() is not None
+        finally:
+            ASTNode.check_parent_links = check_parent_links_bak
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_structural_hash.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import pickle
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+def get_nodes(ast):
+    nodes = []
+    ast.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+    return nodes
+
+
+@pytest.fixture(scope="module")
+def models():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    fnames = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, "models", "**", "*.nestml"), recursive=True))
+    return [model for fname in fnames for model in ModelParser.parse_file(fname).get_model_list()]
+
+
+class TestASTStructuralHash:
+
+    def test_clones(self, models):
+        r"""Check that each node of a model has the same structural hash as the corresponding node of its clone"""
+        for model in models:
+            for node, cloned_node in zip(get_nodes(model), get_nodes(model.clone())):
+                assert node.structural_hash() == cloned_node.structural_hash()
+
+    def test_equals(self, models, monkeypatch):
+        r"""Check that ``equals()`` gives the same results as without comparing the structural hashes, and that equal nodes have the same structural hash"""
+        for model in models:
+            nodes = [node for node in get_nodes(model) if isinstance(node, (ASTExpression, ASTSimpleExpression, ASTFunctionCall))]
+            results = [[node.equals(other_node) for other_node in nodes] for node in nodes]
+            for node, node_results in zip(nodes, results):
+                for other_node, result in zip(nodes, node_results):
+                    if result:
+                        assert node.structural_hash() == other_node.structural_hash()
+
+            with monkeypatch.context() as m:
+                m.setattr(ASTNode, "structural_hash", lambda self: 0)
+                assert results == [[node.equals(other_node) for other_node in nodes] for node in nodes]
+
+    def test_invalidation(self, models):
+        r"""Check that the structural hashes are computed again after a node has been modified, and after unpickling"""
+        model = models[0].clone()
+        declaration = model.get_state_blocks()[0].get_declarations()[0]
+        other_declaration = declaration.clone()
+        assert declaration.equals(other_declaration)
+
+        other_declaration.get_variables()[0].set_name("foo")
+        assert not declaration.equals(other_declaration)
+        assert declaration.structural_hash() != other_declaration.structural_hash()
+
+        other_declaration.get_variables()[0].set_name(declaration.get_variables()[0].get_name())
+        assert declaration.equals(other_declaration)
+
+        unpickled_declaration = pickle.loads(pickle.dumps(declaration))
+        assert unpickled_declaration._structural_hash[0] is not ASTNode._structural_hash_marker
+        assert unpickled_declaration.structural_hash() == declaration.structural_hash()
+
+    def test_integrate_odes_calls_unique(self, tmp_path, monkeypatch):
+        r"""Check that duplicate ``integrate_odes()`` calls are detected, both with and without the structural hashes"""
+        n_variables = 200
+        fname = os.path.join(tmp_path, "many_integrate_odes_calls_neuron.nestml")
+        with open(fname, "w") as f:
+            f.write("model many_integrate_odes_calls_neuron:\n")
+            f.write("    state:\n")
+            f.write("".join("        x" + str(i) + " real = 0\n" for i in range(n_variables)))
+            f.write("    equations:\n")
+            f.write("".join("        x" + str(i) + "' = -x" + str(i) + " / ms\n" for i in range(n_variables)))
+            f.write("    update:\n")
+            f.write("".join("        integrate_odes(x" + str(i) + ", x" + str((i + 1) % n_variables) + ")\n" for i in range(n_variables)) * 2)
+
+        model = ModelParser.parse_file(fname).get_model_list()[0]
+
+        for use_structural_hash in [False, True]:
+            with monkeypatch.context() as m:
+                if not use_structural_hash:
+                    m.setattr(ASTNode, "structural_hash", lambda self: 0)
+
+                calls = ASTUtils.get_all_integrate_odes_calls_unique(model)
+
+            assert [str(call) for call in calls] == ["integrate_odes(x" + str(i) + ",x" + str((i + 1) % n_variables) + ")" for i in range(n_variables)]
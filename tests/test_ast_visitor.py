@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# test_ast_visitor.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+
+import pytest
+
+from pynestml.codegeneration.printers.constant_printer import ConstantPrinter
+from pynestml.codegeneration.printers.cpp_expression_printer import CppExpressionPrinter
+from pynestml.codegeneration.printers.cpp_simple_expression_printer import CppSimpleExpressionPrinter
+from pynestml.codegeneration.printers.cpp_variable_printer import CppVariablePrinter
+from pynestml.codegeneration.printers.nest_cpp_function_call_printer import NESTCppFunctionCallPrinter
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_external_variable import ASTExternalVariable
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.symbols.real_type_symbol import RealTypeSymbol
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_multi_visitor import ASTMultiVisitor
+from pynestml.visitors.ast_parent_aware_visitor import ASTParentAwareVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class IsinstanceDispatchVisitor(ASTVisitor):
+    r"""Reference visitor that selects handlers through a chain of ``isinstance()`` checks, one per node class"""
+
+    @classmethod
+    def get_suffix(cls, node):
+        for ast_class, suffix in ASTVisitor._dispatch_order:
+            if isinstance(node, ast_class):
+                return suffix
+
+        return None
+
+    def visit(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "visit_" + suffix)(node)
+
+    def traverse(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "traverse_" + suffix)(node)
+
+    def endvisit(self, node):
+        suffix = self.get_suffix(node)
+        if suffix is not None:
+            getattr(self, "endvisit_" + suffix)(node)
+
+
+class VariableNameCollector(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.names = []
+
+    def visit_variable(self, node):
+        self.names.append(node.get_name())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_predefined():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+
+
+@pytest.fixture(scope="module")
+def model():
+    fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "aeif_cond_exp_neuron.nestml"))
+    return ModelParser.parse_file(fname)
+
+
+class TestASTVisitor:
+
+    def test_dispatch_matches_isinstance(self, model):
+        r"""Check that each node is dispatched to the same handlers as by checking the node classes in order"""
+        nodes = []
+        model.accept(ASTHigherOrderVisitor(nodes.append))
+        assert nodes
+
+        for node in nodes:
+            suffix = IsinstanceDispatchVisitor.get_suffix(node)
+            assert ASTVisitor.get_handler_names(type(node)) == ("visit_" + suffix, "traverse_" + suffix, "endvisit_" + suffix)
+
+    def test_subclasses(self):
+        r"""Check that overridden handlers in visitor subclasses are called, and that subclasses of node classes are handled as their base class"""
+        visitor = VariableNameCollector()
+        ASTExternalVariable("foo").accept(visitor)
+        assert visitor.names == ["foo"]
+
+        class UnknownNode(ASTNode):
+            def clone(self):
+                return UnknownNode()
+
+            def get_children(self):
+                return []
+
+            def equals(self, other):
+                return isinstance(other, UnknownNode)
+
+        assert ASTVisitor.get_handler_names(UnknownNode) is None
+        UnknownNode().accept(visitor)
+        assert visitor.names == ["foo"]
+
+    def test_multi_visitor(self, model):
+        r"""Check that visitors that are run together in a single traversal see the same nodes, in the same order, as in separate traversals"""
+        def make_visitors():
+            events = []
+            return events, [ASTHigherOrderVisitor(lambda node: events.append(("visit", node)), lambda node: events.append(("endvisit", node))),
+                            VariableNameCollector()]
+
+        expected_events, expected_visitors = make_visitors()
+        for visitor in expected_visitors:
+            model.accept(visitor)
+
+        events, visitors = make_visitors()
+        model.accept(ASTMultiVisitor(visitors))
+
+        assert events == expected_events
+        assert visitors[1].names == expected_visitors[1].names
+
+        # visitors that customise the traversal cannot be combined
+        assert ASTMultiVisitor.overrides_traversal(ASTParentAwareVisitor())
+        assert not ASTMultiVisitor.overrides_traversal(visitors[0])
+        with pytest.raises(AssertionError):
+            ASTMultiVisitor([ASTParentAwareVisitor()])
+
+    def test_deep_expression(self, tmp_path):
+        r"""Check that an expression that is nested more deeply than the maximum recursion depth of Python, such as a long automatically generated sum, can be parsed, traversed, cloned and printed"""
+        n_terms = sys.getrecursionlimit()
+        fname = os.path.join(tmp_path, "deep_expression_neuron.nestml")
+        with open(fname, "w") as f:
+            f.write("model deep_expression_neuron:\n"
+                    "    state:\n"
+                    "        x real = 0\n\n"
+                    "    parameters:\n"
+                    "        b real = 1\n\n"
+                    "    update:\n"
+                    "        x = " + " + ".join(str(i % 7 + 1) + " * b" for i in range(n_terms)) + "\n")
+
+        deep_model = ModelParser.parse_file(fname)
+        assert not Logger.has_errors(deep_model.get_model_list()[0])
+        expr = deep_model.get_model_list()[0].get_update_blocks()[0].get_stmts_body().get_stmts()[0].small_stmt.get_assignment().get_expression()
+        assert isinstance(expr.type, RealTypeSymbol)
+
+        visitor = VariableNameCollector()
+        expr.accept(visitor)
+        assert visitor.names == n_terms * ["b"]
+        assert len(expr.get_variables()) == n_terms
+
+        nestml_printer = NESTMLPrinter()
+        assert nestml_printer.print(expr.clone()) == nestml_printer.print(expr)
+
+        variable_printer = CppVariablePrinter(None)
+        function_call_printer = NESTCppFunctionCallPrinter(None)
+        cpp_printer = CppExpressionPrinter(CppSimpleExpressionPrinter(variable_printer, ConstantPrinter(), function_call_printer))
+        variable_printer._expression_printer = cpp_printer
+        function_call_printer._expression_printer = cpp_printer
+        assert cpp_printer.print(expr).count("b") == n_terms
@@ -26,6 +26,8 @@ from typing import Optional
 import os
 import pytest
 
+from pynestml.cocos.co_co import CoCo
+from pynestml.cocos.co_cos_manager import CoCosManager
 from pynestml.meta_model.ast_model import ASTModel
 from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.predefined_functions import PredefinedFunctions
@@ -35,6 +37,7 @@ from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
 
 
 class TestCoCos:
@@ -405,6 +408,53 @@ class TestCoCos:
         model = self._parse_and_validate_model(os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), 'invalid')), 'CoCoVectorInputPortSizeAndType.nestml'))
         assert len(Logger.get_all_messages_of_level_and_or_node(model, LoggingLevel.ERROR)) == 1
 
+    def test_check_co_cos_in_single_traversal(self):
+        r"""Check that cocos are checked together in a single traversal, and that a coco is only checked after its dependencies have been checked completely"""
+        fname = os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons")), "iaf_psc_exp_neuron.nestml")
+        model = ModelParser.parse_file(fname).get_model_list()[0]
+        events = []
+
+        class RecordingVisitor(ASTVisitor):
+            def __init__(self, name):
+                super().__init__()
+                self.name = name
+
+            def visit_model(self, node):
+                events.append(("visit", self.name))
+
+            def endvisit_model(self, node):
+                events.append(("endvisit", self.name))
+
+        class CoCoA(CoCo):
+            @classmethod
+            def get_visitor(cls, node):
+                return RecordingVisitor("A")
+
+        class CoCoB(CoCo):
+            @classmethod
+            def get_visitor(cls, node):
+                return RecordingVisitor("B")
+
+        class CoCoC(CoCo):
+            dependencies = [CoCoA]
+
+            @classmethod
+            def get_visitor(cls, node):
+                return RecordingVisitor("C")
+
+        class CoCoD(CoCo):
+            dependencies = [CoCoA]
+
+            @classmethod
+            def check_co_co(cls, node):
+                events.append(("check", "D"))
+
+        CoCosManager.check_co_cos(model, [CoCoA, CoCoC, CoCoD, CoCoB])
+
+        assert events == [("visit", "A"), ("visit", "B"), ("endvisit", "A"), ("endvisit", "B"),
+                          ("check", "D"),
+                          ("visit", "C"), ("endvisit", "C")]
+
     def _parse_and_validate_model(self, fname: str) -> Optional[str]:
         from pynestml.frontend.pynestml_frontend import generate_target
 
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# test_compilation_context.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import concurrent.futures
+import os
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import generate_target, init_predefined
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.ast_mechanism_information_collector import ASTMechanismInformationCollector
+from pynestml.utils.channel_processing import ChannelProcessing
+from pynestml.utils.compilation_context import CompilationContext
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.mechanism_processing import MechanismProcessing
+from pynestml.utils.model_parser import ModelParser
+
+
+class TestCompilationContext:
+    r"""Test that compilations in separate contexts do not interfere with each other"""
+
+    def test_context_scoped_attributes(self):
+        context = CompilationContext()
+        default_codegen_opts = FrontendConfiguration.codegen_opts
+        with context.activate():
+            assert CompilationContext.get_current() is context
+            assert FrontendConfiguration.codegen_opts == {}
+            assert FrontendConfiguration.codegen_opts is not default_codegen_opts
+            FrontendConfiguration.codegen_opts = {"foo": "bar"}
+            assert FrontendConfiguration.get_codegen_opts() == {"foo": "bar"}
+
+        assert CompilationContext.get_current() is CompilationContext.get_default()
+        assert FrontendConfiguration.codegen_opts is default_codegen_opts
+
+        with context.activate():
+            assert FrontendConfiguration.codegen_opts == {"foo": "bar"}
+
+    def test_concurrent_compilation(self):
+        valid_model = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        invalid_model = os.path.realpath(os.path.join(os.path.dirname(__file__), "invalid", "CoCoVariableRedeclared.nestml"))
+        input_paths = [valid_model, invalid_model] * 3
+
+        def validate(input_path):
+            context = CompilationContext()
+            errors_occurred = generate_target(input_path, target_platform="NONE", logging_level="INFO", context=context)
+            with context.activate():
+                messages = [str(message) for _, _, _, _, _, message in Logger.get_log().values()]
+                return errors_occurred, messages, PredefinedTypes.get_types()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(input_paths)) as executor:
+            results = list(executor.map(validate, input_paths))
+
+        for input_path, (errors_occurred, messages, types) in zip(input_paths, results):
+            assert errors_occurred == (input_path == invalid_model)
+            assert any(input_path in message for message in messages)
+            assert not any(other_input_path in message for message in messages for other_input_path in [valid_model, invalid_model] if other_input_path != input_path)
+
+        # each context has its own predefined registries
+        assert results[0][2] is not results[2][2]
+
+    def test_concurrent_compartmental_mechanisms(self):
+        r"""Check that the mechanisms of compartmental models that are processed concurrently are collected in the context of each compilation"""
+        input_paths = [os.path.realpath(os.path.join(os.path.dirname(__file__), "nest_compartmental_tests", "resources", fname)) for fname in ["cm_default.nestml", "concmech.nestml"]]
+
+        def collect_channels(input_path):
+            with CompilationContext().activate():
+                Logger.init_logger(LoggingLevel.ERROR)
+                init_predefined()
+                FrontendConfiguration.target_platform = "NEST_COMPARTMENTAL"
+                FrontendConfiguration.logging_level = "ERROR"
+                neuron = ModelParser.parse_file(input_path).get_model_list()[0]
+                ChannelProcessing.check_co_co(neuron)
+                assert ASTMechanismInformationCollector.neuron is neuron
+                assert list(MechanismProcessing.mechs_info.keys()) == [neuron]
+                return neuron, sorted(ChannelProcessing.get_mechs_info(neuron).keys())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(input_paths)) as executor:
+            results = list(executor.map(collect_channels, input_paths))
+
+        assert [channel_names for _, channel_names in results] == [["K", "Na"], ["Ca_HVA", "Ca_LVAst", "NaTa_t", "SK_E2"]]
+        assert not any(neuron in MechanismProcessing.mechs_info for neuron, _ in results)
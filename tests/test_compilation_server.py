@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# test_compilation_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from pynestml.frontend import pynestml_frontend
+from pynestml.frontend.compilation_server import CompilationServer
+
+
+class TestCompilationServer:
+    r"""Test the long-running compilation server"""
+
+    def test_serve_argument(self, monkeypatch):
+        r"""Check that the command-line application runs the server if ``--serve`` is given, with or without ``=``"""
+        served_args = []
+        monkeypatch.setattr(pynestml_frontend, "serve", lambda args: served_args.append(args) or 0)
+        for args in [["--serve", "/tmp/nestml.sock"], ["--serve=/tmp/nestml.sock"], ["--parse_cache_path", "/tmp/cache", "--serve=/tmp/nestml.sock"]]:
+            monkeypatch.setattr(sys, "argv", ["nestml"] + args)
+            assert pynestml_frontend.main() == 0
+
+        assert served_args == [["--serve", "/tmp/nestml.sock"], ["--serve=/tmp/nestml.sock"], ["--parse_cache_path", "/tmp/cache", "--serve=/tmp/nestml.sock"]]
+
+    def test_compilation_server(self):
+        valid_model = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        invalid_model = os.path.realpath(os.path.join(os.path.dirname(__file__), "invalid", "CoCoVariableRedeclared.nestml"))
+        socket_path = os.path.join(tempfile.mkdtemp(prefix="nestml-server-"), "nestml.sock")
+
+        server = CompilationServer(socket_path)
+        server.warm_up()
+        server_process = multiprocessing.get_context("fork").Process(target=server.serve_forever)
+        server_process.start()
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+
+                time.sleep(.1)
+
+            assert CompilationServer.send_request(socket_path, {"command": "ping"}) == {"status": "ok"}
+            assert CompilationServer.send_request(socket_path, {"command": "foo"})["status"] == "error"
+
+            response = CompilationServer.send_request(socket_path, {"command": "validate", "input_path": invalid_model})
+            assert response["status"] == "ok"
+            assert response["errors_occurred"]
+            assert any(log_entry["severity"] == "ERROR" for log_entry in response["log"])
+
+            # errors from the previous request do not leak into the next one
+            response = CompilationServer.send_request(socket_path, {"command": "validate", "input_path": valid_model, "logging_level": "INFO"})
+            assert response["status"] == "ok"
+            assert not response["errors_occurred"]
+            assert response["log"]
+            assert not any(log_entry["severity"] == "ERROR" for log_entry in response["log"])
+            assert not any(invalid_model in log_entry["message"] for log_entry in response["log"])
+
+            assert CompilationServer.send_request(socket_path, {"command": "shutdown"}) == {"status": "ok"}
+            server_process.join(timeout=10)
+            assert not os.path.exists(socket_path)
+        finally:
+            if server_process.is_alive():
+                server_process.terminate()
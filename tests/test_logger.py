@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# test_logger.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import json
+import os
+import queue
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_target
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.log_sink import JSONLinesLogSink, QueueLogSink
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
+
+
+def scan_messages_of_level_and_or_node(node, level):
+    r"""Reference implementation that scans the whole log"""
+    if level is None and node is None:
+        return Logger.get_log()
+
+    if isinstance(node, str):
+        node_artifact_name = node
+        node = None
+    else:
+        node_artifact_name = None
+
+    ret = list()
+    for (artifactName, node_i, logLevel, code, errorPosition, message) in Logger.get_log().values():
+        if (level == logLevel if level is not None else True) and (node if node is not None else True) and (node_artifact_name == artifactName if node is not None else True):
+            ret.append((node, logLevel, message))
+
+    return ret
+
+
+def make_model(name):
+    source_position = ASTSourceLocation.get_predefined_source_position()
+    return ASTNodeFactory.create_ast_model(name, ASTNodeFactory.create_ast_model_body([], source_position), source_position, name + ".nestml")
+
+
+@pytest.fixture
+def logger():
+    Logger.init_logger(LoggingLevel.NO)
+    yield Logger
+    for sink in Logger.sinks:
+        Logger.remove_sink(sink)
+
+    Logger.set_max_retained_messages(None)
+    Logger.set_current_node(None)
+    Logger.init_logger(LoggingLevel.NO)
+
+
+class TestLogger:
+
+    def test_queries(self, logger):
+        r"""Check that messages retrieved through the indexes are the same as those found by scanning the whole log"""
+        model_a = make_model("model_a")
+        model_b = make_model("model_b")
+        Logger.log_message(None, None, "global message", None, LoggingLevel.INFO)
+        for model in [model_a, model_b]:
+            Logger.set_current_node(model)
+            for level in [LoggingLevel.DEBUG, LoggingLevel.INFO, LoggingLevel.WARNING, LoggingLevel.ERROR]:
+                Logger.log_message(model, None, "message about " + model.get_name(), None, level)
+                Logger.log_message(None, None, "message while processing " + model.get_name(), None, level)
+
+        Logger.set_current_node(None)
+
+        # restore a log with a message that has no artifact name
+        log = dict(Logger.get_log())
+        log[Logger.curr_message] = (None, None, LoggingLevel.ERROR, None, None, "message without artifact")
+        Logger.set_log(log, Logger.curr_message + 1)
+
+        for node in [None, "model_a", model_a, model_b]:
+            for level in [None] + list(LoggingLevel):
+                assert Logger.get_all_messages_of_level_and_or_node(node, level) == scan_messages_of_level_and_or_node(node, level)
+
+            assert Logger.has_errors(node) == (len(scan_messages_of_level_and_or_node(node, LoggingLevel.ERROR)) > 0)
+
+        assert [message for (_, _, message) in Logger.get_all_messages_of_level(LoggingLevel.WARNING)] == ["message about model_a", "message while processing model_a",
+                                                                                                              "message about model_b", "message while processing model_b"]
+        assert [(node, level) for (node, level, _) in Logger.get_all_messages_of_node(model_b)] == [(model_b, level) for level in [LoggingLevel.DEBUG, LoggingLevel.DEBUG, LoggingLevel.INFO, LoggingLevel.INFO,
+                                                                                                                                     LoggingLevel.WARNING, LoggingLevel.WARNING, LoggingLevel.ERROR, LoggingLevel.ERROR]]
+
+    def test_max_retained_messages(self, logger):
+        r"""Check that only the most recent DEBUG and INFO messages are kept when the number of retained messages is limited, while warnings and errors are kept"""
+        Logger.set_max_retained_messages(3)
+        for i in range(10):
+            Logger.log_message(None, None, "info " + str(i), None, LoggingLevel.INFO if i % 2 else LoggingLevel.DEBUG)
+            if i % 4 == 0:
+                Logger.log_message(None, None, "error " + str(i), None, LoggingLevel.ERROR)
+
+        assert [message for (_, _, _, _, _, message) in Logger.get_log().values()] == ["error 0", "error 4", "info 7", "info 8", "error 8", "info 9"]
+        assert len(Logger.get_all_messages_of_level(LoggingLevel.INFO)) == 2
+        assert len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)) == 3
+        assert Logger.has_errors("model_a")
+
+        Logger.set_max_retained_messages(1)
+        assert [message for (_, _, _, _, _, message) in Logger.get_log().values()] == ["error 0", "error 4", "error 8", "info 9"]
+
+    def test_sinks(self, logger):
+        r"""Check that messages are streamed to the attached sinks as they are logged, including those that are no longer retained in the log"""
+        model = make_model("model")
+        Logger.set_current_node(model)
+        Logger.log_message(None, None, "before", None, LoggingLevel.INFO)
+
+        file = io.StringIO()
+        json_lines_sink = JSONLinesLogSink(file)
+        record_queue = queue.Queue()
+        queue_sink = QueueLogSink(record_queue)
+        Logger.add_sink(json_lines_sink, replay_log=True)
+        Logger.add_sink(queue_sink)
+        Logger.set_max_retained_messages(1)
+        for i in range(5):
+            Logger.log_message(model, None, "info " + str(i), None, LoggingLevel.INFO)
+
+        Logger.log_message(None, MessageCode.MODEL_CONTAINS_ERRORS, "a \"quoted\" error", ASTSourceLocation(3, 4, 3, 10), LoggingLevel.ERROR)
+        Logger.remove_sink(queue_sink)
+        Logger.log_message(None, None, "after", None, LoggingLevel.WARNING)
+
+        records = [json.loads(line) for line in file.getvalue().splitlines()]
+        assert [record["message"] for record in records] == ["before"] + ["info " + str(i) for i in range(5)] + ["a \"quoted\" error", "after"]
+        assert records[-2] == {"filename": "model.nestml", "nodeName": "model", "severity": "ERROR", "code": "MODEL_CONTAINS_ERRORS", "row": "3", "col": "4", "message": "a \"quoted\" error"}
+        assert [record_queue.get_nowait() for _ in range(6)] == records[1:-1]
+        assert record_queue.empty()
+
+        # the log retains only the most recent INFO message, the error and the warning
+        assert [record["message"] for record in json.loads(Logger.get_json_format())] == ["info 4", "a 'quoted' error", "after"]
+
+    def test_store_log(self, logger, tmp_path):
+        r"""Check that the messages of a run with ``store_log`` are written to the log file"""
+        fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        target_path = os.path.join(tmp_path, "target")
+        generate_target(input_path=fname, target_platform="NONE", target_path=target_path, logging_level="NO", store_log=True)
+
+        with open(os.path.join(tmp_path, "report", "log.jsonl")) as f:
+            records = [json.loads(line) for line in f]
+
+        assert records
+        assert records == [Logger.get_log_record(log_entry) for log_entry in Logger.get_log().values()]
+        assert not Logger.sinks
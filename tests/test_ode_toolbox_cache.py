@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# test_ode_toolbox_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import time
+
+from pynestml.utils.ode_toolbox_cache import ODEToolboxCache
+
+
+class TestODEToolboxCache:
+    r"""Test the persistent ODE-toolbox results cache"""
+
+    indict = {"dynamics": [{"expression": "V_m' = -V_m / tau_m", "initial_values": {"V_m": "0"}}],
+              "parameters": {"tau_m": "10"},
+              "options": {"output_timestep_symbol": "__h"}}
+
+    solver_result = [{"solver": "analytical",
+                      "state_variables": ["V_m"],
+                      "update_expressions": {"V_m": "V_m * __P__V_m__V_m"},
+                      "propagators": {"__P__V_m__V_m": "exp(-__h / tau_m)"}}]
+
+    def test_key_is_canonical(self):
+        cache = ODEToolboxCache(tempfile.mkdtemp(prefix="nestml-odetoolbox-cache-"))
+
+        reordered_indict = {"options": self.indict["options"],
+                            "parameters": self.indict["parameters"],
+                            "dynamics": self.indict["dynamics"]}
+        assert cache.get_key(self.indict, {"a": 1, "b": 2}) == cache.get_key(reordered_indict, {"b": 2, "a": 1})
+        assert cache.get_key(self.indict, {"disable_analytic_solver": False}) != cache.get_key(self.indict, {"disable_analytic_solver": True})
+
+    def test_hit_and_miss(self):
+        path = tempfile.mkdtemp(prefix="nestml-odetoolbox-cache-")
+        cache = ODEToolboxCache(path)
+        key = cache.get_key(self.indict, {})
+
+        assert cache.get(key) is None
+        cache.put(key, self.solver_result)
+        assert cache.get(key) == self.solver_result
+
+        # a new cache instance on the same directory sees the persisted entry
+        cache2 = ODEToolboxCache(path)
+        assert cache2.get(key) == self.solver_result
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_eviction(self):
+        path = tempfile.mkdtemp(prefix="nestml-odetoolbox-cache-")
+        cache = ODEToolboxCache(path)
+
+        keys = []
+        for i in range(3):
+            indict = dict(self.indict)
+            indict["parameters"] = {"tau_m": str(i)}
+            key = cache.get_key(indict, {})
+            cache.put(key, self.solver_result)
+            os.utime(os.path.join(path, key + ".json"), (time.time() - 100 + i, time.time() - 100 + i))
+            keys.append(key)
+
+        entry_size = os.path.getsize(os.path.join(path, keys[0] + ".json"))
+        cache.max_size = 2 * entry_size
+        cache.evict()
+
+        assert cache.get_statistics()["entries"] == 2
+        assert cache.get(keys[0]) is None    # least recently used entry was evicted
+        assert cache.get(keys[1]) is not None
+        assert cache.get(keys[2]) is not None
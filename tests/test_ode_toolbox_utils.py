@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# test_ode_toolbox_utils.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import threading
+
+import odetoolbox
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.ast_mechanism_information_collector import ASTMechanismInformationCollector
+from pynestml.utils.channel_processing import ChannelProcessing
+from pynestml.utils.compilation_context import CompilationContext
+from pynestml.utils.concentration_processing import ConcentrationProcessing
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.mechanism_processing import MechanismProcessing
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
+
+def get_mechanism_odes(neuron, processing_class):
+    r"""Collect the ODEs of the mechanisms of a given type in a compartmental neuron and analyse them with ODE-toolbox, as ``check_co_co()`` does"""
+    info_collector = ASTMechanismInformationCollector(neuron)
+    mechs_info = info_collector.detect_mechs(processing_class.mechType)
+    mechs_info = info_collector.collect_mechanism_related_definitions(neuron, mechs_info)
+    mechs_info = info_collector.extend_variables_with_initialisations(neuron, mechs_info)
+    mechs_info = processing_class.ode_toolbox_processing(neuron, mechs_info)
+    return [ode_info for mechanism_info in mechs_info.values() for ode_info in mechanism_info["ODEs"].values()]
+
+
+class TestODEToolboxUtils:
+    r"""Test helper functions for interfacing with ODE-toolbox"""
+
+    indict = {"dynamics": [{"expression": "g_ex' = -g_ex / tau_syn", "initial_values": {"g_ex": "0"}},
+                           {"expression": "V_m' = (-(V_m - E_L) - g_ex * (V_m - E_ex)) / tau_m", "initial_values": {"V_m": "E_L"}}],
+              "parameters": {"tau_syn": "2", "tau_m": "10", "E_L": "-70", "E_ex": "0"},
+              "options": {"output_timestep_symbol": "__h"}}
+
+    def test_shared_shapes_results_identical(self):
+        r"""Check that sharing shapes between the analytic and numeric-only analysis does not change the results"""
+        expected_mixed = odetoolbox.analysis(self.indict, disable_stiffness_check=True)
+        expected_numeric = odetoolbox.analysis(self.indict, disable_stiffness_check=True, disable_analytic_solver=True)
+
+        # model has both an analytic and a numeric part
+        assert sorted(x["solver"] for x in expected_mixed) == ["analytical", "numeric"]
+
+        with ODEToolboxUtils.shared_shapes():
+            mixed = odetoolbox.analysis(self.indict, disable_stiffness_check=True)
+            numeric = odetoolbox.analysis(self.indict, disable_stiffness_check=True, disable_analytic_solver=True)
+
+        assert mixed == expected_mixed
+        assert numeric == expected_numeric
+
+    def test_shared_shapes_restores_odetoolbox(self):
+        orig_from_json_to_shapes = getattr(odetoolbox, "_from_json_to_shapes", None)
+        with ODEToolboxUtils.shared_shapes():
+            pass
+
+        assert getattr(odetoolbox, "_from_json_to_shapes", None) is orig_from_json_to_shapes
+
+    def test_shared_shapes_concurrent(self):
+        r"""Check that overlapping contexts in different threads each use their own memo, and that the original function is restored when the last context is left"""
+        orig_from_json_to_shapes = odetoolbox._from_json_to_shapes
+        expected = odetoolbox.analysis(self.indict, disable_stiffness_check=True)
+        entered = threading.Event()
+        leave = threading.Event()
+        memos = []
+
+        def run():
+            with ODEToolboxUtils.shared_shapes():
+                entered.set()
+                leave.wait()
+                assert odetoolbox.analysis(self.indict, disable_stiffness_check=True) == expected
+                memos.append(ODEToolboxUtils._shapes_memo.get())
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        entered.wait()
+        with ODEToolboxUtils.shared_shapes():
+            assert odetoolbox.analysis(self.indict, disable_stiffness_check=True) == expected
+            memos.append(ODEToolboxUtils._shapes_memo.get())
+
+        # the other thread is still within its context
+        assert odetoolbox._from_json_to_shapes is not orig_from_json_to_shapes
+        leave.set()
+        thread.join()
+
+        assert odetoolbox._from_json_to_shapes is orig_from_json_to_shapes
+        assert len(memos) == 2 and memos[0] is not memos[1]
+        assert all(len(memo) == 1 for memo in memos)
+
+    def test_analysis_batch(self):
+        r"""Check that batched analysis returns the same results as sequential calls, and that identical inputs are only analysed once"""
+        indict_numeric = self.indict
+        indict_analytic = {"dynamics": [{"expression": "g_in' = -g_in / tau_syn", "initial_values": {"g_in": "0"}}],
+                           "parameters": {"tau_syn": "2"},
+                           "options": {"output_timestep_symbol": "__h"}}
+        expected = [odetoolbox.analysis(indict, disable_stiffness_check=True) for indict in [indict_numeric, indict_analytic]]
+
+        memo = {}
+        for n_jobs in [1, 2]:
+            memo.clear()
+            results = ODEToolboxUtils.analysis_batch([indict_numeric, indict_analytic, indict_numeric], n_jobs=n_jobs, memo=memo, disable_stiffness_check=True)
+            assert results == [expected[0], expected[1], expected[0]]
+            assert len(memo) == 2
+
+        # results are copies of the memoised results
+        results[0][0]["solver"] = "modified"
+        assert ODEToolboxUtils.analysis_batch([indict_numeric], memo=memo, disable_stiffness_check=True) == [expected[0]]
+
+    def test_mechanism_processing_memo(self):
+        r"""Check that the ODE-toolbox results of the compartmental mechanisms are only memoised within a code generator run, and that the number of worker processes only applies to the run in the current thread"""
+        assert MechanismProcessing._ode_toolbox_results.get() is None
+        with MechanismProcessing.code_generator_run(parallel_jobs=2):
+            memo = MechanismProcessing._ode_toolbox_results.get()
+            with MechanismProcessing.code_generator_run():
+                assert MechanismProcessing._ode_toolbox_results.get() is memo
+                assert MechanismProcessing._parallel_jobs.get() == 1
+
+            assert MechanismProcessing._parallel_jobs.get() == 2
+            parallel_jobs_in_thread = []
+            thread = threading.Thread(target=lambda: parallel_jobs_in_thread.append(MechanismProcessing._parallel_jobs.get()))
+            thread.start()
+            thread.join()
+            assert parallel_jobs_in_thread == [1]
+
+            ODEToolboxUtils.analysis_batch([self.indict], memo=MechanismProcessing._ode_toolbox_results.get(), disable_stiffness_check=True)
+            assert len(memo) == 1
+
+        assert MechanismProcessing._ode_toolbox_results.get() is None
+        assert MechanismProcessing._parallel_jobs.get() == 1
+
+    def test_mechanism_processing(self):
+        r"""Check that the batched and memoised ODE-toolbox results of the mechanisms of a compartmental model are the same as when analysing each ODE separately"""
+        with CompilationContext().activate():
+            Logger.init_logger(LoggingLevel.ERROR)
+            init_predefined()
+            FrontendConfiguration.target_platform = "NEST_COMPARTMENTAL"
+            neuron = ModelParser.parse_file(os.path.join(os.path.dirname(__file__), "nest_compartmental_tests", "resources", "concmech.nestml")).get_model_list()[0]
+
+            for parallel_jobs in [1, 2]:
+                with MechanismProcessing.code_generator_run(parallel_jobs=parallel_jobs):
+                    channel_odes = get_mechanism_odes(neuron, ChannelProcessing)
+                    odes = channel_odes + get_mechanism_odes(neuron, ConcentrationProcessing)
+                    memo = MechanismProcessing._ode_toolbox_results.get()
+                    n_memoised_results = len(memo)
+                    assert len(odes) > 1 and n_memoised_results > 1
+
+                    for ode_info in odes:
+                        assert ode_info["ode_toolbox_output"] == odetoolbox.analysis(ode_info["ode_toolbox_input"], disable_stiffness_check=True)
+
+                    # analysing the same mechanisms again takes the results from the memo
+                    assert [ode_info["ode_toolbox_output"] for ode_info in get_mechanism_odes(neuron, ChannelProcessing)] == [ode_info["ode_toolbox_output"] for ode_info in channel_odes]
+                    assert len(memo) == n_memoised_results
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# test_parallel_code_generation.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+
+from pynestml.codegeneration.parallel_code_generation import ParallelCodeGeneration
+from pynestml.frontend.pynestml_frontend import generate_target
+from pynestml.utils.log_sink import LogSink
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class _Model:
+    def __init__(self, name):
+        self.name = name
+
+    def get_name(self):
+        return self.name
+
+
+class _FileSink(LogSink):
+    r"""Appends each record to a file immediately, so that records written by forked worker processes end up in the file as well"""
+
+    def __init__(self, fname):
+        self.fname = fname
+
+    def write(self, record):
+        with open(self.fname, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def close(self):
+        pass
+
+
+class _CodeGenerator:
+    def analyse_and_generate_models(self, neurons, synapses):
+        for model in neurons + synapses:
+            Logger.log_message(None, None, "Generating code for " + model.get_name(), None, LoggingLevel.INFO)
+
+
+class TestParallelCodeGeneration:
+    r"""Test partitioning of models into groups for parallel code generation"""
+
+    def test_co_generated_model_groups(self):
+        neurons = [_Model("iaf_psc_exp"), _Model("iaf_psc_exp__with_stdp"), _Model("aeif_cond_exp__with_stdp_triplet")]
+        synapses = [_Model("stdp_triplet__with_aeif_cond_exp"), _Model("static"), _Model("stdp__with_iaf_psc_exp")]
+
+        # neuron-synapse pairs
+        synapses[0].paired_neuron = neurons[2]
+        neurons[2].paired_synapse = synapses[0]
+        synapses[2].paired_neuron = neurons[1]
+
+        groups = ParallelCodeGeneration.get_co_generated_model_groups(neurons, synapses)
+        groups = [([neuron.get_name() for neuron in _neurons], [synapse.get_name() for synapse in _synapses]) for _neurons, _synapses in groups]
+
+        assert groups == [(["iaf_psc_exp"], []),
+                          (["iaf_psc_exp__with_stdp"], ["stdp__with_iaf_psc_exp"]),
+                          (["aeif_cond_exp__with_stdp_triplet"], ["stdp_triplet__with_aeif_cond_exp"]),
+                          ([], ["static"])]
+
+    def test_log_sinks(self, tmp_path):
+        r"""Check that the messages of the worker processes are written to the log sinks once, by the calling process"""
+        Logger.init_logger(LoggingLevel.ERROR)
+        sink = _FileSink(tmp_path / "log.jsonl")
+        Logger.add_sink(sink)
+        try:
+            ParallelCodeGeneration.run(_CodeGenerator(), [([_Model("iaf_psc_exp")], []), ([_Model("iaf_psc_alpha")], [_Model("static")])], n_jobs=2)
+        finally:
+            Logger.remove_sink(sink)
+
+        with open(tmp_path / "log.jsonl") as f:
+            messages = [json.loads(line)["message"] for line in f]
+
+        assert messages == ["Generating code for iaf_psc_exp", "Generating code for iaf_psc_alpha", "Generating code for static"]
+
+    def test_parallel_code_generation(self, tmp_path):
+        r"""Check that generating code in several worker processes produces the same files as a sequential run, for a neuron-synapse pair and an unpaired neuron"""
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+        input_path = [os.path.join(models_path, "neurons", "iaf_psc_exp_neuron.nestml"),
+                      os.path.join(models_path, "neurons", "iaf_psc_alpha_neuron.nestml"),
+                      os.path.join(models_path, "synapses", "stdp_synapse.nestml")]
+
+        # the synapse templates of the Python-standalone target are not rendered, but the synapse is still analysed as part of the pair
+        codegen_opts = {"templates": {"path": "resources_python_standalone/point_neuron",
+                                      "model_templates": {"neuron": ["@NEURON_NAME@.py.jinja2"],
+                                                          "synapse": []},
+                                      "module_templates": ["simulator.py.jinja2", "neuron.py.jinja2", "synapse.py.jinja2", "spike_generator.py.jinja2", "utils.py.jinja2"]},
+                        "neuron_synapse_pairs": [{"neuron": "iaf_psc_exp_neuron",
+                                                  "synapse": "stdp_synapse",
+                                                  "post_ports": ["post_spikes"]}],
+                        "delay_variable": {"stdp_synapse": "d"},
+                        "weight_variable": {"stdp_synapse": "w"}}
+
+        generated_files = []
+        for parallel_jobs in [1, 2]:
+            target_path = str(tmp_path / ("parallel_jobs_" + str(parallel_jobs)))
+            generate_target(input_path, target_platform="PYTHON_STANDALONE", target_path=target_path, logging_level="ERROR",
+                            codegen_opts={**codegen_opts, "parallel_jobs": parallel_jobs})
+
+            files = {}
+            for fname in sorted(os.listdir(target_path)):
+                with open(os.path.join(target_path, fname)) as f:
+                    files[fname] = [line for line in f if not "Generated from NESTML at time" in line]
+
+            generated_files.append(files)
+
+        assert "iaf_psc_exp_neuron__with_stdp_synapse.py" in generated_files[0].keys()
+        assert generated_files[0] == generated_files[1]
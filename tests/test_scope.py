@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# test_scope.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import VariableSymbol
+
+
+class TestScope:
+
+    def test_resolution(self):
+        r"""Check that symbols are resolved to the innermost declaration, and to all declarations in order of declaration"""
+        g_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=g_scope)
+        function_scope = Scope(ScopeType.FUNCTION, enclosing_scope=g_scope)
+        g_scope.add_scope(update_scope)
+        g_scope.add_scope(function_scope)
+
+        g_x = VariableSymbol(scope=g_scope, name="x")
+        update_x = VariableSymbol(scope=update_scope, name="x")
+        function_x = VariableSymbol(scope=function_scope, name="x")
+        function_scope.add_symbol(function_x)
+        update_scope.add_symbol(update_x)
+        g_scope.add_symbol(g_x)
+
+        assert update_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is update_x
+        assert update_scope.resolve_to_scope("x", SymbolKind.VARIABLE) is update_scope
+        assert g_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is g_x
+        assert update_scope.resolve_to_symbol("x", SymbolKind.FUNCTION) is None
+        assert update_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) == [g_x, update_x, function_x]
+        assert update_scope.resolve_to_all_scopes("x", SymbolKind.VARIABLE) == [g_scope, update_scope, function_scope]
+        assert g_scope.get_symbols_in_this_scope() == [g_x]
+        assert g_scope.get_scopes() == [update_scope, function_scope]
+
+    def test_mutation(self):
+        r"""Check that cached resolution results are updated when symbols and scopes are added or deleted"""
+        g_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=g_scope)
+        g_scope.add_scope(update_scope)
+
+        g_x = VariableSymbol(scope=g_scope, name="x")
+        update_x = VariableSymbol(scope=update_scope, name="x")
+        g_scope.add_symbol(g_x)
+        assert g_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) is g_x
+
+        update_scope.add_symbol(update_x)
+        assert g_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) == [g_x, update_x]
+
+        g_scope.delete_scope(update_scope)
+        assert g_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) is g_x
+
+        new_g_x = VariableSymbol(scope=g_scope, name="x")
+        g_scope.update_variable_symbol(new_g_x)
+        assert g_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is new_g_x
+        assert g_scope.resolve_to_all_symbols("x", SymbolKind.VARIABLE) is new_g_x
+        assert g_scope.declared_elements == [new_g_x]
+
+        assert g_scope.delete_symbol(new_g_x)
+        assert not g_scope.delete_symbol(new_g_x)
+        assert g_scope.resolve_to_symbol("x", SymbolKind.VARIABLE) is None
+        assert g_scope.resolve_to_all_scopes("x", SymbolKind.VARIABLE) is None
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# test_startup.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+
+import astropy
+
+import pynestml
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.symbols import predefined_units_table
+from pynestml.symbols.predefined_units import PredefinedUnits
+
+
+def get_registered_units():
+    PredefinedUnits.register_units()
+    return [(name, unit.get_name(), id(unit.get_unit())) for name, unit in PredefinedUnits.get_units().items()]
+
+
+def lex(input_stream, atn_simulator_class=None):
+    lexer = PyNestMLLexer(input_stream)
+    if atn_simulator_class is not None:
+        # bypass the ``_interp`` setter, which replaces a plain ``LexerATNSimulator`` by the caching one
+        lexer._atn_simulator = atn_simulator_class(lexer, lexer.atn, lexer.decisionsToDFA, lexer._interp.sharedContextCache)
+
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+
+    return [(token.type, token.channel, token.start, token.stop, token.line, token.column, token.text) for token in stream.tokens]
+
+
+class TestStartup:
+
+    def test_predefined_units_table(self, monkeypatch):
+        r"""Check that the generated table is used if it was generated for the installed astropy version, that astropy is searched for units otherwise, and that the table gives the same units as the search if the versions match"""
+        table_version = predefined_units_table.ASTROPY_VERSION
+        table_is_current = table_version == astropy.__version__
+
+        # table generated for another astropy version: astropy is searched
+        monkeypatch.setattr(predefined_units_table, "ASTROPY_VERSION", "0.0")
+        assert list(PredefinedUnits.get_astropy_unit_attributes()) == PredefinedUnits.find_astropy_unit_attributes()
+        expected = get_registered_units()
+        assert expected
+
+        # table generated for the installed astropy version: the table is used
+        monkeypatch.setattr(predefined_units_table, "ASTROPY_VERSION", astropy.__version__)
+        assert PredefinedUnits.get_astropy_unit_attributes() is predefined_units_table.UNIT_ATTRIBUTES
+        if table_is_current:
+            assert get_registered_units() == expected
+
+        monkeypatch.setattr(predefined_units_table, "ASTROPY_VERSION", table_version)
+        PredefinedUnits.register_units()
+
+    def test_lexer(self):
+        r"""Check that lexing with the cached DFA start states gives the same tokens as with the ANTLR runtime, both with and without whitespace at the start of the input"""
+        fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        with open(fname) as f:
+            model_source = f.read()
+
+        assert type(PyNestMLLexer(InputStream(model_source))._interp) is not LexerATNSimulator
+
+        for input_str in [model_source, "   \n" + model_source]:
+            assert lex(InputStream(input_str)) == lex(InputStream(input_str), LexerATNSimulator)
+
+    def test_startup(self, tmp_path):
+        r"""Check the time to import the frontend and validate a small model in a fresh process, and that the dependencies that are only needed for code generation are not imported"""
+        fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp_neuron.nestml"))
+        script = "import json, sys, time\n" \
+                 "start_time = time.perf_counter()\n" \
+                 "from pynestml.frontend.pynestml_frontend import generate_target\n" \
+                 "import_time = time.perf_counter() - start_time\n" \
+                 "errors_occurred = generate_target(input_path=sys.argv[1], target_platform=\"NONE\", target_path=sys.argv[2], logging_level=\"NO\")\n" \
+                 "print(json.dumps({\"import_time\": import_time, \"total_time\": time.perf_counter() - start_time, \"errors_occurred\": errors_occurred,\n" \
+                 "                  \"modules\": [module for module in [\"sympy\", \"odetoolbox\", \"scipy\"] if module in sys.modules]}))\n"
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([os.path.dirname(os.path.dirname(pynestml.__file__))] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else []))
+        output = subprocess.check_output([sys.executable, "-c", script, fname, os.path.join(tmp_path, "target")], cwd=tmp_path, env=env, stderr=subprocess.DEVNULL)
+        result = json.loads(output.decode().splitlines()[-1])
+
+        assert not result["errors_occurred"]
+        assert result["modules"] == []
+
+        # startup should take well under a second; the threshold is generous to allow for slow machines
+        assert result["total_time"] < 3., "Startup took " + str(result["total_time"]) + " s"
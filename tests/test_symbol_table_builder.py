@@ -34,7 +34,10 @@ from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
@@ -85,3 +88,26 @@ class TestSymbolTableBuilder:
                 SymbolTable.add_model_scope(name=model.get_name(), scope=model.get_scope())
 
             assert isinstance(ast, ASTNestMLCompilationUnit)
+
+    def test_incremental_update(self):
+        r"""Check that the symbol table that is updated in-place by the AST transformations is the same as the one obtained by rebuilding it from scratch"""
+        def get_variable_symbols(model):
+            return [(symbol.get_symbol_name(), symbol.block_type, symbol.variable_type, id(symbol.get_referenced_object()), id(symbol.get_declaring_expression()), id(symbol.get_ode_or_kernel()))
+                    for symbol in model.get_scope().get_symbols_in_this_scope() if isinstance(symbol, VariableSymbol) and not symbol.is_predefined]
+
+        fname = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "aeif_cond_exp_neuron.nestml"))
+        model = ModelParser.parse_file(fname).get_model_list()[0]
+
+        ASTUtils.add_declaration_to_state_block(model, "g_exc__d", "0")
+        ASTUtils.add_declaration_to_internals(model, "__P__V_m__V_m", "exp(-__h / tau_m)")
+        ASTUtils.remove_initial_values_for_kernels(model)
+        ASTUtils.remove_kernel_definitions_from_equations_block(model)
+        ASTUtils.remove_ode_definitions_from_equations_block(model)
+
+        symbols = get_variable_symbols(model)
+        assert "g_exc__d" in [symbol[0] for symbol in symbols]
+        assert "__P__V_m__V_m" in [symbol[0] for symbol in symbols]
+        assert not "g_exc" in [symbol[0] for symbol in symbols]
+
+        model.accept(ASTSymbolTableVisitor())
+        assert symbols == get_variable_symbols(model)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# test_synapse_post_neuron_transformer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_external_variable import ASTExternalVariable
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.transformers.synapse_post_neuron_transformer import SynapsePostNeuronTransformer
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTNodeCollector(ASTVisitor):
+    def __init__(self):
+        super().__init__()
+        self.nodes = []
+
+    def visit(self, node):
+        self.nodes.append(node)
+
+
+def get_nodes(ast):
+    collector = ASTNodeCollector()
+    ast.accept(collector)
+    return collector.nodes
+
+
+def parse_model(kind, name):
+    return ModelParser.parse_file(os.path.join(os.path.dirname(__file__), os.pardir, "models", kind, name + ".nestml")).get_model_list()[0]
+
+
+SYNAPSE_NAMES = ["stdp_synapse", "stdp_nn_symm_synapse", "stdp_triplet_synapse"]
+
+
+@pytest.fixture(scope="module")
+def models():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+    return parse_model("neurons", "iaf_psc_exp_neuron"), [parse_model("synapses", synapse_name) for synapse_name in SYNAPSE_NAMES]
+
+
+@pytest.fixture(scope="module")
+def transformer():
+    return SynapsePostNeuronTransformer({"neuron_synapse_pairs": [{"neuron": "iaf_psc_exp_neuron", "synapse": synapse_name, "post_ports": ["post_spikes"]} for synapse_name in SYNAPSE_NAMES]})
+
+
+class TestSynapsePostNeuronTransformer:
+
+    def test_neuron_unchanged(self, models, transformer):
+        r"""Check that pairing a neuron with several synapses leaves the neuron, including its symbol table, unchanged, and that each new neuron has its own symbol table"""
+        neuron, synapses = models
+        neuron_str = str(neuron)
+        neuron_symbols = neuron.get_scope().get_symbols_in_this_scope()
+        for synapse in synapses:
+            new_neuron, new_synapse = transformer.transform_neuron_synapse_pair_(neuron, synapse)
+            assert str(neuron) == neuron_str
+            assert neuron.get_scope().get_symbols_in_this_scope() == neuron_symbols
+
+            assert new_neuron.get_name() == "iaf_psc_exp_neuron__with_" + synapse.get_name()
+            assert new_neuron.get_scope() is not neuron.get_scope()
+            assert new_neuron._transferred_variables
+            for variable_name in new_neuron._transferred_variables:
+                symbol = new_neuron.get_scope().resolve_to_symbol(variable_name, SymbolKind.VARIABLE)
+                assert symbol is not None
+                assert neuron.get_scope().resolve_to_symbol(variable_name, SymbolKind.VARIABLE) is None
+
+            # the parent links are consistent without running the ``ASTParentVisitor``
+            for model in [new_neuron, new_synapse]:
+                assert model.get_parent() is None
+                for node in get_nodes(model):
+                    for child in node.get_children():
+                        assert child.get_parent() is node
+
+    def test_external_variables(self, models, transformer, monkeypatch):
+        r"""Check that the scope in which the external variables of a new synapse are resolved encloses the scope of the original neuron during the transformation, and is the scope of the new neuron afterwards"""
+        neuron, synapses = models
+        replace_with_external_variable = ASTUtils.replace_with_external_variable
+        neuron_scopes = []
+
+        def replace_with_external_variable_(var_name, node, suffix, new_scope, alternate_name=None):
+            if new_scope is not None:
+                neuron_scopes.append(new_scope)
+                assert new_scope.resolve_to_symbol("V_m", SymbolKind.VARIABLE) is neuron.get_scope().resolve_to_symbol("V_m", SymbolKind.VARIABLE)
+
+            replace_with_external_variable(var_name, node, suffix, new_scope, alternate_name)
+
+        monkeypatch.setattr(ASTUtils, "replace_with_external_variable", replace_with_external_variable_)
+        for synapse in synapses:
+            new_neuron, new_synapse = transformer.transform_neuron_synapse_pair_(neuron, synapse)
+            external_variables = [node for node in get_nodes(new_synapse) if isinstance(node, ASTExternalVariable) and node._altscope is not None]
+            assert external_variables
+            for external_variable in external_variables:
+                assert external_variable.get_scope() is new_neuron.get_scope()
+                assert external_variable.get_scope().resolve_to_symbol(external_variable.get_complete_name(), SymbolKind.VARIABLE) is not None
+
+        assert neuron_scopes
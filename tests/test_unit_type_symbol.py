@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# test_unit_type_symbol.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.utils.compilation_context import CompilationContext
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_predefined():
+    Logger.init_logger(LoggingLevel.ERROR)
+    init_predefined()
+
+
+def clear_memo():
+    UnitTypeSymbol._operation_results.clear()
+    UnitTypeSymbol._conversion_factors.clear()
+
+
+def evaluate_unit_expressions():
+    r"""Evaluate the types of a set of unit expressions, such as those occurring in the ODEs of a conductance-based neuron"""
+    mV = PredefinedTypes.get_type("mV")
+    ms = PredefinedTypes.get_type("ms")
+    nS = PredefinedTypes.get_type("nS")
+    pA = PredefinedTypes.get_type("pA")
+    pF = PredefinedTypes.get_type("pF")
+    return [mV / ms,
+            nS * mV / pF,
+            pA / nS,
+            pA / pF * ms,
+            mV ** 2 / ms,
+            ms ** -1,
+            (mV / ms) / (mV / ms),
+            UnitTypeSymbol.get_conversion_factor(mV.astropy_unit, PredefinedTypes.get_type("V").astropy_unit),
+            UnitTypeSymbol.get_conversion_factor((nS * mV).astropy_unit, pA.astropy_unit),
+            UnitTypeSymbol.get_conversion_factor(ms.astropy_unit, PredefinedTypes.get_type("s").astropy_unit)]
+
+
+def print_results(results):
+    return [result.print_symbol() if hasattr(result, "print_symbol") else result for result in results]
+
+
+class TestUnitTypeSymbol:
+
+    def test_memoised_results(self):
+        r"""Check that memoised unit arithmetic and conversion factors give the same results as computing them with astropy"""
+        clear_memo()
+        expected = print_results(evaluate_unit_expressions())
+        assert UnitTypeSymbol._operation_results and UnitTypeSymbol._conversion_factors
+        assert expected[:7] == ["mV / ms", "mV nS / pF", "pA / nS", "ms pA / pF", "mV2 / ms", "1 / ms", "real"]
+        assert expected[7:] == [0.001, 1.0, 0.001]
+
+        assert print_results(evaluate_unit_expressions()) == expected
+
+        # the resulting types are registered in another compilation context when they are first used there
+        context = CompilationContext()
+        with context.activate():
+            init_predefined()
+            assert PredefinedTypes.get_type("mV nS / pF") is None
+            assert print_results(evaluate_unit_expressions()) == expected
+            assert PredefinedTypes.get_type("mV nS / pF") is not None